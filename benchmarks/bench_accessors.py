@@ -0,0 +1,49 @@
+"""Compare the per-call overhead of the compiled and Python accessors.
+
+Run with ``python benchmarks/bench_accessors.py [--number N]``.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+# Import the package being benchmarked, not an installed one
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import suitesparse_graphblas as gb  # noqa: E402 isort:skip
+from suitesparse_graphblas import lib, matrix, vector  # noqa: E402 isort:skip
+
+
+def per_call(func, args, number, repeat):
+    """Return the fastest time of one call of `func(*args)`, in seconds."""
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    gb.initialize()
+
+    A = matrix.matrix_new(lib.GrB_FP64, 100, 100)
+    matrix.set_fp64(A, 1.5, 3, 4)
+    v = vector.vector_new(lib.GrB_FP64, 100)
+    vector.set_fp64(v, 2.5, 7)
+    cases = [
+        ("matrix_nrows", matrix.matrix_nrows, (A,)),
+        ("matrix_nvals", matrix.matrix_nvals, (A,)),
+        ("matrix.get_fp64", matrix.get_fp64, (A, 3, 4)),
+        ("vector_nvals", vector.vector_nvals, (v,)),
+        ("vector.get_fp64", vector.get_fp64, (v, 7)),
+    ]
+    print(f"{'':20} {'compiled':>10} {'Python':>10}")
+    for name, func, func_args in cases:
+        compiled = per_call(func, func_args, args.number, args.repeat)
+        python = per_call(func.__wrapped__, func_args, args.number, args.repeat)
+        print(f"{name:20} {compiled * 1e9:7.0f} ns {python * 1e9:7.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Measure how partitioned iteration over a matrix scales with threads.
+
+Run with ``python benchmarks/bench_iterate_parallel.py [--nvals N] [--threads 1 2 4 8]``.
+Threads only run the Python loop concurrently with free-threaded Python.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+import suitesparse_graphblas as gb
+from suitesparse_graphblas import iterator, lib, matrix
+
+
+def total(it, start, stop):
+    """Sum the values of the entries in positions `start` to `stop`."""
+    result = 0.0
+    info = iterator.matrix_iterator_seek(it, start)
+    while info == lib.GrB_SUCCESS and iterator.matrix_iterator_getp(it) < stop:
+        result += iterator.iterator_get_fp64(it)
+        info = iterator.matrix_iterator_next(it)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=100_000, help="number of rows and columns")
+    parser.add_argument("--nvals", type=int, default=1_000_000)
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="thread counts"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    gb.initialize()
+
+    rng = np.random.default_rng(0)
+    rows = rng.integers(0, args.n, args.nvals).astype(np.uint64)
+    cols = rng.integers(0, args.n, args.nvals).astype(np.uint64)
+    A = matrix.matrix_new(lib.GrB_FP64, args.n, args.n)
+    matrix.matrix_build(A, rows, cols, rng.random(args.nvals), lib.GrB_PLUS_FP64)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"{args.n} x {args.n} FP64 matrix with {matrix.matrix_nvals(A)} entries; "
+        f"{os.cpu_count()} CPUs; GIL {'enabled' if gil else 'disabled'}"
+    )
+
+    base = None
+    for nthreads in args.threads:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            iterator.matrix_iterate_parallel(A, total, nthreads, max_workers=nthreads)
+            best = min(best, time.perf_counter() - start)
+        base = base or best
+        print(f"{nthreads:3} threads {best * 1e3:10.1f} ms {base / best:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare SciPy conversion with the build/extract_tuples round trip.
+
+Run with ``python benchmarks/bench_scipy.py [--n N] [--density D]``.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import scipy.sparse
+
+import suitesparse_graphblas as gb
+from suitesparse_graphblas import lib, matrix
+
+
+def best_time(func, setup, repeat):
+    """Return the fastest of `repeat` calls of `func(setup())`, timing only `func`."""
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=100_000, help="number of rows and columns")
+    parser.add_argument("--density", type=float, default=1e-4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    gb.initialize()
+
+    n = args.n
+    S = scipy.sparse.random_array((n, n), density=args.density, format="csr", rng=0)
+    S.indptr = S.indptr.astype(np.int64)
+    S.indices = S.indices.astype(np.int64)
+    coo = S.tocoo()
+    rows = coo.row.astype(np.uint64)
+    cols = coo.col.astype(np.uint64)
+    vals = coo.data
+    print(f"{n} x {n} FP64 matrix with {S.nnz} entries")
+
+    def build(_):
+        A = matrix.matrix_new(lib.GrB_FP64, n, n)
+        matrix.matrix_build_fp64(A, rows, cols, vals, vals.size, lib.GrB_PLUS_FP64)
+
+    def extract(A):
+        rows, cols, vals = matrix.matrix_extract_tuples_fp64(A)
+        scipy.sparse.coo_array((vals, (rows, cols)), shape=(n, n)).tocsr()
+
+    def new_matrix():
+        return matrix.matrix_from_scipy(S)
+
+    def take(S):
+        return matrix.matrix_from_scipy(S, take_ownership=True)
+
+    results = [
+        ("to GraphBLAS: matrix_build_fp64", best_time(build, lambda: None, args.repeat)),
+        (
+            "to GraphBLAS: matrix_from_scipy",
+            best_time(take, lambda: S.copy(), args.repeat),
+        ),
+        ("to SciPy: extract_tuples + tocsr", best_time(extract, new_matrix, args.repeat)),
+        ("to SciPy: matrix_to_scipy", best_time(matrix.matrix_to_scipy, new_matrix, args.repeat)),
+    ]
+    for name, seconds in results:
+        print(f"{name:35} {seconds * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
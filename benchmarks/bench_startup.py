@@ -0,0 +1,49 @@
+"""Measure the wall time of ``import suitesparse_graphblas`` and ``initialize()``.
+
+Each measurement runs in a new Python process, as when starting a worker.
+Run with ``python benchmarks/bench_startup.py [--repeat N]``.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Printed by each child process: import time, initialize time, and the
+# time to then build every attribute of lib (as initialize used to).
+CHILD = """
+import time
+start = time.perf_counter()
+import suitesparse_graphblas as gb
+imported = time.perf_counter()
+gb.initialize()
+initialized = time.perf_counter()
+for name in dir(gb.lib):
+    getattr(gb.lib, name)
+print(imported - start, initialized - imported, time.perf_counter() - initialized)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Import the package being benchmarked, not an installed one
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(
+        os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))
+    )
+    times = []
+    for _ in range(args.repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True
+        ).stdout
+        times.append([float(x) for x in out.split()])
+    for name, column in zip(["import", "initialize()", "remaining lib attributes"], zip(*times)):
+        print(f"{name:25} {statistics.median(column) * 1e3:8.2f} ms (median of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
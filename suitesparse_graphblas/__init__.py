@@ -3,7 +3,9 @@
 import importlib.metadata
 import platform
 import struct as _struct
+from importlib import import_module
 
+from . import _lib_types
 from . import exceptions as ex
 from . import utils
 from ._graphblas import ffi, lib
@@ -92,9 +94,22 @@ def initialize(*, blocking=False, memory_manager="numpy"):
         lib.GrB_init(blocking)
     else:
         raise ValueError(f'memory_manager argument must be "numpy" or "c"; got: {memory_manager!r}')
-    # See: https://github.com/GraphBLAS/python-suitesparse-graphblas/issues/40
-    for attr in dir(lib):
-        getattr(lib, attr)
+    _realize_lib_types()
+
+
+def _realize_lib_types():
+    """Make cffi realize the C types of every function and object in `lib`.
+
+    cffi builds attributes of `lib` on first access, realizing the C types
+    they use in a table shared by all threads, which isn't thread-safe
+    (see https://github.com/GraphBLAS/python-suitesparse-graphblas/issues/40).
+    Realizing every type up front, while `initialize` runs, only takes one
+    attribute per distinct type, listed in `_lib_types` by `create_headers.py`;
+    building the other attributes later reuses these types.
+    """
+    for name in _lib_types.TYPE_REPRESENTATIVES:
+        # Names with complex types are missing if built without complex support
+        getattr(lib, name, None)
 
 
 def libget(name):
@@ -175,6 +190,7 @@ _error_code_lookup = {
     # GxB Errors
     lib.GxB_EXHAUSTED: StopIteration,
     lib.GxB_JIT_ERROR: ex.JitError,
+    lib.GxB_OUTPUT_IS_READONLY: ex.OutputIsReadonly,
 }
 GrB_SUCCESS = lib.GrB_SUCCESS
 GrB_NO_VALUE = lib.GrB_NO_VALUE
@@ -226,6 +242,10 @@ def check_status(obj, response_code):
     raise _error_code_lookup[response_code](text)
 
 
+# Used by the compiled accessors in `suitesparse_graphblas.api`
+utils.init_accessors(ffi, lib, check_status)
+
+
 class burble:
     """Control diagnostic output, and may be used as a context manager.
 
@@ -309,12 +329,30 @@ class burble:
 
 burble = burble()
 
-# Backward-compatible re-exports: functional API moved to suitesparse_graphblas.api
-from suitesparse_graphblas.api import iterator, matrix, scalar, vector  # noqa: E402,F401
-from suitesparse_graphblas.api.global_options import (  # noqa: E402,F401
-    global_option_get_char,
-    global_option_get_fp64,
-    global_option_get_int32,
-    global_option_set_fp64,
-    global_option_set_int32,
+# Backward-compatible re-exports: functional API moved to suitesparse_graphblas.api.
+# They are imported on first use, so that importing suitesparse_graphblas stays fast.
+_api_modules = frozenset(["iterator", "matrix", "scalar", "vector"])
+_global_option_functions = frozenset(
+    [
+        "global_option_get_char",
+        "global_option_get_fp64",
+        "global_option_get_int32",
+        "global_option_set_fp64",
+        "global_option_set_int32",
+    ]
 )
+
+
+def __getattr__(name):
+    if name in _api_modules:
+        value = import_module(f"suitesparse_graphblas.api.{name}")
+    elif name in _global_option_functions:
+        value = getattr(import_module("suitesparse_graphblas.api.global_options"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(globals().keys() | _api_modules | _global_option_functions)
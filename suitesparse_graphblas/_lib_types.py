@@ -0,0 +1,718 @@
+# This file is automatically generated by create_headers.py
+"""One attribute of `lib` for each distinct C type of its functions and objects."""
+
+TYPE_REPRESENTATIVES = (
+    "GB_Iterator_attach",
+    "GB_Iterator_rc_bitmap_next",
+    "GB_Iterator_rc_seek",
+    "GrB_ABS_BOOL",
+    "GrB_ALL",
+    "GrB_BAND_INT8",
+    "GrB_BOOL",
+    "GrB_BinaryOp_error",
+    "GrB_BinaryOp_free",
+    "GrB_BinaryOp_get_INT32",
+    "GrB_BinaryOp_get_SIZE",
+    "GrB_BinaryOp_get_Scalar",
+    "GrB_BinaryOp_get_String",
+    "GrB_BinaryOp_get_VOID",
+    "GrB_BinaryOp_new",
+    "GrB_BinaryOp_set_INT32",
+    "GrB_BinaryOp_set_VOID",
+    "GrB_BinaryOp_wait",
+    "GrB_COLGT",
+    "GrB_Col_assign",
+    "GrB_Col_extract",
+    "GrB_DESC_C",
+    "GrB_Descriptor_error",
+    "GrB_Descriptor_free",
+    "GrB_Descriptor_get_INT32",
+    "GrB_Descriptor_get_SIZE",
+    "GrB_Descriptor_get_Scalar",
+    "GrB_Descriptor_get_String",
+    "GrB_Descriptor_get_VOID",
+    "GrB_Descriptor_set",
+    "GrB_Descriptor_set_INT32",
+    "GrB_Descriptor_set_VOID",
+    "GrB_Descriptor_wait",
+    "GrB_GLOBAL",
+    "GrB_Global_get_INT32",
+    "GrB_Global_get_SIZE",
+    "GrB_Global_get_Scalar",
+    "GrB_Global_get_String",
+    "GrB_Global_get_VOID",
+    "GrB_Global_set_INT32",
+    "GrB_Global_set_VOID",
+    "GrB_IndexUnaryOp_error",
+    "GrB_IndexUnaryOp_free",
+    "GrB_IndexUnaryOp_get_INT32",
+    "GrB_IndexUnaryOp_get_SIZE",
+    "GrB_IndexUnaryOp_get_Scalar",
+    "GrB_IndexUnaryOp_get_String",
+    "GrB_IndexUnaryOp_get_VOID",
+    "GrB_IndexUnaryOp_new",
+    "GrB_IndexUnaryOp_set_INT32",
+    "GrB_IndexUnaryOp_set_VOID",
+    "GrB_IndexUnaryOp_wait",
+    "GrB_LAND_LOR_SEMIRING_BOOL",
+    "GrB_LAND_MONOID_BOOL",
+    "GrB_Matrix_apply",
+    "GrB_Matrix_apply_BinaryOp1st_BOOL",
+    "GrB_Matrix_apply_BinaryOp1st_FP32",
+    "GrB_Matrix_apply_BinaryOp1st_FP64",
+    "GrB_Matrix_apply_BinaryOp1st_INT8",
+    "GrB_Matrix_apply_BinaryOp1st_INT16",
+    "GrB_Matrix_apply_BinaryOp1st_INT32",
+    "GrB_Matrix_apply_BinaryOp1st_INT64",
+    "GrB_Matrix_apply_BinaryOp1st_Scalar",
+    "GrB_Matrix_apply_BinaryOp1st_UDT",
+    "GrB_Matrix_apply_BinaryOp1st_UINT8",
+    "GrB_Matrix_apply_BinaryOp1st_UINT16",
+    "GrB_Matrix_apply_BinaryOp1st_UINT32",
+    "GrB_Matrix_apply_BinaryOp1st_UINT64",
+    "GrB_Matrix_apply_BinaryOp2nd_BOOL",
+    "GrB_Matrix_apply_BinaryOp2nd_FP32",
+    "GrB_Matrix_apply_BinaryOp2nd_FP64",
+    "GrB_Matrix_apply_BinaryOp2nd_INT8",
+    "GrB_Matrix_apply_BinaryOp2nd_INT16",
+    "GrB_Matrix_apply_BinaryOp2nd_INT32",
+    "GrB_Matrix_apply_BinaryOp2nd_INT64",
+    "GrB_Matrix_apply_BinaryOp2nd_Scalar",
+    "GrB_Matrix_apply_BinaryOp2nd_UDT",
+    "GrB_Matrix_apply_BinaryOp2nd_UINT8",
+    "GrB_Matrix_apply_BinaryOp2nd_UINT16",
+    "GrB_Matrix_apply_BinaryOp2nd_UINT32",
+    "GrB_Matrix_apply_BinaryOp2nd_UINT64",
+    "GrB_Matrix_apply_IndexOp_BOOL",
+    "GrB_Matrix_apply_IndexOp_FP32",
+    "GrB_Matrix_apply_IndexOp_FP64",
+    "GrB_Matrix_apply_IndexOp_INT8",
+    "GrB_Matrix_apply_IndexOp_INT16",
+    "GrB_Matrix_apply_IndexOp_INT32",
+    "GrB_Matrix_apply_IndexOp_INT64",
+    "GrB_Matrix_apply_IndexOp_Scalar",
+    "GrB_Matrix_apply_IndexOp_UDT",
+    "GrB_Matrix_apply_IndexOp_UINT8",
+    "GrB_Matrix_apply_IndexOp_UINT16",
+    "GrB_Matrix_apply_IndexOp_UINT32",
+    "GrB_Matrix_apply_IndexOp_UINT64",
+    "GrB_Matrix_assign",
+    "GrB_Matrix_assign_BOOL",
+    "GrB_Matrix_assign_FP32",
+    "GrB_Matrix_assign_FP64",
+    "GrB_Matrix_assign_INT8",
+    "GrB_Matrix_assign_INT16",
+    "GrB_Matrix_assign_INT32",
+    "GrB_Matrix_assign_INT64",
+    "GrB_Matrix_assign_Scalar",
+    "GrB_Matrix_assign_UDT",
+    "GrB_Matrix_assign_UINT8",
+    "GrB_Matrix_assign_UINT16",
+    "GrB_Matrix_assign_UINT32",
+    "GrB_Matrix_assign_UINT64",
+    "GrB_Matrix_build_BOOL",
+    "GrB_Matrix_build_FP32",
+    "GrB_Matrix_build_FP64",
+    "GrB_Matrix_build_INT8",
+    "GrB_Matrix_build_INT16",
+    "GrB_Matrix_build_INT32",
+    "GrB_Matrix_build_INT64",
+    "GrB_Matrix_build_UDT",
+    "GrB_Matrix_build_UINT8",
+    "GrB_Matrix_build_UINT16",
+    "GrB_Matrix_build_UINT32",
+    "GrB_Matrix_build_UINT64",
+    "GrB_Matrix_clear",
+    "GrB_Matrix_deserialize",
+    "GrB_Matrix_diag",
+    "GrB_Matrix_dup",
+    "GrB_Matrix_eWiseAdd_BinaryOp",
+    "GrB_Matrix_eWiseAdd_Monoid",
+    "GrB_Matrix_eWiseAdd_Semiring",
+    "GrB_Matrix_error",
+    "GrB_Matrix_exportHint",
+    "GrB_Matrix_exportSize",
+    "GrB_Matrix_export_BOOL",
+    "GrB_Matrix_export_FP32",
+    "GrB_Matrix_export_FP64",
+    "GrB_Matrix_export_INT8",
+    "GrB_Matrix_export_INT16",
+    "GrB_Matrix_export_INT32",
+    "GrB_Matrix_export_INT64",
+    "GrB_Matrix_export_UDT",
+    "GrB_Matrix_export_UINT8",
+    "GrB_Matrix_export_UINT16",
+    "GrB_Matrix_export_UINT32",
+    "GrB_Matrix_export_UINT64",
+    "GrB_Matrix_extractElement_BOOL",
+    "GrB_Matrix_extractElement_FP32",
+    "GrB_Matrix_extractElement_FP64",
+    "GrB_Matrix_extractElement_INT8",
+    "GrB_Matrix_extractElement_INT16",
+    "GrB_Matrix_extractElement_INT32",
+    "GrB_Matrix_extractElement_INT64",
+    "GrB_Matrix_extractElement_Scalar",
+    "GrB_Matrix_extractElement_UDT",
+    "GrB_Matrix_extractElement_UINT8",
+    "GrB_Matrix_extractElement_UINT16",
+    "GrB_Matrix_extractElement_UINT32",
+    "GrB_Matrix_extractElement_UINT64",
+    "GrB_Matrix_extractTuples_BOOL",
+    "GrB_Matrix_extractTuples_FP32",
+    "GrB_Matrix_extractTuples_FP64",
+    "GrB_Matrix_extractTuples_INT8",
+    "GrB_Matrix_extractTuples_INT16",
+    "GrB_Matrix_extractTuples_INT32",
+    "GrB_Matrix_extractTuples_INT64",
+    "GrB_Matrix_extractTuples_UDT",
+    "GrB_Matrix_extractTuples_UINT8",
+    "GrB_Matrix_extractTuples_UINT16",
+    "GrB_Matrix_extractTuples_UINT32",
+    "GrB_Matrix_extractTuples_UINT64",
+    "GrB_Matrix_free",
+    "GrB_Matrix_get_INT32",
+    "GrB_Matrix_get_SIZE",
+    "GrB_Matrix_get_Scalar",
+    "GrB_Matrix_get_String",
+    "GrB_Matrix_get_VOID",
+    "GrB_Matrix_import_BOOL",
+    "GrB_Matrix_import_FP32",
+    "GrB_Matrix_import_FP64",
+    "GrB_Matrix_import_INT8",
+    "GrB_Matrix_import_INT16",
+    "GrB_Matrix_import_INT32",
+    "GrB_Matrix_import_INT64",
+    "GrB_Matrix_import_UDT",
+    "GrB_Matrix_import_UINT8",
+    "GrB_Matrix_import_UINT16",
+    "GrB_Matrix_import_UINT32",
+    "GrB_Matrix_import_UINT64",
+    "GrB_Matrix_ncols",
+    "GrB_Matrix_new",
+    "GrB_Matrix_reduce_BOOL",
+    "GrB_Matrix_reduce_BinaryOp",
+    "GrB_Matrix_reduce_BinaryOp_Scalar",
+    "GrB_Matrix_reduce_FP32",
+    "GrB_Matrix_reduce_FP64",
+    "GrB_Matrix_reduce_INT8",
+    "GrB_Matrix_reduce_INT16",
+    "GrB_Matrix_reduce_INT32",
+    "GrB_Matrix_reduce_INT64",
+    "GrB_Matrix_reduce_Monoid",
+    "GrB_Matrix_reduce_Monoid_Scalar",
+    "GrB_Matrix_reduce_UDT",
+    "GrB_Matrix_reduce_UINT8",
+    "GrB_Matrix_reduce_UINT16",
+    "GrB_Matrix_reduce_UINT32",
+    "GrB_Matrix_reduce_UINT64",
+    "GrB_Matrix_removeElement",
+    "GrB_Matrix_serialize",
+    "GrB_Matrix_serializeSize",
+    "GrB_Matrix_setElement_BOOL",
+    "GrB_Matrix_setElement_FP32",
+    "GrB_Matrix_setElement_FP64",
+    "GrB_Matrix_setElement_INT8",
+    "GrB_Matrix_setElement_INT16",
+    "GrB_Matrix_setElement_INT32",
+    "GrB_Matrix_setElement_INT64",
+    "GrB_Matrix_setElement_Scalar",
+    "GrB_Matrix_setElement_UDT",
+    "GrB_Matrix_setElement_UINT8",
+    "GrB_Matrix_setElement_UINT16",
+    "GrB_Matrix_setElement_UINT32",
+    "GrB_Matrix_setElement_UINT64",
+    "GrB_Matrix_set_INT32",
+    "GrB_Matrix_set_VOID",
+    "GrB_Matrix_wait",
+    "GrB_Monoid_error",
+    "GrB_Monoid_free",
+    "GrB_Monoid_get_INT32",
+    "GrB_Monoid_get_SIZE",
+    "GrB_Monoid_get_Scalar",
+    "GrB_Monoid_get_String",
+    "GrB_Monoid_get_VOID",
+    "GrB_Monoid_new_BOOL",
+    "GrB_Monoid_new_FP32",
+    "GrB_Monoid_new_FP64",
+    "GrB_Monoid_new_INT8",
+    "GrB_Monoid_new_INT16",
+    "GrB_Monoid_new_INT32",
+    "GrB_Monoid_new_INT64",
+    "GrB_Monoid_new_UDT",
+    "GrB_Monoid_new_UINT8",
+    "GrB_Monoid_new_UINT16",
+    "GrB_Monoid_new_UINT32",
+    "GrB_Monoid_new_UINT64",
+    "GrB_Monoid_set_INT32",
+    "GrB_Monoid_set_VOID",
+    "GrB_Monoid_wait",
+    "GrB_Row_assign",
+    "GrB_Scalar_clear",
+    "GrB_Scalar_dup",
+    "GrB_Scalar_error",
+    "GrB_Scalar_extractElement_BOOL",
+    "GrB_Scalar_extractElement_FP32",
+    "GrB_Scalar_extractElement_FP64",
+    "GrB_Scalar_extractElement_INT8",
+    "GrB_Scalar_extractElement_INT16",
+    "GrB_Scalar_extractElement_INT32",
+    "GrB_Scalar_extractElement_INT64",
+    "GrB_Scalar_extractElement_UDT",
+    "GrB_Scalar_extractElement_UINT8",
+    "GrB_Scalar_extractElement_UINT16",
+    "GrB_Scalar_extractElement_UINT32",
+    "GrB_Scalar_extractElement_UINT64",
+    "GrB_Scalar_free",
+    "GrB_Scalar_get_INT32",
+    "GrB_Scalar_get_SIZE",
+    "GrB_Scalar_get_Scalar",
+    "GrB_Scalar_get_String",
+    "GrB_Scalar_get_VOID",
+    "GrB_Scalar_new",
+    "GrB_Scalar_nvals",
+    "GrB_Scalar_setElement_BOOL",
+    "GrB_Scalar_setElement_FP32",
+    "GrB_Scalar_setElement_FP64",
+    "GrB_Scalar_setElement_INT8",
+    "GrB_Scalar_setElement_INT16",
+    "GrB_Scalar_setElement_INT32",
+    "GrB_Scalar_setElement_INT64",
+    "GrB_Scalar_setElement_UDT",
+    "GrB_Scalar_setElement_UINT8",
+    "GrB_Scalar_setElement_UINT16",
+    "GrB_Scalar_setElement_UINT32",
+    "GrB_Scalar_setElement_UINT64",
+    "GrB_Scalar_set_INT32",
+    "GrB_Scalar_set_VOID",
+    "GrB_Scalar_wait",
+    "GrB_Semiring_error",
+    "GrB_Semiring_free",
+    "GrB_Semiring_get_INT32",
+    "GrB_Semiring_get_SIZE",
+    "GrB_Semiring_get_Scalar",
+    "GrB_Semiring_get_String",
+    "GrB_Semiring_get_VOID",
+    "GrB_Semiring_new",
+    "GrB_Semiring_set_INT32",
+    "GrB_Semiring_set_VOID",
+    "GrB_Semiring_wait",
+    "GrB_Type_error",
+    "GrB_Type_free",
+    "GrB_Type_get_INT32",
+    "GrB_Type_get_SIZE",
+    "GrB_Type_get_Scalar",
+    "GrB_Type_get_String",
+    "GrB_Type_get_VOID",
+    "GrB_Type_new",
+    "GrB_Type_set_INT32",
+    "GrB_Type_set_VOID",
+    "GrB_Type_wait",
+    "GrB_UnaryOp_error",
+    "GrB_UnaryOp_free",
+    "GrB_UnaryOp_get_INT32",
+    "GrB_UnaryOp_get_SIZE",
+    "GrB_UnaryOp_get_Scalar",
+    "GrB_UnaryOp_get_String",
+    "GrB_UnaryOp_get_VOID",
+    "GrB_UnaryOp_new",
+    "GrB_UnaryOp_set_INT32",
+    "GrB_UnaryOp_set_VOID",
+    "GrB_UnaryOp_wait",
+    "GrB_Vector_apply",
+    "GrB_Vector_apply_BinaryOp1st_BOOL",
+    "GrB_Vector_apply_BinaryOp1st_FP32",
+    "GrB_Vector_apply_BinaryOp1st_FP64",
+    "GrB_Vector_apply_BinaryOp1st_INT8",
+    "GrB_Vector_apply_BinaryOp1st_INT16",
+    "GrB_Vector_apply_BinaryOp1st_INT32",
+    "GrB_Vector_apply_BinaryOp1st_INT64",
+    "GrB_Vector_apply_BinaryOp1st_Scalar",
+    "GrB_Vector_apply_BinaryOp1st_UDT",
+    "GrB_Vector_apply_BinaryOp1st_UINT8",
+    "GrB_Vector_apply_BinaryOp1st_UINT16",
+    "GrB_Vector_apply_BinaryOp1st_UINT32",
+    "GrB_Vector_apply_BinaryOp1st_UINT64",
+    "GrB_Vector_apply_BinaryOp2nd_BOOL",
+    "GrB_Vector_apply_BinaryOp2nd_FP32",
+    "GrB_Vector_apply_BinaryOp2nd_FP64",
+    "GrB_Vector_apply_BinaryOp2nd_INT8",
+    "GrB_Vector_apply_BinaryOp2nd_INT16",
+    "GrB_Vector_apply_BinaryOp2nd_INT32",
+    "GrB_Vector_apply_BinaryOp2nd_INT64",
+    "GrB_Vector_apply_BinaryOp2nd_Scalar",
+    "GrB_Vector_apply_BinaryOp2nd_UDT",
+    "GrB_Vector_apply_BinaryOp2nd_UINT8",
+    "GrB_Vector_apply_BinaryOp2nd_UINT16",
+    "GrB_Vector_apply_BinaryOp2nd_UINT32",
+    "GrB_Vector_apply_BinaryOp2nd_UINT64",
+    "GrB_Vector_apply_IndexOp_BOOL",
+    "GrB_Vector_apply_IndexOp_FP32",
+    "GrB_Vector_apply_IndexOp_FP64",
+    "GrB_Vector_apply_IndexOp_INT8",
+    "GrB_Vector_apply_IndexOp_INT16",
+    "GrB_Vector_apply_IndexOp_INT32",
+    "GrB_Vector_apply_IndexOp_INT64",
+    "GrB_Vector_apply_IndexOp_Scalar",
+    "GrB_Vector_apply_IndexOp_UDT",
+    "GrB_Vector_apply_IndexOp_UINT8",
+    "GrB_Vector_apply_IndexOp_UINT16",
+    "GrB_Vector_apply_IndexOp_UINT32",
+    "GrB_Vector_apply_IndexOp_UINT64",
+    "GrB_Vector_assign",
+    "GrB_Vector_assign_BOOL",
+    "GrB_Vector_assign_FP32",
+    "GrB_Vector_assign_FP64",
+    "GrB_Vector_assign_INT8",
+    "GrB_Vector_assign_INT16",
+    "GrB_Vector_assign_INT32",
+    "GrB_Vector_assign_INT64",
+    "GrB_Vector_assign_Scalar",
+    "GrB_Vector_assign_UDT",
+    "GrB_Vector_assign_UINT8",
+    "GrB_Vector_assign_UINT16",
+    "GrB_Vector_assign_UINT32",
+    "GrB_Vector_assign_UINT64",
+    "GrB_Vector_build_BOOL",
+    "GrB_Vector_build_FP32",
+    "GrB_Vector_build_FP64",
+    "GrB_Vector_build_INT8",
+    "GrB_Vector_build_INT16",
+    "GrB_Vector_build_INT32",
+    "GrB_Vector_build_INT64",
+    "GrB_Vector_build_UDT",
+    "GrB_Vector_build_UINT8",
+    "GrB_Vector_build_UINT16",
+    "GrB_Vector_build_UINT32",
+    "GrB_Vector_build_UINT64",
+    "GrB_Vector_clear",
+    "GrB_Vector_dup",
+    "GrB_Vector_eWiseAdd_BinaryOp",
+    "GrB_Vector_eWiseAdd_Monoid",
+    "GrB_Vector_eWiseAdd_Semiring",
+    "GrB_Vector_error",
+    "GrB_Vector_extractElement_BOOL",
+    "GrB_Vector_extractElement_FP32",
+    "GrB_Vector_extractElement_FP64",
+    "GrB_Vector_extractElement_INT8",
+    "GrB_Vector_extractElement_INT16",
+    "GrB_Vector_extractElement_INT32",
+    "GrB_Vector_extractElement_INT64",
+    "GrB_Vector_extractElement_Scalar",
+    "GrB_Vector_extractElement_UDT",
+    "GrB_Vector_extractElement_UINT8",
+    "GrB_Vector_extractElement_UINT16",
+    "GrB_Vector_extractElement_UINT32",
+    "GrB_Vector_extractElement_UINT64",
+    "GrB_Vector_extractTuples_BOOL",
+    "GrB_Vector_extractTuples_FP32",
+    "GrB_Vector_extractTuples_FP64",
+    "GrB_Vector_extractTuples_INT8",
+    "GrB_Vector_extractTuples_INT16",
+    "GrB_Vector_extractTuples_INT32",
+    "GrB_Vector_extractTuples_INT64",
+    "GrB_Vector_extractTuples_UDT",
+    "GrB_Vector_extractTuples_UINT8",
+    "GrB_Vector_extractTuples_UINT16",
+    "GrB_Vector_extractTuples_UINT32",
+    "GrB_Vector_extractTuples_UINT64",
+    "GrB_Vector_free",
+    "GrB_Vector_get_INT32",
+    "GrB_Vector_get_SIZE",
+    "GrB_Vector_get_Scalar",
+    "GrB_Vector_get_String",
+    "GrB_Vector_get_VOID",
+    "GrB_Vector_new",
+    "GrB_Vector_nvals",
+    "GrB_Vector_reduce_BOOL",
+    "GrB_Vector_reduce_BinaryOp_Scalar",
+    "GrB_Vector_reduce_FP32",
+    "GrB_Vector_reduce_FP64",
+    "GrB_Vector_reduce_INT8",
+    "GrB_Vector_reduce_INT16",
+    "GrB_Vector_reduce_INT32",
+    "GrB_Vector_reduce_INT64",
+    "GrB_Vector_reduce_Monoid_Scalar",
+    "GrB_Vector_reduce_UDT",
+    "GrB_Vector_reduce_UINT8",
+    "GrB_Vector_reduce_UINT16",
+    "GrB_Vector_reduce_UINT32",
+    "GrB_Vector_reduce_UINT64",
+    "GrB_Vector_removeElement",
+    "GrB_Vector_setElement_BOOL",
+    "GrB_Vector_setElement_FP32",
+    "GrB_Vector_setElement_FP64",
+    "GrB_Vector_setElement_INT8",
+    "GrB_Vector_setElement_INT16",
+    "GrB_Vector_setElement_INT32",
+    "GrB_Vector_setElement_INT64",
+    "GrB_Vector_setElement_Scalar",
+    "GrB_Vector_setElement_UDT",
+    "GrB_Vector_setElement_UINT8",
+    "GrB_Vector_setElement_UINT16",
+    "GrB_Vector_setElement_UINT32",
+    "GrB_Vector_setElement_UINT64",
+    "GrB_Vector_set_INT32",
+    "GrB_Vector_set_VOID",
+    "GrB_Vector_wait",
+    "GrB_finalize",
+    "GrB_getVersion",
+    "GrB_init",
+    "GrB_mxv",
+    "GrB_transpose",
+    "GrB_vxm",
+    "GxB_ALWAYS_HYPER",
+    "GxB_BinaryOp_fprint",
+    "GxB_BinaryOp_new",
+    "GxB_BinaryOp_new_IndexOp",
+    "GxB_BinaryOp_xtype",
+    "GxB_BinaryOp_xtype_name",
+    "GxB_CONTEXT_WORLD",
+    "GxB_Col_assign_Vector",
+    "GxB_Col_extract_Vector",
+    "GxB_Container_free",
+    "GxB_Context_disengage",
+    "GxB_Context_error",
+    "GxB_Context_fprint",
+    "GxB_Context_free",
+    "GxB_Context_get",
+    "GxB_Context_get_FP64",
+    "GxB_Context_get_INT",
+    "GxB_Context_get_INT32",
+    "GxB_Context_get_SIZE",
+    "GxB_Context_get_Scalar",
+    "GxB_Context_get_String",
+    "GxB_Context_get_VOID",
+    "GxB_Context_set_FP64",
+    "GxB_Context_set_INT",
+    "GxB_Context_set_INT32",
+    "GxB_Context_set_VOID",
+    "GxB_Context_wait",
+    "GxB_DIAG",
+    "GxB_Desc_get",
+    "GxB_Desc_get_FP64",
+    "GxB_Desc_get_INT32",
+    "GxB_Desc_set_FP64",
+    "GxB_Desc_set_INT32",
+    "GxB_Descriptor_fprint",
+    "GxB_Descriptor_get",
+    "GxB_FORMAT_DEFAULT",
+    "GxB_Global_Option_get",
+    "GxB_Global_Option_get_CHAR",
+    "GxB_Global_Option_get_FP64",
+    "GxB_Global_Option_get_FUNCTION",
+    "GxB_Global_Option_get_INT32",
+    "GxB_Global_Option_get_INT64",
+    "GxB_Global_Option_set_CHAR",
+    "GxB_Global_Option_set_FP64",
+    "GxB_Global_Option_set_FUNCTION",
+    "GxB_Global_Option_set_INT32",
+    "GxB_IMPLEMENTATION_ABOUT_STR",
+    "GxB_IndexBinaryOp_error",
+    "GxB_IndexBinaryOp_fprint",
+    "GxB_IndexBinaryOp_free",
+    "GxB_IndexBinaryOp_get_INT32",
+    "GxB_IndexBinaryOp_get_SIZE",
+    "GxB_IndexBinaryOp_get_Scalar",
+    "GxB_IndexBinaryOp_get_String",
+    "GxB_IndexBinaryOp_get_VOID",
+    "GxB_IndexBinaryOp_new",
+    "GxB_IndexBinaryOp_set_INT32",
+    "GxB_IndexBinaryOp_set_VOID",
+    "GxB_IndexBinaryOp_wait",
+    "GxB_IndexUnaryOp_fprint",
+    "GxB_IndexUnaryOp_new",
+    "GxB_IndexUnaryOp_xtype_name",
+    "GxB_Iterator_free",
+    "GxB_Iterator_get_BOOL",
+    "GxB_Iterator_get_FC32",
+    "GxB_Iterator_get_FC64",
+    "GxB_Iterator_get_FP32",
+    "GxB_Iterator_get_FP64",
+    "GxB_Iterator_get_INT8",
+    "GxB_Iterator_get_INT16",
+    "GxB_Iterator_get_INT32",
+    "GxB_Iterator_get_INT64",
+    "GxB_Iterator_get_UDT",
+    "GxB_Iterator_get_UINT8",
+    "GxB_Iterator_get_UINT16",
+    "GxB_Iterator_get_UINT32",
+    "GxB_Iterator_get_UINT64",
+    "GxB_Matrix_Iterator_attach",
+    "GxB_Matrix_Iterator_getIndex",
+    "GxB_Matrix_Iterator_getp",
+    "GxB_Matrix_Iterator_seek",
+    "GxB_Matrix_Option_get",
+    "GxB_Matrix_Option_get_FP64",
+    "GxB_Matrix_Option_get_INT32",
+    "GxB_Matrix_Option_set_FP64",
+    "GxB_Matrix_Option_set_INT32",
+    "GxB_Matrix_apply_BinaryOp1st_FC32",
+    "GxB_Matrix_apply_BinaryOp1st_FC64",
+    "GxB_Matrix_apply_BinaryOp2nd_FC32",
+    "GxB_Matrix_apply_BinaryOp2nd_FC64",
+    "GxB_Matrix_apply_IndexOp_FC32",
+    "GxB_Matrix_apply_IndexOp_FC64",
+    "GxB_Matrix_assign_FC32",
+    "GxB_Matrix_assign_FC64",
+    "GxB_Matrix_assign_Scalar_Vector",
+    "GxB_Matrix_assign_Vector",
+    "GxB_Matrix_build_FC32",
+    "GxB_Matrix_build_FC64",
+    "GxB_Matrix_build_Scalar",
+    "GxB_Matrix_build_Scalar_Vector",
+    "GxB_Matrix_build_Vector",
+    "GxB_Matrix_concat",
+    "GxB_Matrix_deserialize",
+    "GxB_Matrix_diag",
+    "GxB_Matrix_eWiseUnion",
+    "GxB_Matrix_export_BitmapC",
+    "GxB_Matrix_export_CSC",
+    "GxB_Matrix_export_FC32",
+    "GxB_Matrix_export_FC64",
+    "GxB_Matrix_export_FullC",
+    "GxB_Matrix_export_HyperCSC",
+    "GxB_Matrix_extractElement_FC32",
+    "GxB_Matrix_extractElement_FC64",
+    "GxB_Matrix_extractTuples_FC32",
+    "GxB_Matrix_extractTuples_FC64",
+    "GxB_Matrix_extractTuples_Vector",
+    "GxB_Matrix_fprint",
+    "GxB_Matrix_import_BitmapC",
+    "GxB_Matrix_import_CSC",
+    "GxB_Matrix_import_FC32",
+    "GxB_Matrix_import_FC64",
+    "GxB_Matrix_import_FullC",
+    "GxB_Matrix_import_HyperCSC",
+    "GxB_Matrix_isStoredElement",
+    "GxB_Matrix_iso",
+    "GxB_Matrix_memoryUsage",
+    "GxB_Matrix_pack_BitmapC",
+    "GxB_Matrix_pack_CSC",
+    "GxB_Matrix_pack_FullC",
+    "GxB_Matrix_pack_HyperCSC",
+    "GxB_Matrix_reduce_FC32",
+    "GxB_Matrix_reduce_FC64",
+    "GxB_Matrix_reshape",
+    "GxB_Matrix_reshapeDup",
+    "GxB_Matrix_select",
+    "GxB_Matrix_serialize",
+    "GxB_Matrix_setElement_FC32",
+    "GxB_Matrix_setElement_FC64",
+    "GxB_Matrix_sort",
+    "GxB_Matrix_split",
+    "GxB_Matrix_type",
+    "GxB_Matrix_type_name",
+    "GxB_Matrix_unpack_BitmapC",
+    "GxB_Matrix_unpack_CSC",
+    "GxB_Matrix_unpack_FullC",
+    "GxB_Matrix_unpack_HyperCSC",
+    "GxB_Monoid_fprint",
+    "GxB_Monoid_identity",
+    "GxB_Monoid_new_FC32",
+    "GxB_Monoid_new_FC64",
+    "GxB_Monoid_operator",
+    "GxB_Monoid_terminal",
+    "GxB_Monoid_terminal_new_BOOL",
+    "GxB_Monoid_terminal_new_FC32",
+    "GxB_Monoid_terminal_new_FC64",
+    "GxB_Monoid_terminal_new_FP32",
+    "GxB_Monoid_terminal_new_FP64",
+    "GxB_Monoid_terminal_new_INT8",
+    "GxB_Monoid_terminal_new_INT16",
+    "GxB_Monoid_terminal_new_INT32",
+    "GxB_Monoid_terminal_new_INT64",
+    "GxB_Monoid_terminal_new_UDT",
+    "GxB_Monoid_terminal_new_UINT8",
+    "GxB_Monoid_terminal_new_UINT16",
+    "GxB_Monoid_terminal_new_UINT32",
+    "GxB_Monoid_terminal_new_UINT64",
+    "GxB_Row_assign_Vector",
+    "GxB_Scalar_extractElement_FC32",
+    "GxB_Scalar_extractElement_FC64",
+    "GxB_Scalar_fprint",
+    "GxB_Scalar_memoryUsage",
+    "GxB_Scalar_setElement_FC32",
+    "GxB_Scalar_setElement_FC64",
+    "GxB_Scalar_type",
+    "GxB_Scalar_type_name",
+    "GxB_SelectOp_fprint",
+    "GxB_SelectOp_ttype",
+    "GxB_Semiring_add",
+    "GxB_Semiring_fprint",
+    "GxB_Semiring_multiply",
+    "GxB_Serialized_get_INT32",
+    "GxB_Serialized_get_SIZE",
+    "GxB_Serialized_get_Scalar",
+    "GxB_Serialized_get_String",
+    "GxB_Serialized_get_VOID",
+    "GxB_Type_fprint",
+    "GxB_Type_from_name",
+    "GxB_Type_name",
+    "GxB_Type_new",
+    "GxB_Type_size",
+    "GxB_UnaryOp_fprint",
+    "GxB_UnaryOp_new",
+    "GxB_UnaryOp_xtype",
+    "GxB_UnaryOp_xtype_name",
+    "GxB_Vector_Iterator_attach",
+    "GxB_Vector_Option_get",
+    "GxB_Vector_Option_get_FP64",
+    "GxB_Vector_Option_get_INT32",
+    "GxB_Vector_Option_set_FP64",
+    "GxB_Vector_Option_set_INT32",
+    "GxB_Vector_apply_BinaryOp1st_FC32",
+    "GxB_Vector_apply_BinaryOp1st_FC64",
+    "GxB_Vector_apply_BinaryOp2nd_FC32",
+    "GxB_Vector_apply_BinaryOp2nd_FC64",
+    "GxB_Vector_apply_IndexOp_FC32",
+    "GxB_Vector_apply_IndexOp_FC64",
+    "GxB_Vector_assign_FC32",
+    "GxB_Vector_assign_FC64",
+    "GxB_Vector_assign_Scalar_Vector",
+    "GxB_Vector_assign_Vector",
+    "GxB_Vector_build_FC32",
+    "GxB_Vector_build_FC64",
+    "GxB_Vector_build_Scalar",
+    "GxB_Vector_build_Scalar_Vector",
+    "GxB_Vector_build_Vector",
+    "GxB_Vector_deserialize",
+    "GxB_Vector_diag",
+    "GxB_Vector_eWiseUnion",
+    "GxB_Vector_export_Bitmap",
+    "GxB_Vector_export_CSC",
+    "GxB_Vector_export_Full",
+    "GxB_Vector_extractElement_FC32",
+    "GxB_Vector_extractElement_FC64",
+    "GxB_Vector_extractTuples_FC32",
+    "GxB_Vector_extractTuples_FC64",
+    "GxB_Vector_extractTuples_Vector",
+    "GxB_Vector_fprint",
+    "GxB_Vector_import_Bitmap",
+    "GxB_Vector_import_CSC",
+    "GxB_Vector_import_Full",
+    "GxB_Vector_isStoredElement",
+    "GxB_Vector_iso",
+    "GxB_Vector_load",
+    "GxB_Vector_memoryUsage",
+    "GxB_Vector_pack_Bitmap",
+    "GxB_Vector_pack_CSC",
+    "GxB_Vector_pack_Full",
+    "GxB_Vector_reduce_FC32",
+    "GxB_Vector_reduce_FC64",
+    "GxB_Vector_select",
+    "GxB_Vector_serialize",
+    "GxB_Vector_setElement_FC32",
+    "GxB_Vector_setElement_FC64",
+    "GxB_Vector_sort",
+    "GxB_Vector_type",
+    "GxB_Vector_type_name",
+    "GxB_Vector_unload",
+    "GxB_Vector_unpack_Bitmap",
+    "GxB_Vector_unpack_CSC",
+    "GxB_Vector_unpack_Full",
+    "GxB_deserialize_type_name",
+    "GxB_init",
+    "GxB_load_Matrix_from_Container",
+    "GxB_load_Vector_from_Container",
+    "GxB_pack_HyperHash",
+)
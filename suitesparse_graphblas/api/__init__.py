@@ -20,22 +20,38 @@ of these functions in detail, read the [SuiteSparse:GraphBLAS User
 Guide](https://github.com/DrTimothyAldenDavis/GraphBLAS/blob/stable/Doc/GraphBLAS_UserGuide.pdf)
 
 """
-from suitesparse_graphblas.api import (
-    binaryop,
-    container,
-    context,
-    descriptor,
-    global_options,
-    grb_type,
-    indexbinaryop,
-    indexunaryop,
-    iterator,
-    matrix,
-    monoid,
-    scalar,
-    semiring,
-    selectop,
-    unaryop,
-    vector,
+from importlib import import_module
+
+# Submodules are imported on first use, so that using one doesn't import them all
+_submodules = frozenset(
+    [
+        "binaryop",
+        "container",
+        "context",
+        "descriptor",
+        "global_options",
+        "grb_type",
+        "indexbinaryop",
+        "indexunaryop",
+        "io",
+        "iterator",
+        "matrix",
+        "monoid",
+        "scalar",
+        "semiring",
+        "selectop",
+        "unaryop",
+        "vector",
+    ]
 )
-from suitesparse_graphblas.api import io  # noqa: F401
+
+
+def __getattr__(name):
+    if name in _submodules:
+        # Importing a submodule also sets it as an attribute of this package
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(globals().keys() | _submodules)
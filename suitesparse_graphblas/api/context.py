@@ -1,7 +1,13 @@
+import threading
+
 from suitesparse_graphblas import check_status, ffi, lib
 
 from .utils import _capture_c_output  # noqa: F401
 
+# The context engaged by `context_engage` in each thread, since GraphBLAS
+# has no call that returns it.
+_engaged = threading.local()
+
 
 def context_free(ctx):
     """Free a context.
@@ -59,6 +65,7 @@ def context_engage(ctx):
 
     """
     check_status(ctx, lib.GxB_Context_engage(ctx[0]))
+    _engaged.ctx = ctx
 
 
 def context_disengage(ctx):
@@ -73,6 +80,25 @@ def context_disengage(ctx):
 
     """
     check_status(ctx, lib.GxB_Context_disengage(ctx[0]))
+    _engaged.ctx = None
+
+
+def context_engaged():
+    """Return the context engaged by `context_engage` in the calling thread.
+
+    Returns None if no context is engaged.  Contexts engaged by calling
+    `lib.GxB_Context_engage` directly are not seen.
+
+    >>> ctx = context_new()
+    >>> context_engage(ctx)
+    >>> context_engaged() is ctx
+    True
+    >>> context_disengage(ctx)
+    >>> context_engaged() is None
+    True
+
+    """
+    return getattr(_engaged, "ctx", None)
 
 
 # ---------------------------------------------------------------------------
@@ -1,4 +1,6 @@
-from suitesparse_graphblas import check_status, ffi, lib
+import numpy as np
+
+from suitesparse_graphblas import check_status, ffi, lib, supports_complex
 
 from .utils import _capture_c_output  # noqa: F401
 
@@ -196,3 +198,55 @@ def grb_type_from_name(type_name):
     T = ffi.new("GrB_Type*")
     check_status(T, lib.GxB_Type_from_name(T, type_name.encode()))
     return T[0]
+
+
+# ---------------------------------------------------------------------------
+# NumPy dtypes
+# ---------------------------------------------------------------------------
+
+_dtypes = {
+    lib.GrB_BOOL: np.dtype(np.bool_),
+    lib.GrB_INT8: np.dtype(np.int8),
+    lib.GrB_INT16: np.dtype(np.int16),
+    lib.GrB_INT32: np.dtype(np.int32),
+    lib.GrB_INT64: np.dtype(np.int64),
+    lib.GrB_UINT8: np.dtype(np.uint8),
+    lib.GrB_UINT16: np.dtype(np.uint16),
+    lib.GrB_UINT32: np.dtype(np.uint32),
+    lib.GrB_UINT64: np.dtype(np.uint64),
+    lib.GrB_FP32: np.dtype(np.float32),
+    lib.GrB_FP64: np.dtype(np.float64),
+}
+
+if supports_complex():
+    _dtypes[lib.GxB_FC32] = np.dtype(np.complex64)
+    _dtypes[lib.GxB_FC64] = np.dtype(np.complex128)
+
+_grb_types = {dtype: T for T, dtype in _dtypes.items()}
+
+
+def grb_type_to_dtype(T):
+    """Return the NumPy dtype of a built-in type.
+
+    >>> grb_type_to_dtype(lib.GrB_FP32)
+    dtype('float32')
+
+    """
+    try:
+        return _dtypes[T]
+    except KeyError:
+        raise TypeError("Only built-in types have a NumPy dtype") from None
+
+
+def grb_type_from_dtype(dtype):
+    """Return the built-in type of a NumPy dtype.
+
+    >>> grb_type_from_dtype(np.dtype(np.int16)) == lib.GrB_INT16
+    True
+
+    """
+    dtype = np.dtype(dtype)
+    try:
+        return _grb_types[dtype]
+    except KeyError:
+        raise TypeError(f"No GraphBLAS type for dtype {dtype}") from None
@@ -0,0 +1,150 @@
+"""Store many serialized matrices and vectors in one file.
+
+An archive is a sequence of serialized objects (see `serialize_matrix`)
+followed by an index of their names and offsets, so that members can be
+read without scanning the rest of the file::
+
+    magic | blob | padding | blob | ... | index (JSON) | index offset | index size | magic
+
+The reader memory-maps the file and deserializes only the requested
+members, in parallel.
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from suitesparse_graphblas import ffi, lib
+from suitesparse_graphblas.api.io import serialize
+
+ARCHIVE_MAGIC = b"GrBArch1"
+
+# Blobs start at multiples of this many bytes
+_ALIGN = 8
+
+# index offset, index size, magic
+_trailer = struct.Struct("<QQ8s")
+
+ArchiveMember = namedtuple("ArchiveMember", ["kind", "offset", "size"])
+
+_matrix_ptr = ffi.typeof("GrB_Matrix*")
+_vector_ptr = ffi.typeof("GrB_Vector*")
+
+
+def _member_kind(obj):
+    typ = ffi.typeof(obj)
+    if typ is _matrix_ptr:
+        return "matrix"
+    if typ is _vector_ptr:
+        return "vector"
+    raise TypeError(f"Archive members must be GrB_Matrix* or GrB_Vector*; got {typ.cname}")
+
+
+def archive_write(
+    file, members, compression=lib.GxB_COMPRESSION_DEFAULT, level=None, *, nthreads=None
+):
+    """Write a mapping of names to matrices and vectors to an archive file.
+
+    Members are serialized and written one at a time with
+    `serialize_matrix_to`, so at most one serialized blob is held in memory
+    at once (none with the default compression).  See `serialize_matrix`
+    for `compression`, `level` and `nthreads`.
+
+    >>> from suitesparse_graphblas.api import matrix, vector
+    >>> import tempfile, pathlib
+    >>> path = pathlib.Path(tempfile.mkdtemp()) / "graph.grb"
+    >>> A = matrix.matrix_new(lib.GrB_BOOL, 3, 3)
+    >>> d = vector.vector_new(lib.GrB_INT64, 3)
+    >>> archive_write(path, {"A": A, "degree": d})
+    >>> sorted(archive_members(path))
+    ['A', 'degree']
+    >>> matrix.matrix_shape(archive_read(path, ["A"])["A"])
+    (3, 3)
+
+    """
+    index = {}
+    # Opened for reading too, so that members are serialized directly into the file
+    with open(file, "w+b") as f:
+        f.write(ARCHIVE_MAGIC)
+        offset = len(ARCHIVE_MAGIC)
+        for name, obj in members.items():
+            if not isinstance(name, str):
+                raise TypeError(f"Archive member names must be str; got {name!r}")
+            kind = _member_kind(obj)
+            if kind == "matrix":
+                size = serialize.serialize_matrix_to(obj, f, compression, level, nthreads=nthreads)
+            else:
+                size = serialize.serialize_vector_to(obj, f, compression, level, nthreads=nthreads)
+            index[name] = {"kind": kind, "offset": offset, "size": size}
+            pad = -(offset + size) % _ALIGN
+            f.write(bytes(pad))
+            offset += size + pad
+        index_data = json.dumps(index).encode("utf-8")
+        f.write(index_data)
+        f.write(_trailer.pack(offset, len(index_data), ARCHIVE_MAGIC))
+
+
+def _read_index(buf):
+    """Read the index at the end of an archive held in the buffer `buf`."""
+    if len(buf) < len(ARCHIVE_MAGIC) + _trailer.size or buf[: len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+        raise ValueError("Not a GraphBLAS archive")
+    index_offset, index_size, magic = _trailer.unpack_from(buf, len(buf) - _trailer.size)
+    if magic != ARCHIVE_MAGIC or index_offset + index_size + _trailer.size != len(buf):
+        raise ValueError("Corrupt or truncated GraphBLAS archive")
+    index = json.loads(bytes(buf[index_offset : index_offset + index_size]))
+    return {name: ArchiveMember(**entry) for name, entry in index.items()}
+
+
+def _map(file):
+    with open(file, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def archive_members(file):
+    """Return a dict of the names of the members of an archive to `ArchiveMember` tuples.
+
+    Only the index at the end of the file is read.
+    """
+    with _map(file) as mm:
+        return _read_index(mm)
+
+
+def archive_read(file, names=None, *, max_workers=None, free=True):
+    """Read members of an archive into a dict of names to matrices and vectors.
+
+    The archive is memory-mapped, and only the members in `names` (default:
+    all of them) are read.  Members are deserialized concurrently by up to
+    `max_workers` threads (default: one per CPU), each deserializing
+    directly from the mapping.  See `deserialize_matrix` for `free`.
+    """
+    with _map(file) as mm:
+        index = _read_index(mm)
+        if names is None:
+            names = list(index)
+        else:
+            names = list(names)
+            missing = [name for name in names if name not in index]
+            if missing:
+                raise KeyError(f"Not in archive: {', '.join(map(repr, missing))}")
+        view = memoryview(mm)
+
+        def read_member(name):
+            kind, offset, size = index[name]
+            data = view[offset : offset + size]
+            if kind == "matrix":
+                return serialize.deserialize_matrix(data, free=free)
+            return serialize.deserialize_vector(data, free=free)
+
+        try:
+            if len(names) <= 1:
+                results = [read_member(name) for name in names]
+            else:
+                max_workers = min(len(names), max_workers or os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers) as pool:
+                    results = list(pool.map(read_member, names))
+        finally:
+            view.release()
+    return dict(zip(names, results))
@@ -1,20 +1,58 @@
+import bz2
+import lzma
+import mmap as _mmap
+import os
+import struct
 import sys
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from ctypes.util import find_library
 from pathlib import Path
 
-from cffi import FFI
+import numpy as np
 
 from suitesparse_graphblas import __version__, check_status, ffi, lib
-from suitesparse_graphblas.api import matrix
+from suitesparse_graphblas.api import container, matrix, vector
+from suitesparse_graphblas.api.utils import _index_type, _load_array, _unload_array
+
+_stdffi = None
+_stdlib = None
+
+
+def _get_stdlib():
+    """Return the C library, with `malloc` and `free`, loading it on first use.
+
+    Loading it (and cffi's parser, to declare them) is deferred so that
+    importing this module stays fast.
+    """
+    global _stdffi, _stdlib
+    if _stdlib is None:
+        from cffi import FFI
+
+        stdffi = FFI()
+        stdffi.cdef("""
+        void *malloc(size_t size);
+        void free(void *ptr);
+        """)
+        if sys.platform == "win32":
+            _stdlib = stdffi.dlopen("ucrtbase")
+        else:
+            _stdlib = stdffi.dlopen(find_library("c"))
+        _stdffi = stdffi
+    return _stdlib
+
+
+def __getattr__(name):
+    # `stdlib` and `stdffi` used to be loaded on import
+    if name == "stdlib":
+        return _get_stdlib()
+    if name == "stdffi":
+        _get_stdlib()
+        return _stdffi
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-stdffi = FFI()
-stdffi.cdef("""
-void *malloc(size_t size);
-""")
-if sys.platform == "win32":
-    stdlib = stdffi.dlopen("ucrtbase")
-else:
-    stdlib = stdffi.dlopen(find_library("c"))
 
 # When "packing" a matrix the owner of the memory buffer is transfered
 # to SuiteSparse, which then becomes responsible for freeing it.  cffi
@@ -25,7 +63,9 @@ else:
 # Maybe PyDataMem_NEW?
 
 
-def readinto_new_buffer(f, typ, size, allocator=stdlib.malloc):
+def readinto_new_buffer(f, typ, size, allocator=None):
+    if allocator is None:
+        allocator = _get_stdlib().malloc
     buff = ffi.cast(typ, allocator(size))
     f.readinto(ffi.buffer(buff, size))
     return buff
@@ -35,7 +75,7 @@ GRB_HEADER_LEN = 512
 NULL = ffi.NULL
 
 header_template = """\
-SuiteSparse:GraphBLAS matrix
+SuiteSparse:GraphBLAS {kind}
 {suitesparse_version} ({user_agent})
 nrows:   {nrows}
 ncols:   {ncols}
@@ -45,6 +85,10 @@ format:  {format}
 size:    {size}
 type:    {type}
 iso:     {iso}
+align:   {align}
+compression: {compression}
+blocksize: {blocksize}
+intbits: {intbits}
 {comments}
 """
 
@@ -54,6 +98,18 @@ buff = ffi.buffer
 frombuff = ffi.from_buffer
 Isize = ffi.sizeof("GrB_Index")
 
+# Size of the binary fields that follow the text header (see `binwrite`)
+_fixed_size = (
+    sizeof("uint64_t")
+    + sizeof("GxB_Format_Value")
+    + 2 * sizeof("int32_t")
+    + 2 * sizeof("double")
+    + 4 * Isize
+    + sizeof("int32_t")
+    + sizeof("size_t")
+    + sizeof("bool")
+)
+
 _ss_typecodes = {
     lib.GrB_BOOL: 0,
     lib.GrB_INT8: 1,
@@ -88,470 +144,1149 @@ _ss_typenames = {
 
 _ss_codetypes = {v: k for k, v in _ss_typecodes.items()}
 
+# The container arrays stored in a file, in file order, by sparsity
+_container_fields = {
+    lib.GxB_HYPERSPARSE: ("p", "h", "i", "x"),
+    lib.GxB_SPARSE: ("p", "i", "x"),
+    lib.GxB_BITMAP: ("b", "x"),
+    lib.GxB_FULL: ("x",),
+}
+_format_names = {
+    lib.GxB_HYPERSPARSE: "HCS",
+    lib.GxB_SPARSE: "CS",
+    lib.GxB_BITMAP: "BITMAP",
+    lib.GxB_FULL: "FULL",
+}
 
-def binwrite(A, filename, comments=None, opener=Path.open):
+# Offsets (p) are unsigned and indices (h and i) signed, of 32 or 64 bits
+_index_fields = {"p", "h", "i"}
+_offset_types = {32: lib.GrB_UINT32, 64: lib.GrB_UINT64}
+_index_types = {32: lib.GrB_INT32, 64: lib.GrB_INT64}
+
+BinaryInfo = namedtuple(
+    "BinaryInfo",
+    [
+        "kind",
+        "type",
+        "nrows",
+        "ncols",
+        "nvals",
+        "nvec",
+        "format",
+        "sparsity_status",
+        "sparsity_control",
+        "iso",
+        "typesize",
+        "align",
+        "compression",
+        "intbits",
+    ],
+)
+
+# Codecs for `binwrite(..., compression=...)`.  All of them release the GIL,
+# so blocks are compressed and decompressed in parallel by a thread pool.
+_compressors = {
+    "zlib": lambda data, level: zlib.compress(data, -1 if level is None else level),
+    "bz2": lambda data, level: bz2.compress(data, 9 if level is None else level),
+    "lzma": lambda data, level: lzma.compress(data, preset=level),
+}
+_decompressors = {
+    "zlib": zlib.decompress,
+    "bz2": bz2.decompress,
+    "lzma": lzma.decompress,
+}
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# Every compressed block is preceded by its compressed size and the CRC-32 of
+# its uncompressed data
+_block_header = struct.Struct("<QI")
+
+
+def _padding(offset, align):
+    """Number of zero bytes needed to advance `offset` to a multiple of `align`."""
+    if not align:
+        return 0
+    return -offset % align
+
+
+# The lines of the text header after the fixed `key: value` lines of older
+# files (nrows to iso), in the order written.  The comments follow them.
+_option_keys = ["align", "compression", "blocksize", "intbits"]
+_option_line = 10
+
+
+def _parse_header(header, kind=None):
+    """Parse the option lines of the text header into a dict of strings.
+
+    The options are only read from their own lines, which follow the fixed
+    lines of older files and precede the comments, so comments can't be
+    mistaken for options.  Files written before an option existed don't
+    have its line (or those after it), and the comments start there.
+
+    If `kind` ("matrix" or "vector") is given, raise ValueError if the header
+    describes a different kind of object.
+    """
+    lines = header.decode("ascii").splitlines()
+    if kind is not None and (not lines or lines[0] != f"SuiteSparse:GraphBLAS {kind}"):
+        raise ValueError(f"Not a SuiteSparse:GraphBLAS {kind} file")
+    fields = {}
+    for expected, line in zip(_option_keys, lines[_option_line:]):
+        key, sep, value = line.partition(":")
+        if not sep or key != expected:
+            break
+        fields[key] = value.strip()
+    return fields
+
+
+def _header_options(header, kind=None):
+    """Return the `(align, compression, block_size, intbits)` recorded in a text header.
+
+    `intbits` holds the sizes in bits of the `(p, h, i)` arrays, which are
+    64 bits in files written before they were recorded.
+    """
+    fields = _parse_header(header, kind)
+    try:
+        align = int(fields.get("align", 0))
+        intbits = tuple(int(bits) for bits in fields.get("intbits", "64 64 64").split())
+        block_size = int(fields.get("blocksize", 0))
+    except ValueError:
+        raise ValueError(f"Invalid options in file header: {fields}") from None
+    if len(intbits) != 3 or not set(intbits) <= {32, 64}:
+        raise ValueError(f"Invalid intbits in file: {fields['intbits']}")
+    compression = fields.get("compression", "none")
+    if compression == "none":
+        return align, None, 0, intbits
+    if compression not in _decompressors:
+        raise ValueError(f"Unknown compression in file: {compression}")
+    if block_size < 1:
+        raise ValueError(f"Invalid blocksize in file: {fields.get('blocksize')}")
+    return align, compression, block_size, intbits
+
+
+def _check_write_options(align, compression, block_size):
+    """Validate the layout options of `binwrite` and return the block size to use."""
+    if align is not None and (align < 1 or align & (align - 1)):
+        raise ValueError(f"align must be a positive power of two; got: {align}")
+    if compression is None:
+        return 0
+    if compression not in _compressors:
+        raise ValueError(
+            f"compression must be None or one of {sorted(_compressors)}; got: {compression!r}"
+        )
+    if align is not None:
+        raise ValueError("align cannot be combined with compression")
+    if block_size is None:
+        return DEFAULT_BLOCK_SIZE
+    if block_size < 1:
+        raise ValueError(f"block_size must be positive; got: {block_size}")
+    return block_size
+
+
+class _BlockPool(ThreadPoolExecutor):
+    """Thread pool for compressed blocks that remembers its number of workers."""
+
+    def __init__(self, nworkers):
+        super().__init__(nworkers)
+        self.nworkers = nworkers
+
+
+def _block_pool(compression, nthreads):
+    """Return a context manager giving the thread pool used for compressed blocks."""
+    if compression is None:
+        return nullcontext()
+    return _BlockPool(nthreads or os.cpu_count() or 1)
+
+
+def _write_blocks(fwrite, data, compression, level, block_size, pool):
+    """Compress `data` in independent blocks of `block_size` bytes and write them.
+
+    At most two blocks per thread are in flight at a time, so memory use is
+    bounded by the block size rather than the size of `data`.
+    """
+    compress = _compressors[compression]
+    data = memoryview(data).cast("B")
+
+    def compress_block(block):
+        return zlib.crc32(block), compress(block, level)
+
+    starts = range(0, len(data), block_size)
+    window = 2 * pool.nworkers
+    for i in range(0, len(starts), window):
+        futures = [
+            pool.submit(compress_block, data[start : start + block_size])
+            for start in starts[i : i + window]
+        ]
+        for future in futures:
+            crc, payload = future.result()
+            fwrite(_block_header.pack(len(payload), crc))
+            fwrite(payload)
+
+
+def _read_blocks(f, dest, compression, block_size, pool):
+    """Read the blocks written by `_write_blocks` and decompress them into `dest`.
+
+    Blocks are decompressed in parallel, and each is checked against its
+    checksum before being copied into place.
+    """
+    decompress = _decompressors[compression]
+    dest = memoryview(dest).cast("B")
+
+    def read_block(start):
+        header = f.read(_block_header.size)
+        if len(header) == _block_header.size:
+            csize, crc = _block_header.unpack(header)
+            payload = f.read(csize)
+            if len(payload) == csize:
+                return payload, crc
+        raise ValueError(f"Corrupt compressed block at byte {start} of a section")
+
+    def decompress_block(start, payload, crc):
+        expected = min(block_size, len(dest) - start)
+        try:
+            data = decompress(payload)
+        except (zlib.error, lzma.LZMAError, OSError, EOFError):
+            data = None
+        if data is None or len(data) != expected or zlib.crc32(data) != crc:
+            raise ValueError(f"Corrupt compressed block at byte {start} of a section")
+        dest[start : start + expected] = data
+
+    starts = range(0, len(dest), block_size)
+    window = 2 * pool.nworkers
+    for i in range(0, len(starts), window):
+        futures = []
+        try:
+            for start in starts[i : i + window]:
+                futures.append(pool.submit(decompress_block, start, *read_block(start)))
+        finally:
+            # Don't leave blocks writing into `dest` if an error is raised
+            wait(futures)
+        for future in futures:
+            future.result()
+
+
+def _format_header(kind, **fields):
+    """Format the fixed-length text header for a matrix or vector file."""
+    suitesparse_version = (
+        f"v{lib.GxB_IMPLEMENTATION_MAJOR}."
+        f"{lib.GxB_IMPLEMENTATION_MINOR}."
+        f"{lib.GxB_IMPLEMENTATION_SUB}"
+    )
+    header_content = header_template.format(
+        kind=kind,
+        suitesparse_version=suitesparse_version,
+        user_agent="pygraphblas-" + __version__,
+        **fields,
+    )
+    header = header_content.encode("ascii")
+    if len(header) > GRB_HEADER_LEN:
+        raise ValueError(
+            f"Header is {len(header)} bytes, longer than the {GRB_HEADER_LEN} allowed; "
+            "use a shorter comments string"
+        )
+    return header.ljust(GRB_HEADER_LEN)
+
+
+def _write_fixed(
+    fwrite,
+    format,
+    sparsity_status,
+    sparsity_control,
+    hyper_switch,
+    bitmap_switch,
+    nrows,
+    ncols,
+    nvec,
+    nvals,
+    typecode,
+    typesize,
+    is_iso,
+):
+    """Write the binary fields that follow the text header (see `_read_fixed`)."""
+    impl = ffi.new("uint64_t*", lib.GxB_IMPLEMENTATION)
+    fwrite(buff(impl, sizeof("uint64_t")))
+    fwrite(buff(format, sizeof("GxB_Format_Value")))
+    fwrite(buff(sparsity_status, sizeof("int32_t")))
+    fwrite(buff(sparsity_control, sizeof("int32_t")))
+    fwrite(buff(hyper_switch, sizeof("double")))
+    fwrite(buff(bitmap_switch, sizeof("double")))
+    fwrite(buff(nrows, Isize))
+    fwrite(buff(ncols, Isize))
+    fwrite(buff(nvec, Isize))
+    fwrite(buff(nvals, Isize))
+    fwrite(buff(typecode, sizeof("int32_t")))
+    fwrite(buff(typesize, sizeof("size_t")))
+    fwrite(buff(is_iso, sizeof("bool")))
+
+
+def _write_sections(fwrite, sections, align, compression=None, level=None, block_size=0, pool=None):
+    """Write NumPy arrays after the fixed fields, padding each to `align`.
+
+    With `compression`, each array is instead written as compressed blocks.
+    """
+    if compression is not None:
+        for array in sections:
+            _write_blocks(fwrite, array, compression, level, block_size, pool)
+        return
+    offset = GRB_HEADER_LEN + _fixed_size
+    for array in sections:
+        pad = _padding(offset, align)
+        if pad:
+            fwrite(bytes(pad))
+        fwrite(memoryview(array).cast("B"))
+        offset += pad + array.nbytes
+
+
+def _check_index_bits(index_bits):
+    """Validate the `index_bits` option of `binwrite` and `vector_binwrite`."""
+    if index_bits not in {32, 64}:
+        raise ValueError(f"index_bits must be 32 or 64; got: {index_bits!r}")
+
+
+def _unload_sections(c):
+    """Move the arrays of the container `c` into NumPy arrays.
+
+    Returns a dict of the container fields stored in a file to arrays, in
+    file order.  Offsets (`p`) are unsigned and indices (`h` and `i`)
+    signed, as in the container, and 32 or 64 bits wide.
+    """
+    return {
+        field: _unload_array(getattr(c, field), unsigned=field == "p")
+        for field in _container_fields[c.format]
+    }
+
+
+def _reload_sections(c, arrays, T):
+    """Move the arrays returned by `_unload_sections` back into the container `c`."""
+    for field, array in arrays.items():
+        if field == "x":
+            typ = T
+        elif field == "b":
+            typ = lib.GrB_INT8
+        else:
+            typ = _index_type(array, unsigned=field == "p")
+        _load_array(getattr(c, field), array, typ)
+
+
+def _file_sections(arrays, index_bits):
+    """Return the arrays to write for `arrays` and their `(p, h, i)` sizes in bits.
+
+    With `index_bits=64`, 32-bit offsets and indices are widened to 64 bits;
+    with `index_bits=32`, they are written as they are.
+    """
+    if index_bits == 64:
+        arrays = {
+            field: (
+                array.astype(np.uint64 if field == "p" else np.int64, copy=False)
+                if field in _index_fields
+                else array
+            )
+            for field, array in arrays.items()
+        }
+    intbits = tuple(8 * arrays[field].itemsize if field in arrays else 64 for field in "phi")
+    return list(arrays.values()), intbits
+
+
+def binwrite(
+    A,
+    filename,
+    comments=None,
+    opener=Path.open,
+    *,
+    align=None,
+    compression=None,
+    level=None,
+    block_size=None,
+    nthreads=None,
+    index_bits=64,
+):
+    """Write a matrix to a binary file.
+
+    The file starts with a 512 byte text header followed by the matrix
+    metadata and the raw arrays of the matrix in its current format.
+
+    If `align` is given, every array is padded to start at a file offset
+    that is a multiple of `align` bytes.  Aligned files can be read
+    without copying by `binread(..., mmap=True)`.
+
+    `compression` may be "zlib", "bz2" or "lzma" to compress every array
+    in independent blocks of `block_size` bytes (1 MiB by default), each
+    with a CRC-32 checksum.  `level` is passed to the compressor.  Blocks
+    are compressed by `nthreads` threads (default: one per CPU) and only a
+    few blocks per thread are held in memory at once.  `binread` detects
+    compressed files and decompresses them in parallel too.
+
+    Offsets and indices are written as 64-bit integers by default, which
+    every reader of this format expects.  With `index_bits=32`, the arrays
+    the matrix stores in 32 bits (see `matrix.matrix_set_integer_bits`) are
+    written as they are, without converting them, and the header records
+    their sizes.  Such files are smaller and faster to write and read, but
+    only readers that understand the `intbits` header line can read them;
+    older versions of this package and other readers of the format
+    misread them.  The same holds for files written with `align` or
+    `compression`.
+    """
+    block_size = _check_write_options(align, compression, block_size)
+    _check_index_bits(index_bits)
     if isinstance(filename, str):
         filename = Path(filename)
 
     check_status(A, lib.GrB_Matrix_wait(A[0], lib.GrB_MATERIALIZE))
 
-    ffinew = ffi.new
-
-    Ap = ffinew("GrB_Index**")
-    Ai = ffinew("GrB_Index**")
-    Ah = ffinew("GrB_Index**")
-    Ax = ffinew("void**")
-    Ab = ffinew("int8_t**")
-
-    Ap_size = ffinew("GrB_Index*")
-    Ai_size = ffinew("GrB_Index*")
-    Ah_size = ffinew("GrB_Index*")
-    Ax_size = ffinew("GrB_Index*")
-    Ab_size = ffinew("GrB_Index*")
-
+    nrows = ffinew("GrB_Index*", matrix.matrix_nrows(A))
+    ncols = ffinew("GrB_Index*", matrix.matrix_ncols(A))
+    nvals = ffinew("GrB_Index*", matrix.matrix_nvals(A))
     nvec = ffinew("GrB_Index*")
-    nrows = ffinew("GrB_Index*")
-    ncols = ffinew("GrB_Index*")
-    nvals = ffinew("GrB_Index*")
-
-    typesize = ffi.new("size_t*")
-    is_iso = ffinew("bool*")
-    is_jumbled = ffinew("bool*")
-
-    impl = ffi.new("uint64_t*", lib.GxB_IMPLEMENTATION)
-    format = ffinew("GxB_Format_Value*")
-    hyper_switch = ffinew("double*")
-    bitmap_switch = ffinew("double*")
-    sparsity_control = ffinew("int32_t*")
-    sparsity_status = ffinew("int32_t*")
+    matrix_type = matrix.matrix_type(A)
 
-    typecode = ffinew("int32_t*")
-    matrix_type = ffi.new("GrB_Type*")
+    typesize = ffinew("size_t*")
+    check_status(A, lib.GxB_Type_size(typesize, matrix_type))
+    typecode = ffinew("int32_t*", _ss_typecodes[matrix_type])
 
-    nrows[0] = matrix.matrix_nrows(A)
-    ncols[0] = matrix.matrix_ncols(A)
-    nvals[0] = matrix.matrix_nvals(A)
-    matrix_type[0] = matrix.matrix_type(A)
-
-    check_status(A, lib.GxB_Type_size(typesize, matrix_type[0]))
-    typecode[0] = _ss_typecodes[matrix_type[0]]
-
-    format[0] = matrix.matrix_format(A)
-    hyper_switch[0] = matrix.matrix_hyper_switch(A)
-    bitmap_switch[0] = matrix.matrix_bitmap_switch(A)
-    sparsity_status[0] = matrix.matrix_sparsity_status(A)
-    sparsity_control[0] = matrix.matrix_sparsity_control(A)
+    format = ffinew("GxB_Format_Value*", matrix.matrix_format(A))
+    hyper_switch = ffinew("double*", matrix.matrix_hyper_switch(A))
+    bitmap_switch = ffinew("double*", matrix.matrix_bitmap_switch(A))
+    sparsity_status = ffinew("int32_t*", matrix.matrix_sparsity_status(A))
+    sparsity_control = ffinew("int32_t*", matrix.matrix_sparsity_control(A))
 
     by_row = format[0] == lib.GxB_BY_ROW
-    by_col = format[0] == lib.GxB_BY_COL
-
-    is_hyper = sparsity_status[0] == lib.GxB_HYPERSPARSE
-    is_sparse = sparsity_status[0] == lib.GxB_SPARSE
-    is_bitmap = sparsity_status[0] == lib.GxB_BITMAP
-    is_full = sparsity_status[0] == lib.GxB_FULL
-
-    if by_col and is_hyper:
-        check_status(
-            A,
-            lib.GxB_Matrix_unpack_HyperCSC(
-                A[0],
-                Ap,
-                Ah,
-                Ai,
-                Ax,
-                Ap_size,
-                Ah_size,
-                Ai_size,
-                Ax_size,
-                is_iso,
-                nvec,
-                is_jumbled,
-                NULL,
-            ),
-        )
-        fmt_string = "HCSC"
-
-    elif by_row and is_hyper:
-        check_status(
-            A,
-            lib.GxB_Matrix_unpack_HyperCSR(
-                A[0],
-                Ap,
-                Ah,
-                Ai,
-                Ax,
-                Ap_size,
-                Ah_size,
-                Ai_size,
-                Ax_size,
-                is_iso,
-                nvec,
-                is_jumbled,
-                NULL,
-            ),
-        )
-        fmt_string = "HCSR"
-
-    elif by_col and is_sparse:
-        check_status(
-            A,
-            lib.GxB_Matrix_unpack_CSC(
-                A[0], Ap, Ai, Ax, Ap_size, Ai_size, Ax_size, is_iso, is_jumbled, NULL
-            ),
-        )
-        nvec[0] = ncols[0]
-        fmt_string = "CSC"
-
-    elif by_row and is_sparse:
-        check_status(
-            A,
-            lib.GxB_Matrix_unpack_CSR(
-                A[0], Ap, Ai, Ax, Ap_size, Ai_size, Ax_size, is_iso, is_jumbled, NULL
-            ),
-        )
-        nvec[0] = nrows[0]
-        fmt_string = "CSR"
-
-    elif by_col and is_bitmap:
-        check_status(
-            A, lib.GxB_Matrix_unpack_BitmapC(A[0], Ab, Ax, Ab_size, Ax_size, is_iso, nvals, NULL)
-        )
-        nvec[0] = ncols[0]
-        fmt_string = "BITMAPC"
-
-    elif by_row and is_bitmap:
-        check_status(
-            A, lib.GxB_Matrix_unpack_BitmapR(A[0], Ab, Ax, Ab_size, Ax_size, is_iso, nvals, NULL)
+    status = sparsity_status[0]
+    if status not in _container_fields:  # pragma nocover
+        raise TypeError(f"Unknown Matrix format {status}")
+    fmt_string = _format_names[status] + ("R" if by_row else "C")
+
+    C = container.container_new()
+    c = C[0]
+    check_status(A, lib.GxB_unload_Matrix_into_Container(A[0], c, NULL))
+    arrays = {}
+    try:
+        arrays = _unload_sections(c)
+        is_iso = ffinew("bool*", c.iso)
+        if status == lib.GxB_HYPERSPARSE:
+            nvec[0] = arrays["h"].size
+        else:
+            nvec[0] = nrows[0] if by_row else ncols[0]
+        sections, intbits = _file_sections(arrays, index_bits)
+
+        header = _format_header(
+            "matrix",
+            nrows=nrows[0],
+            ncols=ncols[0],
+            nvals=nvals[0],
+            nvec=nvec[0],
+            format=fmt_string,
+            size=typesize[0],
+            type=_ss_typenames[matrix_type],
+            iso=int(is_iso[0]),
+            align=align or 0,
+            compression=compression or "none",
+            blocksize=block_size,
+            intbits=" ".join(map(str, intbits)),
+            comments=comments,
         )
-        nvec[0] = nrows[0]
-        fmt_string = "BITMAPR"
-
-    elif by_col and is_full:
-        check_status(A, lib.GxB_Matrix_unpack_FullC(A[0], Ax, Ax_size, is_iso, NULL))
-        nvec[0] = ncols[0]
-        fmt_string = "FULLC"
 
-    elif by_row and is_full:
-        check_status(A, lib.GxB_Matrix_unpack_FullR(A[0], Ax, Ax_size, is_iso, NULL))
-        nvec[0] = nrows[0]
-        fmt_string = "FULLR"
+        with opener(filename, "wb") as f, _block_pool(compression, nthreads) as pool:
+            fwrite = f.write
+            fwrite(header)
+            _write_fixed(
+                fwrite,
+                format,
+                sparsity_status,
+                sparsity_control,
+                hyper_switch,
+                bitmap_switch,
+                nrows,
+                ncols,
+                nvec,
+                nvals,
+                typecode,
+                typesize,
+                is_iso,
+            )
+            _write_sections(fwrite, sections, align, compression, level, block_size, pool)
+    finally:
+        _reload_sections(c, arrays, matrix_type)
+        check_status(A, lib.GxB_load_Matrix_from_Container(A[0], c, NULL))
+
+
+def _read_fixed(fread):
+    """Read the binary fields that follow the text header."""
+    impl = frombuff("uint64_t*", fread(sizeof("uint64_t")))
+
+    assert impl[0] == lib.GxB_IMPLEMENTATION
+
+    format = frombuff("GxB_Format_Value*", fread(sizeof("GxB_Format_Value")))
+    sparsity_status = frombuff("int32_t*", fread(sizeof("int32_t")))
+    sparsity_control = frombuff("int32_t*", fread(sizeof("int32_t")))
+    hyper_switch = frombuff("double*", fread(sizeof("double")))
+    bitmap_switch = frombuff("double*", fread(sizeof("double")))
+    nrows = frombuff("GrB_Index*", fread(Isize))
+    ncols = frombuff("GrB_Index*", fread(Isize))
+    nvec = frombuff("GrB_Index*", fread(Isize))
+    nvals = frombuff("GrB_Index*", fread(Isize))
+    typecode = frombuff("int32_t*", fread(sizeof("int32_t")))
+    typesize = frombuff("size_t*", fread(sizeof("size_t")))
+    is_iso = frombuff("bool*", fread(sizeof("bool")))
+    return (
+        format,
+        sparsity_status,
+        sparsity_control,
+        hyper_switch,
+        bitmap_switch,
+        nrows,
+        ncols,
+        nvec,
+        nvals,
+        typecode,
+        typesize,
+        is_iso,
+    )
 
-    else:  # pragma nocover
-        raise TypeError(f"Unknown Matrix format {format[0]}")
 
-    suitesparse_version = (
-        f"v{lib.GxB_IMPLEMENTATION_MAJOR}."
-        f"{lib.GxB_IMPLEMENTATION_MINOR}."
-        f"{lib.GxB_IMPLEMENTATION_SUB}"
+def _section_layout(
+    sparsity_status, atype, nrows, ncols, nvec, nvals, typesize, is_iso, intbits=(64, 64, 64)
+):
+    """Return the arrays stored in a file as `(container_field, type, n, itemsize)` tuples.
+
+    `intbits` are the sizes in bits of the `p`, `h` and `i` arrays.
+    """
+    pbits, hbits, ibits = intbits
+    p = ("p", _offset_types[pbits], nvec + 1, pbits // 8)
+    i = ("i", _index_types[ibits], nvals, ibits // 8)
+    if sparsity_status == lib.GxB_HYPERSPARSE:
+        layout = [p, ("h", _index_types[hbits], nvec, hbits // 8), i]
+        nx = nvals
+    elif sparsity_status == lib.GxB_SPARSE:
+        layout = [p, i]
+        nx = nvals
+    elif sparsity_status == lib.GxB_BITMAP:
+        layout = [("b", lib.GrB_INT8, nrows * ncols, sizeof("int8_t"))]
+        nx = nrows * ncols
+    else:
+        layout = []
+        nx = nrows * ncols
+    layout.append(("x", atype, 1 if is_iso else nx, typesize))
+    return layout
+
+
+def _free_keepalive(free_func, keepalive):
+    """Return a `free` function that keeps `keepalive` referenced until the object is freed."""
+
+    def free(obj):
+        free_func(obj)
+        keepalive.clear()
+
+    return free
+
+
+def _map_file(filename, kind):
+    """Memory-map a binary file and read its header and fixed fields."""
+    with open(filename, "rb") as f:
+        mm = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+    try:
+        align, compression, _, intbits = _header_options(mm.read(GRB_HEADER_LEN), kind)
+        if compression is not None:
+            raise ValueError("mmap=True requires an uncompressed file")
+        if len(mm) < GRB_HEADER_LEN + _fixed_size:
+            raise ValueError(f"{filename} is truncated")
+        return mm, align, intbits, _read_fixed(mm.read)
+    except BaseException:
+        mm.close()
+        raise
+
+
+def _new_container(format, sparsity_status, nrows, ncols, nvals, is_iso):
+    """Create a container describing an object stored in a binary file."""
+    C = container.container_new()
+    c = C[0]
+    c.nrows = nrows
+    c.ncols = ncols
+    c.nrows_nonempty = -1
+    c.ncols_nonempty = -1
+    c.nvals = nvals
+    c.format = sparsity_status
+    c.orientation = lib.GrB_ROWMAJOR if format == lib.GxB_BY_ROW else lib.GrB_COLMAJOR
+    c.iso = is_iso
+    c.jumbled = False
+    return C
+
+
+def _section_offsets(layout, align):
+    """Return `(field, type, n, itemsize, offset)` for each array in `layout`.
+
+    `offset` is the position of the array in the file, after any padding.
+    """
+    offset = GRB_HEADER_LEN + _fixed_size
+    sections = []
+    for field, T, n, itemsize in layout:
+        offset += _padding(offset, align)
+        sections.append((field, T, n, itemsize, offset))
+        offset += n * itemsize
+    return sections
+
+
+def _check_mapped_size(mm, filename, align, layout):
+    """Close `mm` and raise if it is too short to hold the arrays in `layout`."""
+    sections = _section_offsets(layout, align)
+    end = max((offset + n * itemsize for _, _, n, itemsize, offset in sections), default=0)
+    if end > len(mm):
+        mm.close()
+        raise ValueError(f"{filename} is truncated")
+
+
+def _load_mapped(c, base, align, layout):
+    """Load the arrays described by `layout` from the mapping `base` into container `c`.
+
+    Aligned arrays are loaded read-only without copying; misaligned arrays
+    (e.g. in files written without `align`) are copied into new buffers.
+    """
+    for field, T, n, itemsize, offset in _section_offsets(layout, align):
+        size = n * itemsize
+        if offset % min(itemsize, 8) == 0:
+            X = ffinew("void**", base + offset)
+            handling = lib.GxB_IS_READONLY
+        else:
+            X = ffinew("void**", _get_stdlib().malloc(size))
+            ffi.memmove(X[0], base + offset, size)
+            handling = lib.GrB_DEFAULT
+        v = getattr(c, field)
+        check_status(v, lib.GxB_Vector_load(v, X, T, n, size, handling, NULL))
+
+
+def _discard_mapped(C, base, mm):
+    """Free the container `C`, which may refer to the mapping, then unmap `mm`."""
+    container.container_free(C)
+    ffi.release(base)
+    mm.close()
+
+
+def _binread_mmap(filename):
+    mm, align, intbits, fixed = _map_file(filename, "matrix")
+    (
+        format,
+        sparsity_status,
+        sparsity_control,
+        hyper_switch,
+        bitmap_switch,
+        nrows,
+        ncols,
+        nvec,
+        nvals,
+        typecode,
+        typesize,
+        is_iso,
+    ) = fixed
+    atype = _ss_codetypes[typecode[0]]
+    layout = _section_layout(
+        sparsity_status[0],
+        atype,
+        nrows[0],
+        ncols[0],
+        nvec[0],
+        nvals[0],
+        typesize[0],
+        is_iso[0],
+        intbits,
     )
+    _check_mapped_size(mm, filename, align, layout)
+    base = frombuff("uint8_t[]", mm)
+
+    C = _new_container(format[0], sparsity_status[0], nrows[0], ncols[0], nvals[0], is_iso[0])
+    A = matrix.matrix_new(atype, nrows[0], ncols[0], free=None)
+    try:
+        # The mapped arrays are loaded read-only, so the matrix must keep its on-disk
+        # sparsity; GraphBLAS cannot convert a read-only matrix in place.
+        matrix.matrix_set_sparsity_control(A, sparsity_status[0])
+        matrix.matrix_set_hyper_switch(A, hyper_switch[0])
+        matrix.matrix_set_bitmap_switch(A, bitmap_switch[0])
+        _load_mapped(C[0], base, align, layout)
+        check_status(A, lib.GxB_load_Matrix_from_Container(A[0], C[0], NULL))
+    except BaseException:
+        matrix.matrix_free(A)
+        _discard_mapped(C, base, mm)
+        raise
+    return ffi.gc(A, _free_keepalive(matrix.matrix_free, [mm, base]))
+
+
+def _section_reader(f, align, compression, block_size, pool):
+    """Return a function reading the next array after the fixed fields of `f`.
+
+    `read_section(size)` returns a new malloc'd buffer holding the next
+    `size` bytes of the file.
+    """
+    offset = GRB_HEADER_LEN + _fixed_size
+
+    def read_section(size):
+        nonlocal offset
+        # Allocate at least one byte, so that empty arrays get a valid pointer
+        ptr = _get_stdlib().malloc(max(size, 1))
+        try:
+            if compression is not None:
+                _read_blocks(f, buff(ptr, size), compression, block_size, pool)
+                return ptr
+            pad = _padding(offset, align)
+            if pad:
+                f.read(pad)
+            offset += pad + size
+            if f.readinto(buff(ptr, size)) != size:
+                raise ValueError("File is truncated")
+            return ptr
+        except BaseException:
+            _get_stdlib().free(ptr)
+            raise
+
+    return read_section
+
+
+def _load_sections(c, read_section, layout):
+    """Read the arrays described by `layout` with `read_section` into container `c`."""
+    for field, T, n, itemsize in layout:
+        size = n * itemsize
+        X = ffinew("void**", read_section(size))
+        v = getattr(c, field)
+        check_status(v, lib.GxB_Vector_load(v, X, T, n, max(size, 1), lib.GrB_DEFAULT, NULL))
+
+
+def _read_range(f, offset, size):
+    """Read `size` bytes at `offset` of `f` into a new malloc'd buffer and return it."""
+    f.seek(offset)
+    return readinto_new_buffer(f, "uint8_t*", max(size, 1))
+
+
+def _binread_range(f, align, intbits, fixed, start, stop):
+    """Read the vectors `start:stop` of the matrix in the open binary file `f`.
+
+    Vectors are rows for matrices stored by row and columns for matrices
+    stored by column.  Only the parts of the file holding those vectors are
+    read, except for hypersparse matrices, whose whole list of non-empty
+    vectors is read to locate them.
+    """
+    (
+        format,
+        sparsity_status,
+        sparsity_control,
+        hyper_switch,
+        bitmap_switch,
+        nrows,
+        ncols,
+        nvec,
+        nvals,
+        typecode,
+        typesize,
+        is_iso,
+    ) = fixed
+    atype = _ss_codetypes[typecode[0]]
+    status = sparsity_status[0]
+    by_row = format[0] == lib.GxB_BY_ROW
+    vlen = ncols[0] if by_row else nrows[0]
+    k = stop - start
+    sections = {
+        field: (T, itemsize, offset)
+        for field, T, n, itemsize, offset in _section_offsets(
+            _section_layout(
+                status,
+                atype,
+                nrows[0],
+                ncols[0],
+                nvec[0],
+                nvals[0],
+                typesize[0],
+                is_iso[0],
+                intbits,
+            ),
+            align,
+        )
+    }
+    # (field, first element, number of elements) of the arrays to read
+    if status in {lib.GxB_SPARSE, lib.GxB_HYPERSPARSE}:
+        if status == lib.GxB_HYPERSPARSE:
+            _, itemsize, offset = sections["h"]
+            f.seek(offset)
+            Ah = np.frombuffer(f.read(nvec[0] * itemsize), f"int{8 * itemsize}")
+            first, last = np.searchsorted(Ah, [start, stop]).tolist()
+        else:
+            first, last = start, stop
+        _, itemsize, offset = sections["p"]
+        f.seek(offset + first * itemsize)
+        p = np.frombuffer(f.read((last - first + 1) * itemsize), f"uint{8 * itemsize}")
+        lo, hi = int(p[0]), int(p[-1])
+        ranges = [("p", first, last - first + 1)]
+        if status == lib.GxB_HYPERSPARSE:
+            ranges.append(("h", first, last - first))
+        ranges.append(("i", lo, hi - lo))
+        ranges.append(("x", lo, hi - lo))
+        new_nvals = hi - lo
+    else:
+        ranges = []
+        if status == lib.GxB_BITMAP:
+            ranges.append(("b", start * vlen, k * vlen))
+        ranges.append(("x", start * vlen, k * vlen))
+        new_nvals = k * vlen
+
+    if by_row:
+        C = _new_container(format[0], status, k, ncols[0], new_nvals, is_iso[0])
+    else:
+        C = _new_container(format[0], status, nrows[0], k, new_nvals, is_iso[0])
+    c = C[0]
+    for field, first, n in ranges:
+        T, itemsize, offset = sections[field]
+        if field == "x" and is_iso[0]:
+            first, n = 0, 1
+        size = n * itemsize
+        X = ffinew("void**", _read_range(f, offset + first * itemsize, size))
+        if field in {"p", "h"}:
+            # Rebase the offsets and vector indices to the start of the range
+            dtype = f"{'u' if field == 'p' else ''}int{8 * itemsize}"
+            arr = np.frombuffer(ffi.buffer(X[0], size), dtype)
+            arr -= arr.dtype.type(lo if field == "p" else start)
+        elif field == "b":
+            c.nvals = int(np.count_nonzero(np.frombuffer(ffi.buffer(X[0], size), np.int8)))
+        v = getattr(c, field)
+        check_status(v, lib.GxB_Vector_load(v, X, T, n, max(size, 1), lib.GrB_DEFAULT, NULL))
+
+    A = matrix.matrix_new(atype, c.nrows, c.ncols)
+    check_status(A, lib.GxB_load_Matrix_from_Container(A[0], c, NULL))
+    matrix.matrix_set_sparsity_control(A, sparsity_control[0])
+    matrix.matrix_set_hyper_switch(A, hyper_switch[0])
+    matrix.matrix_set_bitmap_switch(A, bitmap_switch[0])
+    return A
+
+
+def _slice_indices(s, n):
+    """Return the `(start, stop)` of the contiguous slice `s` of `range(n)`."""
+    if not isinstance(s, slice):
+        raise TypeError(f"Expected a slice, got {type(s).__name__}")
+    start, stop, step = s.indices(n)
+    if step != 1:
+        raise ValueError("Only contiguous slices (step 1) are supported")
+    return start, max(start, stop)
+
+
+def binread_info(filename, opener=Path.open):
+    """Return the metadata of a matrix or vector binary file without reading its data.
+
+    Only the text header and the fixed fields that follow it are read.
+    Returns a `BinaryInfo` named tuple; `kind` is "matrix" or "vector".
+    """
+    if isinstance(filename, str):
+        filename = Path(filename)
 
-    vars = dict(  # noqa: C408
-        suitesparse_version=suitesparse_version,
-        user_agent="pygraphblas-" + __version__,
+    with opener(filename, "rb") as f:
+        header = f.read(GRB_HEADER_LEN)
+        kind = header.split(b"\n", 1)[0].decode("ascii").rpartition(" ")[2]
+        if kind not in {"matrix", "vector"}:
+            raise ValueError("Not a SuiteSparse:GraphBLAS binary file")
+        align, compression, _, intbits = _header_options(header, kind)
+        (
+            format,
+            sparsity_status,
+            sparsity_control,
+            hyper_switch,
+            bitmap_switch,
+            nrows,
+            ncols,
+            nvec,
+            nvals,
+            typecode,
+            typesize,
+            is_iso,
+        ) = _read_fixed(f.read)
+
+    return BinaryInfo(
+        kind=kind,
+        type=_ss_codetypes[typecode[0]],
         nrows=nrows[0],
         ncols=ncols[0],
         nvals=nvals[0],
         nvec=nvec[0],
-        format=fmt_string,
-        size=typesize[0],
-        type=_ss_typenames[matrix_type[0]],
-        iso=int(is_iso[0]),
-        comments=comments,
+        format=format[0],
+        sparsity_status=sparsity_status[0],
+        sparsity_control=sparsity_control[0],
+        iso=bool(is_iso[0]),
+        typesize=typesize[0],
+        align=align,
+        compression=compression,
+        intbits=intbits,
     )
-    header_content = header_template.format(**vars)
-    header = f"{header_content: <{GRB_HEADER_LEN}}".encode("ascii")
-
-    with opener(filename, "wb") as f:
-        fwrite = f.write
-        fwrite(header)
-        fwrite(buff(impl, sizeof("uint64_t")))
-        fwrite(buff(format, sizeof("GxB_Format_Value")))
-        fwrite(buff(sparsity_status, sizeof("int32_t")))
-        fwrite(buff(sparsity_control, sizeof("int32_t")))
-        fwrite(buff(hyper_switch, sizeof("double")))
-        fwrite(buff(bitmap_switch, sizeof("double")))
-        fwrite(buff(nrows, Isize))
-        fwrite(buff(ncols, Isize))
-        fwrite(buff(nvec, Isize))
-        fwrite(buff(nvals, Isize))
-        fwrite(buff(typecode, sizeof("int32_t")))
-        fwrite(buff(typesize, sizeof("size_t")))
-        fwrite(buff(is_iso, sizeof("bool")))
-
-        Tsize = typesize[0]
-        iso = is_iso[0]
-
-        if is_hyper:
-            fwrite(buff(Ap[0], (nvec[0] + 1) * Isize))
-            fwrite(buff(Ah[0], nvec[0] * Isize))
-            fwrite(buff(Ai[0], nvals[0] * Isize))
-            Axsize = Tsize if iso else nvals[0] * Tsize
-        elif is_sparse:
-            fwrite(buff(Ap[0], (nvec[0] + 1) * Isize))
-            fwrite(buff(Ai[0], nvals[0] * Isize))
-            Axsize = Tsize if iso else nvals[0] * Tsize
-        elif is_bitmap:
-            fwrite(buff(Ab[0], nrows[0] * ncols[0] * ffi.sizeof("int8_t")))
-            Axsize = Tsize if iso else nrows[0] * ncols[0] * Tsize
-        else:
-            Axsize = Tsize if iso else nrows[0] * ncols[0] * Tsize
-
-        fwrite(buff(Ax[0], Axsize))
-
-    if by_col and is_hyper:
-        check_status(
-            A,
-            lib.GxB_Matrix_pack_HyperCSC(
-                A[0],
-                Ap,
-                Ah,
-                Ai,
-                Ax,
-                Ap_size[0],
-                Ah_size[0],
-                Ai_size[0],
-                Ax_size[0],
-                is_iso[0],
-                nvec[0],
-                is_jumbled[0],
-                NULL,
-            ),
-        )
-
-    elif by_row and is_hyper:
-        check_status(
-            A,
-            lib.GxB_Matrix_pack_HyperCSR(
-                A[0],
-                Ap,
-                Ah,
-                Ai,
-                Ax,
-                Ap_size[0],
-                Ah_size[0],
-                Ai_size[0],
-                Ax_size[0],
-                is_iso[0],
-                nvec[0],
-                is_jumbled[0],
-                NULL,
-            ),
-        )
-
-    elif by_col and is_sparse:
-        check_status(
-            A,
-            lib.GxB_Matrix_pack_CSC(
-                A[0], Ap, Ai, Ax, Ap_size[0], Ai_size[0], Ax_size[0], is_iso[0], is_jumbled[0], NULL
-            ),
-        )
-
-    elif by_row and is_sparse:
-        check_status(
-            A,
-            lib.GxB_Matrix_pack_CSR(
-                A[0], Ap, Ai, Ax, Ap_size[0], Ai_size[0], Ax_size[0], is_iso[0], is_jumbled[0], NULL
-            ),
-        )
-
-    elif by_col and is_bitmap:
-        check_status(
-            A,
-            lib.GxB_Matrix_pack_BitmapC(
-                A[0], Ab, Ax, Ab_size[0], Ax_size[0], is_iso[0], nvals[0], NULL
-            ),
-        )
-
-    elif by_row and is_bitmap:
-        check_status(
-            A,
-            lib.GxB_Matrix_pack_BitmapR(
-                A[0], Ab, Ax, Ab_size[0], Ax_size[0], is_iso[0], nvals[0], NULL
-            ),
-        )
 
-    elif by_col and is_full:
-        check_status(A, lib.GxB_Matrix_pack_FullC(A[0], Ax, Ax_size[0], is_iso[0], NULL))
 
-    elif by_row and is_full:
-        check_status(A, lib.GxB_Matrix_pack_FullR(A[0], Ax, Ax_size[0], is_iso[0], NULL))
-    else:
-        raise TypeError("This should hever happen")
-
-
-def binread(filename, opener=Path.open):
+def binread(filename, opener=Path.open, *, mmap=False, rows=None, cols=None, nthreads=None):
+    """Read a matrix from a binary file written by `binwrite`.
+
+    With `mmap=True` the file is memory-mapped and the arrays of the
+    matrix point directly into the mapping instead of being copied into
+    new buffers, so loading costs page faults rather than reads and
+    copies.  The resulting matrix is read-only and keeps the file mapped
+    until it is freed; use `matrix.matrix_dup` to get a writable copy.
+    Zero-copy requires the arrays to be aligned in the file (see the
+    `align` argument of `binwrite`); misaligned arrays are copied.
+    Memory-mapping is only possible for uncompressed files, so `opener`
+    must be the default when `mmap=True`.
+
+    `rows=slice(start, stop)` reads only that block of rows of a matrix
+    stored by row, as if `A[start:stop, :]`, and `cols=slice(start, stop)`
+    reads a block of columns of a matrix stored by column.  The file is
+    seeked to the byte ranges holding the requested rows or columns, so
+    only those are read.  This works with files compressed by `opener`,
+    although most openers seek by decompressing everything before the
+    target, but not with files written with `binwrite(..., compression=...)`.
+
+    Files written with `compression` are decompressed by `nthreads`
+    threads (default: one per CPU) directly into the new matrix arrays.
+    """
     if isinstance(filename, str):
         filename = Path(filename)
 
+    if rows is not None or cols is not None:
+        if mmap:
+            raise ValueError("rows= and cols= cannot be combined with mmap=True")
+        if rows is not None and cols is not None:
+            raise ValueError("Only one of rows= and cols= may be given")
+        with opener(filename, "rb") as f:
+            align, compression, _, intbits = _header_options(f.read(GRB_HEADER_LEN), "matrix")
+            if compression is not None:
+                raise ValueError("rows= and cols= require a file written without compression")
+            fixed = _read_fixed(f.read)
+            format, nrows, ncols = fixed[0][0], fixed[5][0], fixed[6][0]
+            if rows is not None:
+                if format != lib.GxB_BY_ROW:
+                    raise ValueError("rows= requires a matrix stored by row; use cols=")
+                start, stop = _slice_indices(rows, nrows)
+            else:
+                if format != lib.GxB_BY_COL:
+                    raise ValueError("cols= requires a matrix stored by column; use rows=")
+                start, stop = _slice_indices(cols, ncols)
+            return _binread_range(f, align, intbits, fixed, start, stop)
+
+    if mmap:
+        if opener is not Path.open:
+            raise ValueError("mmap=True requires an uncompressed file and the default opener")
+        return _binread_mmap(filename)
+
     with opener(filename, "rb") as f:
         fread = f.read
 
-        fread(GRB_HEADER_LEN)
-        impl = frombuff("uint64_t*", fread(sizeof("uint64_t")))
-
-        assert impl[0] == lib.GxB_IMPLEMENTATION
-
-        format = frombuff("GxB_Format_Value*", fread(sizeof("GxB_Format_Value")))
-        sparsity_status = frombuff("int32_t*", fread(sizeof("int32_t")))
-        sparsity_control = frombuff("int32_t*", fread(sizeof("int32_t")))
-        hyper_switch = frombuff("double*", fread(sizeof("double")))
-        bitmap_switch = frombuff("double*", fread(sizeof("double")))
-        nrows = frombuff("GrB_Index*", fread(Isize))
-        ncols = frombuff("GrB_Index*", fread(Isize))
-        nvec = frombuff("GrB_Index*", fread(Isize))
-        nvals = frombuff("GrB_Index*", fread(Isize))
-        typecode = frombuff("int32_t*", fread(sizeof("int32_t")))
-        typesize = frombuff("size_t*", fread(sizeof("size_t")))
-        is_iso = frombuff("bool*", fread(sizeof("bool")))
-        is_jumbled = ffi.new("bool*", 0)
-
-        by_row = format[0] == lib.GxB_BY_ROW
-        by_col = format[0] == lib.GxB_BY_COL
-
-        is_hyper = sparsity_status[0] == lib.GxB_HYPERSPARSE
-        is_sparse = sparsity_status[0] == lib.GxB_SPARSE
-        is_bitmap = sparsity_status[0] == lib.GxB_BITMAP
-        is_full = sparsity_status[0] == lib.GxB_FULL
+        align, compression, block_size, intbits = _header_options(fread(GRB_HEADER_LEN), "matrix")
+        (
+            format,
+            sparsity_status,
+            sparsity_control,
+            hyper_switch,
+            bitmap_switch,
+            nrows,
+            ncols,
+            nvec,
+            nvals,
+            typecode,
+            typesize,
+            is_iso,
+        ) = _read_fixed(fread)
+        if sparsity_status[0] not in _container_fields:
+            raise TypeError(f"Unknown format {sparsity_status[0]}")
 
         atype = _ss_codetypes[typecode[0]]
+        layout = _section_layout(
+            sparsity_status[0],
+            atype,
+            nrows[0],
+            ncols[0],
+            nvec[0],
+            nvals[0],
+            typesize[0],
+            is_iso[0],
+            intbits,
+        )
+        C = _new_container(format[0], sparsity_status[0], nrows[0], ncols[0], nvals[0], is_iso[0])
+        with _block_pool(compression, nthreads) as pool:
+            read_section = _section_reader(f, align, compression, block_size, pool)
+            _load_sections(C[0], read_section, layout)
+
+    A = matrix.matrix_new(atype, nrows[0], ncols[0])
+    check_status(A, lib.GxB_load_Matrix_from_Container(A[0], C[0], NULL))
+    matrix.matrix_set_sparsity_control(A, sparsity_control[0])
+    matrix.matrix_set_hyper_switch(A, hyper_switch[0])
+    matrix.matrix_set_bitmap_switch(A, bitmap_switch[0])
+    return A
+
+
+def vector_binwrite(
+    v,
+    filename,
+    comments=None,
+    opener=Path.open,
+    *,
+    align=None,
+    compression=None,
+    level=None,
+    block_size=None,
+    nthreads=None,
+    index_bits=64,
+):
+    """Write a vector to a binary file.
+
+    Vectors use the same header and layout as matrices written by
+    `binwrite`, stored as an n-by-1 column.  See `binwrite` for `align`,
+    `compression`, `level`, `block_size`, `nthreads` and `index_bits`.
+    """
+    block_size = _check_write_options(align, compression, block_size)
+    _check_index_bits(index_bits)
+    if isinstance(filename, str):
+        filename = Path(filename)
 
-        Ap = ffinew("GrB_Index**")
-        Ai = ffinew("GrB_Index**")
-        Ah = ffinew("GrB_Index**")
-        Ax = ffinew("void**")
-        Ab = ffinew("int8_t**")
-
-        Ap_size = ffinew("GrB_Index*")
-        Ai_size = ffinew("GrB_Index*")
-        Ah_size = ffinew("GrB_Index*")
-        Ax_size = ffinew("GrB_Index*")
-        Ab_size = ffinew("GrB_Index*")
-
-        if is_hyper:
-            Ap_size[0] = (nvec[0] + 1) * Isize
-            Ah_size[0] = nvec[0] * Isize
-            Ai_size[0] = nvals[0] * Isize
-            Ax_size[0] = nvals[0] * typesize[0]
-
-            Ap[0] = readinto_new_buffer(f, "GrB_Index*", Ap_size[0])
-            Ah[0] = readinto_new_buffer(f, "GrB_Index*", Ah_size[0])
-            Ai[0] = readinto_new_buffer(f, "GrB_Index*", Ai_size[0])
-        elif is_sparse:
-            Ap_size[0] = (nvec[0] + 1) * Isize
-            Ai_size[0] = nvals[0] * Isize
-            Ax_size[0] = nvals[0] * typesize[0]
-            Ap[0] = readinto_new_buffer(f, "GrB_Index*", Ap_size[0])
-            Ai[0] = readinto_new_buffer(f, "GrB_Index*", Ai_size[0])
-        elif is_bitmap:
-            Ab_size[0] = nrows[0] * ncols[0] * ffi.sizeof("int8_t")
-            Ax_size[0] = nrows[0] * ncols[0] * typesize[0]
-            Ab[0] = readinto_new_buffer(f, "int8_t*", Ab_size[0])
-        elif is_full:
-            Ax_size[0] = nrows[0] * ncols[0] * typesize[0]
-
-        Ax[0] = readinto_new_buffer(f, "uint8_t*", typesize[0] if is_iso[0] else Ax_size[0])
-
-        A = matrix.matrix_new(atype, nrows[0], ncols[0])
-
-        if by_col and is_hyper:
-            check_status(
-                A,
-                lib.GxB_Matrix_pack_HyperCSC(
-                    A[0],
-                    Ap,
-                    Ah,
-                    Ai,
-                    Ax,
-                    Ap_size[0],
-                    Ah_size[0],
-                    Ai_size[0],
-                    Ax_size[0],
-                    is_iso[0],
-                    nvec[0],
-                    is_jumbled[0],
-                    NULL,
-                ),
-            )
-
-        elif by_row and is_hyper:
-            check_status(
-                A,
-                lib.GxB_Matrix_pack_HyperCSR(
-                    A[0],
-                    Ap,
-                    Ah,
-                    Ai,
-                    Ax,
-                    Ap_size[0],
-                    Ah_size[0],
-                    Ai_size[0],
-                    Ax_size[0],
-                    is_iso[0],
-                    nvec[0],
-                    is_jumbled[0],
-                    NULL,
-                ),
-            )
+    check_status(v, lib.GrB_Vector_wait(v[0], lib.GrB_MATERIALIZE))
 
-        elif by_col and is_sparse:
-            check_status(
-                A,
-                lib.GxB_Matrix_pack_CSC(
-                    A[0],
-                    Ap,
-                    Ai,
-                    Ax,
-                    Ap_size[0],
-                    Ai_size[0],
-                    Ax_size[0],
-                    is_iso[0],
-                    is_jumbled[0],
-                    NULL,
-                ),
-            )
+    vector_type = vector.vector_type(v)
+    nrows = ffinew("GrB_Index*", vector.vector_size(v))
+    ncols = ffinew("GrB_Index*", 1)
+    nvec = ffinew("GrB_Index*", 1)
+    nvals = ffinew("GrB_Index*", vector.vector_nvals(v))
 
-        elif by_row and is_sparse:
-            check_status(
-                A,
-                lib.GxB_Matrix_pack_CSR(
-                    A[0],
-                    Ap,
-                    Ai,
-                    Ax,
-                    Ap_size[0],
-                    Ai_size[0],
-                    Ax_size[0],
-                    is_iso[0],
-                    is_jumbled[0],
-                    NULL,
-                ),
-            )
+    typesize = ffinew("size_t*")
+    check_status(v, lib.GxB_Type_size(typesize, vector_type))
+    typecode = ffinew("int32_t*", _ss_typecodes[vector_type])
 
-        elif by_col and is_bitmap:
-            check_status(
-                A,
-                lib.GxB_Matrix_pack_BitmapC(
-                    A[0], Ab, Ax, Ab_size[0], Ax_size[0], is_iso[0], nvals[0], NULL
-                ),
-            )
+    format = ffinew("GxB_Format_Value*", lib.GxB_BY_COL)
+    hyper_switch = ffinew("double*", lib.GxB_NEVER_HYPER)
+    bitmap_switch = ffinew("double*", vector.vector_option_get_fp64(v, lib.GxB_BITMAP_SWITCH))
+    sparsity_status = ffinew("int32_t*", vector.vector_option_get_int32(v, lib.GxB_SPARSITY_STATUS))
+    sparsity_control = ffinew(
+        "int32_t*", vector.vector_option_get_int32(v, lib.GxB_SPARSITY_CONTROL)
+    )
+    if sparsity_status[0] not in {lib.GxB_SPARSE, lib.GxB_BITMAP, lib.GxB_FULL}:  # pragma nocover
+        raise TypeError(f"Unknown Vector format {sparsity_status[0]}")
+
+    C = container.container_new()
+    c = C[0]
+    check_status(v, lib.GxB_unload_Vector_into_Container(v[0], c, NULL))
+    arrays = {}
+    try:
+        # A sparse vector is stored like an n-by-1 CSC matrix, with the
+        # vector pointers [0, nvals]
+        arrays = _unload_sections(c)
+        is_iso = ffinew("bool*", c.iso)
+        sections, intbits = _file_sections(arrays, index_bits)
+
+        header = _format_header(
+            "vector",
+            nrows=nrows[0],
+            ncols=1,
+            nvals=nvals[0],
+            nvec=1,
+            format=_format_names[sparsity_status[0]].replace("CS", "SPARSE"),
+            size=typesize[0],
+            type=_ss_typenames[vector_type],
+            iso=int(is_iso[0]),
+            align=align or 0,
+            compression=compression or "none",
+            blocksize=block_size,
+            intbits=" ".join(map(str, intbits)),
+            comments=comments,
+        )
 
-        elif by_row and is_bitmap:
-            check_status(
-                A,
-                lib.GxB_Matrix_pack_BitmapR(
-                    A[0], Ab, Ax, Ab_size[0], Ax_size[0], is_iso[0], nvals[0], NULL
-                ),
+        with opener(filename, "wb") as f, _block_pool(compression, nthreads) as pool:
+            fwrite = f.write
+            fwrite(header)
+            _write_fixed(
+                fwrite,
+                format,
+                sparsity_status,
+                sparsity_control,
+                hyper_switch,
+                bitmap_switch,
+                nrows,
+                ncols,
+                nvec,
+                nvals,
+                typecode,
+                typesize,
+                is_iso,
             )
+            _write_sections(fwrite, sections, align, compression, level, block_size, pool)
+    finally:
+        _reload_sections(c, arrays, vector_type)
+        check_status(v, lib.GxB_load_Vector_from_Container(v[0], c, NULL))
+
+
+def _vector_binread_mmap(filename):
+    mm, align, intbits, fixed = _map_file(filename, "vector")
+    (
+        format,
+        sparsity_status,
+        sparsity_control,
+        hyper_switch,
+        bitmap_switch,
+        nrows,
+        ncols,
+        nvec,
+        nvals,
+        typecode,
+        typesize,
+        is_iso,
+    ) = fixed
+    vtype = _ss_codetypes[typecode[0]]
+    layout = _section_layout(
+        sparsity_status[0], vtype, nrows[0], 1, 1, nvals[0], typesize[0], is_iso[0], intbits
+    )
+    _check_mapped_size(mm, filename, align, layout)
+    base = frombuff("uint8_t[]", mm)
+
+    C = _new_container(format[0], sparsity_status[0], nrows[0], 1, nvals[0], is_iso[0])
+    v = vector.vector_new(vtype, nrows[0], free=None)
+    try:
+        vector.vector_option_set_int32(v, lib.GxB_SPARSITY_CONTROL, sparsity_status[0])
+        vector.vector_option_set_fp64(v, lib.GxB_BITMAP_SWITCH, bitmap_switch[0])
+        _load_mapped(C[0], base, align, layout)
+        check_status(v, lib.GxB_load_Vector_from_Container(v[0], C[0], NULL))
+    except BaseException:
+        vector.vector_free(v)
+        _discard_mapped(C, base, mm)
+        raise
+    return ffi.gc(v, _free_keepalive(vector.vector_free, [mm, base]))
+
+
+def vector_binread(filename, opener=Path.open, *, mmap=False, nthreads=None):
+    """Read a vector from a binary file written by `vector_binwrite`.
+
+    See `binread` for `mmap` and `nthreads`.
+    """
+    if isinstance(filename, str):
+        filename = Path(filename)
 
-        elif by_col and is_full:
-            check_status(A, lib.GxB_Matrix_pack_FullC(A[0], Ax, Ax_size[0], is_iso[0], NULL))
+    if mmap:
+        if opener is not Path.open:
+            raise ValueError("mmap=True requires an uncompressed file and the default opener")
+        return _vector_binread_mmap(filename)
 
-        elif by_row and is_full:
-            check_status(A, lib.GxB_Matrix_pack_FullR(A[0], Ax, Ax_size[0], is_iso[0], NULL))
-        else:
-            raise TypeError("Unknown format {format[0]}")
+    with opener(filename, "rb") as f:
+        fread = f.read
 
-        matrix.matrix_set_sparsity_control(A, sparsity_control[0])
-        matrix.matrix_set_hyper_switch(A, hyper_switch[0])
-        matrix.matrix_set_bitmap_switch(A, bitmap_switch[0])
-        return A
+        align, compression, block_size, intbits = _header_options(fread(GRB_HEADER_LEN), "vector")
+        (
+            format,
+            sparsity_status,
+            sparsity_control,
+            hyper_switch,
+            bitmap_switch,
+            nrows,
+            ncols,
+            nvec,
+            nvals,
+            typecode,
+            typesize,
+            is_iso,
+        ) = _read_fixed(fread)
+        if sparsity_status[0] not in {lib.GxB_SPARSE, lib.GxB_BITMAP, lib.GxB_FULL}:
+            raise TypeError(f"Unknown format {sparsity_status[0]}")
+        vtype = _ss_codetypes[typecode[0]]
+        layout = _section_layout(
+            sparsity_status[0], vtype, nrows[0], 1, 1, nvals[0], typesize[0], is_iso[0], intbits
+        )
+        C = _new_container(format[0], sparsity_status[0], nrows[0], 1, nvals[0], is_iso[0])
+        with _block_pool(compression, nthreads) as pool:
+            read_section = _section_reader(f, align, compression, block_size, pool)
+            _load_sections(C[0], read_section, layout)
+
+    v = vector.vector_new(vtype, nrows[0])
+    check_status(v, lib.GxB_load_Vector_from_Container(v[0], C[0], NULL))
+    vector.vector_option_set_int32(v, lib.GxB_SPARSITY_CONTROL, sparsity_control[0])
+    vector.vector_option_set_fp64(v, lib.GxB_BITMAP_SWITCH, bitmap_switch[0])
+    return v
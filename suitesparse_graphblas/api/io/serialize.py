@@ -1,8 +1,32 @@
+import io
+import mmap
+import os
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+
 import numpy as np
 
-from suitesparse_graphblas import check_status, ffi, lib
+from suitesparse_graphblas import _error_code_lookup, check_status, ffi, lib
 from suitesparse_graphblas.utils import claim_buffer
 
+NULL = ffi.NULL
+
+SerializedInfo = namedtuple(
+    "SerializedInfo",
+    [
+        "type",
+        "type_name",
+        "nrows",
+        "ncols",
+        "nvals",
+        "format",
+        "sparsity_status",
+        "sparsity_control",
+        "iso",
+    ],
+)
+
 
 def _free_desc(desc):
     """Free a descriptor via a temporary pointer."""
@@ -14,17 +38,16 @@ def get_serialize_desc(compression=lib.GxB_COMPRESSION_DEFAULT, level=None, nthr
     """Create a descriptor for serializing or deserializing.
 
     This returns None (for NULL descriptor) or a GrB_Descriptor.
+
+    `nthreads` is ignored: SuiteSparse:GraphBLAS 10 no longer reads the
+    number of threads from descriptors, so the serialize and deserialize
+    functions apply it with `nthreads_context` instead.
     """
-    if nthreads is None and (compression is None or compression == lib.GxB_COMPRESSION_DEFAULT):
+    if compression is None or compression == lib.GxB_COMPRESSION_DEFAULT:
         return None
     desc_ptr = ffi.new("GrB_Descriptor*")
     check_status(desc_ptr, lib.GrB_Descriptor_new(desc_ptr))
     desc = ffi.gc(desc_ptr[0], _free_desc)
-    if nthreads is not None:
-        check_status(
-            desc,
-            lib.GxB_Desc_set_INT32(desc, lib.GxB_NTHREADS, ffi.cast("int32_t", nthreads)),
-        )
     if compression is not None:
         if level is not None and compression in {
             lib.GxB_COMPRESSION_LZ4HC,
@@ -38,6 +61,31 @@ def get_serialize_desc(compression=lib.GxB_COMPRESSION_DEFAULT, level=None, nthr
     return desc
 
 
+@contextmanager
+def nthreads_context(nthreads):
+    """Limit GraphBLAS calls made by the calling thread to `nthreads` threads.
+
+    This engages a new GxB_Context for the duration of the `with` block and
+    does nothing if `nthreads` is None.  On exit the context that was
+    engaged before, as reported by `context.context_engaged`, is engaged
+    again; if there was none, the thread reverts to the world context.
+    """
+    if nthreads is None:
+        yield
+        return
+    previous = context.context_engaged()
+    ctx = context.context_new()
+    context.context_set_nthreads(ctx, nthreads)
+    context.context_engage(ctx)
+    try:
+        yield
+    finally:
+        if previous is None:
+            context.context_disengage(ctx)
+        else:
+            context.context_engage(previous)
+
+
 def serialize_matrix(A, compression=lib.GxB_COMPRESSION_DEFAULT, level=None, *, nthreads=None):
     """Serialize a Matrix into an array of bytes.
 
@@ -53,12 +101,14 @@ def serialize_matrix(A, compression=lib.GxB_COMPRESSION_DEFAULT, level=None, *,
     nthreads : int, optional
         The maximum number of OpenMP threads to use.
     """
-    desc = get_serialize_desc(compression, level, nthreads)
+    desc = get_serialize_desc(compression, level)
     data_ptr = ffi.new("void**")
     size_ptr = ffi.new("GrB_Index*")
-    check_status(
-        A, lib.GxB_Matrix_serialize(data_ptr, size_ptr, A[0], ffi.NULL if desc is None else desc)
-    )
+    with nthreads_context(nthreads):
+        check_status(
+            A,
+            lib.GxB_Matrix_serialize(data_ptr, size_ptr, A[0], ffi.NULL if desc is None else desc),
+        )
     return claim_buffer(ffi, data_ptr[0], size_ptr[0], np.dtype(np.uint8))
 
 
@@ -76,36 +126,40 @@ def serialize_vector(v, compression=lib.GxB_COMPRESSION_DEFAULT, level=None, *,
     nthreads : int, optional
         The maximum number of OpenMP threads to use.
     """
-    desc = get_serialize_desc(compression, level, nthreads)
+    desc = get_serialize_desc(compression, level)
     data_ptr = ffi.new("void**")
     size_ptr = ffi.new("GrB_Index*")
-    check_status(
-        v, lib.GxB_Vector_serialize(data_ptr, size_ptr, v[0], ffi.NULL if desc is None else desc)
-    )
+    with nthreads_context(nthreads):
+        check_status(
+            v,
+            lib.GxB_Vector_serialize(data_ptr, size_ptr, v[0], ffi.NULL if desc is None else desc),
+        )
     return claim_buffer(ffi, data_ptr[0], size_ptr[0], np.dtype(np.uint8))
 
 
-def deserialize_matrix(data, *, free=True, nthreads=None):
+def deserialize_matrix(data, T=None, *, free=True, nthreads=None):
     """Deserialize a Matrix from bytes.
 
+    If `T` is given, the serialized matrix must be of that GrB_Type, or
+    DomainMismatch is raised; this is checked while deserializing.  `T`
+    is required for matrices of user-defined types.
+
     The `free` argument is called when the object is garbage
     collected, the default is `matrix.matrix_free()`.  If `free` is None then
     there is no automatic garbage collection and it is up to the user
     to free the matrix.
+
+    `nthreads` is the maximum number of OpenMP threads used to decompress.
     """
     data = np.frombuffer(data, np.uint8)
-    desc = get_serialize_desc(None, nthreads)
     A = ffi.new("GrB_Matrix*")
-    check_status(
-        A,
-        lib.GxB_Matrix_deserialize(
+    with nthreads_context(nthreads):
+        check_status(
             A,
-            ffi.NULL,  # dtype; we don't check for now
-            ffi.from_buffer("void*", data),
-            data.nbytes,
-            ffi.NULL if desc is None else desc,
-        ),
-    )
+            lib.GxB_Matrix_deserialize(
+                A, ffi.NULL if T is None else T, ffi.from_buffer("void*", data), data.nbytes, NULL
+            ),
+        )
     if free:
         if callable(free):
             return ffi.gc(A, free)
@@ -113,27 +167,29 @@ def deserialize_matrix(data, *, free=True, nthreads=None):
     return A
 
 
-def deserialize_vector(data, *, free=True, nthreads=None):
+def deserialize_vector(data, T=None, *, free=True, nthreads=None):
     """Deserialize a Vector from bytes.
 
+    If `T` is given, the serialized vector must be of that GrB_Type, or
+    DomainMismatch is raised; this is checked while deserializing.  `T`
+    is required for vectors of user-defined types.
+
     The `free` argument is called when the object is garbage
     collected, the default is `vector.vector_free()`.  If `free` is None then
     there is no automatic garbage collection and it is up to the user
     to free the vector.
+
+    `nthreads` is the maximum number of OpenMP threads used to decompress.
     """
     data = np.frombuffer(data, np.uint8)
-    desc = get_serialize_desc(None, nthreads)
     v = ffi.new("GrB_Vector*")
-    check_status(
-        v,
-        lib.GxB_Vector_deserialize(
+    with nthreads_context(nthreads):
+        check_status(
             v,
-            ffi.NULL,  # dtype; we don't check for now
-            ffi.from_buffer("void*", data),
-            data.nbytes,
-            ffi.NULL if desc is None else desc,
-        ),
-    )
+            lib.GxB_Vector_deserialize(
+                v, ffi.NULL if T is None else T, ffi.from_buffer("void*", data), data.nbytes, NULL
+            ),
+        )
     if free:
         if callable(free):
             return ffi.gc(v, free)
@@ -141,4 +197,259 @@ def deserialize_vector(data, *, free=True, nthreads=None):
     return v
 
 
-from suitesparse_graphblas.api import matrix, vector  # noqa: E402 isort:skip
+# Size of the pieces in which `serialize_*_to` and `deserialize_*_from` write and read
+DEFAULT_CHUNK_SIZE = 1 << 24
+
+
+def _write_blob(data, file, chunk_size):
+    """Write `data` to a path or file object in chunks; return the number of bytes written."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as f:
+            return _write_blob(data, f, chunk_size)
+    view = memoryview(data)
+    for start in range(0, view.nbytes, chunk_size):
+        file.write(view[start : start + chunk_size])
+    return view.nbytes
+
+
+def _serialize_into(buffer, offset, bound, A):
+    """Serialize `A` into `buffer` at `offset` with `GrB_Matrix_serialize`; return the size."""
+    data = ffi.from_buffer(buffer)
+    try:
+        size = ffi.new("GrB_Index*", bound)
+        check_status(A, lib.GrB_Matrix_serialize(ffi.cast("char*", data) + offset, size, A[0]))
+    finally:
+        ffi.release(data)
+    return size[0]
+
+
+def _serialize_to(A, file, chunk_size):
+    """Serialize the matrix `A` to a path or file object without holding the blob in memory.
+
+    `GrB_Matrix_serializeSize` gives an upper bound of the size of the
+    blob, so `GrB_Matrix_serialize` writes it directly into a memory-map
+    of that much of the file, which is then truncated to the actual size.  The pages of the
+    mapping are written back to the file as needed.  File objects that
+    can't be mapped (such as compressed files, or files not opened for
+    reading too) get the blob through an anonymous mapping instead, which
+    is written out in chunks.  Returns the number of bytes written.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w+b") as f:
+            return _serialize_to(A, f, chunk_size)
+    bound = ffi.new("GrB_Index*")
+    check_status(A, lib.GrB_Matrix_serializeSize(bound, A[0]))
+    bound = bound[0]
+    raw = getattr(file, "raw", file)
+    if isinstance(raw, io.FileIO) and raw.readable() and raw.writable() and raw.seekable():
+        file.flush()
+        fd = file.fileno()
+        pos = file.tell()
+        end = os.fstat(fd).st_size
+        # Mappings start at a multiple of the allocation granularity
+        start = pos - pos % mmap.ALLOCATIONGRANULARITY
+        os.ftruncate(fd, max(end, pos + bound))
+        with mmap.mmap(fd, pos + bound - start, offset=start) as mm:
+            size = _serialize_into(mm, pos - start, bound, A)
+        os.ftruncate(fd, max(end, pos + size))
+        file.seek(pos + size)
+        return size
+    with mmap.mmap(-1, bound) as mm:
+        size = _serialize_into(mm, 0, bound, A)
+        with memoryview(mm) as view:
+            return _write_blob(view[:size], file, chunk_size)
+
+
+@contextmanager
+def _open_blob(source, chunk_size):
+    """Yield a buffer with the serialized object in `source`.
+
+    Paths are memory-mapped, buffers such as an `mmap.mmap` are used as is,
+    and file objects are read in chunks into a buffer of the size given by
+    the blob header.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+    elif not hasattr(source, "readinto"):
+        yield source
+    else:
+        # The blob starts with its total size
+        header = source.read(ffi.sizeof("size_t"))
+        size = int.from_bytes(header, sys.byteorder)
+        if len(header) < ffi.sizeof("size_t") or size < len(header):
+            raise ValueError("Not a serialized GraphBLAS object")
+        data = np.empty(size, np.uint8)
+        data[: len(header)] = np.frombuffer(header, np.uint8)
+        view = memoryview(data)
+        pos = len(header)
+        while pos < size:
+            nread = source.readinto(view[pos : pos + chunk_size])
+            if not nread:
+                raise ValueError(f"Expected {size} bytes of serialized data, got {pos}")
+            pos += nread
+        yield data
+
+
+def serialize_matrix_to(
+    A,
+    file,
+    compression=lib.GxB_COMPRESSION_DEFAULT,
+    level=None,
+    *,
+    nthreads=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    """Serialize a Matrix to a path or a writable file object.
+
+    With the default compression, GraphBLAS serializes directly into a
+    memory-map of the file, so the serialized blob is never allocated;
+    its pages belong to the file and are written back as needed.  This
+    requires a path or a file opened for reading and writing (such as
+    with mode "w+b"); other file objects get the blob through an
+    anonymous memory-map, written out in chunks of `chunk_size` bytes.
+    GraphBLAS still compresses the matrix into its own workspace first,
+    which takes about the compressed size.
+
+    Other compression methods (or levels) can only be chosen with
+    `GxB_Matrix_serialize`, which returns the whole blob in memory; it is
+    then written out in chunks.  Returns the number of bytes written.  See
+    `serialize_matrix` for the other arguments.
+    """
+    if get_serialize_desc(compression, level) is not None:
+        data = serialize_matrix(A, compression, level, nthreads=nthreads)
+        return _write_blob(data, file, chunk_size)
+    with nthreads_context(nthreads):
+        return _serialize_to(A, file, chunk_size)
+
+
+def serialize_vector_to(
+    v,
+    file,
+    compression=lib.GxB_COMPRESSION_DEFAULT,
+    level=None,
+    *,
+    nthreads=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    """Serialize a Vector to a path or a writable file object.
+
+    GraphBLAS has no call to serialize a vector into a given buffer, so the
+    blob is made by `GxB_Vector_serialize`, as in `serialize_vector`, and
+    written out in chunks of `chunk_size` bytes.  Returns the number of
+    bytes written.  See `serialize_matrix_to` for the other arguments.
+    """
+    data = serialize_vector(v, compression, level, nthreads=nthreads)
+    return _write_blob(data, file, chunk_size)
+
+
+def deserialize_matrix_from(
+    source, T=None, *, free=True, nthreads=None, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """Deserialize a Matrix from a path, a readable file object or a buffer such as an mmap.
+
+    Paths are memory-mapped, so the serialized data is never copied into
+    memory; it is paged in from the file as GraphBLAS reads it.  File
+    objects are read in chunks of `chunk_size` bytes into a single buffer.
+    See `deserialize_matrix` for `T`, `free` and `nthreads`.
+    """
+    with _open_blob(source, chunk_size) as data:
+        return deserialize_matrix(data, T, free=free, nthreads=nthreads)
+
+
+def deserialize_vector_from(
+    source, T=None, *, free=True, nthreads=None, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """Deserialize a Vector from a path, a readable file object or a buffer such as an mmap.
+
+    See `deserialize_matrix_from`.
+    """
+    with _open_blob(source, chunk_size) as data:
+        return deserialize_vector(data, T, free=free, nthreads=nthreads)
+
+
+def _serialized_get_int32(blob, size, field):
+    val = ffi.new("int32_t*")
+    info = lib.GxB_Serialized_get_INT32(blob, val, field, size)
+    if info != lib.GrB_SUCCESS:
+        raise _error_code_lookup.get(info, RuntimeError)(
+            f"GxB_Serialized_get_INT32 failed with info={info}"
+        )
+    return val[0]
+
+
+def _check_blob_header(data):
+    """Check the fixed header of the blob `data` before reading fields from it.
+
+    The header starts with the size of the blob (size_t), an int32 field and
+    the int32 `GxB_IMPLEMENTATION` that wrote it, followed by the int64
+    fields vlen, vdim, nvec, nvec_nonempty and nvals.  This layout is only
+    relied upon for blobs written by the same major version of
+    SuiteSparse:GraphBLAS as the one loaded.
+    """
+    if data.nbytes < 56:
+        raise ValueError("Not a serialized GraphBLAS object")
+    blob_size = int(np.frombuffer(data, np.uint64, count=1)[0])
+    if blob_size != data.nbytes:
+        raise ValueError(
+            f"Serialized object has {data.nbytes} bytes, but its header says {blob_size}"
+        )
+    version = int(np.frombuffer(data, np.int32, count=1, offset=12)[0])
+    if version // 1000000 != lib.GxB_IMPLEMENTATION_MAJOR:
+        raise ValueError(
+            f"Serialized object has version {version}; expected SuiteSparse:GraphBLAS "
+            f"version {lib.GxB_IMPLEMENTATION_MAJOR}.x"
+        )
+
+
+def serialized_info(data):
+    """Return the metadata of a serialized Matrix or Vector without deserializing it.
+
+    Only the uncompressed header of the blob is read, so this is cheap even
+    for very large objects.  Returns a `SerializedInfo` named tuple.  `type`
+    is the built-in GrB_Type, or None for user-defined types, in which case
+    `type_name` holds the name of the type.  Vectors are n-by-1.
+    """
+    data = np.frombuffer(data, np.uint8)
+    blob = ffi.from_buffer("void*", data)
+    size = data.nbytes
+    _check_blob_header(data)
+
+    type_name = ffi.new("char[]", lib.GxB_MAX_NAME_LEN)
+    info = lib.GxB_Serialized_get_String(blob, type_name, lib.GrB_EL_TYPE_STRING, size)
+    if info != lib.GrB_SUCCESS:
+        raise _error_code_lookup.get(info, RuntimeError)(
+            f"GxB_Serialized_get_String failed with info={info}"
+        )
+    type_name = ffi.string(type_name).decode()
+    T = ffi.new("GrB_Type*")
+    check_status(T, lib.GxB_Type_from_name(T, type_name.encode()))
+
+    format = _serialized_get_int32(blob, size, lib.GxB_FORMAT)
+    sparsity_status = _serialized_get_int32(blob, size, lib.GxB_SPARSITY_STATUS)
+    # The dimensions aren't available from GxB_Serialized_get, so read them from
+    # the fixed blob header (see `_check_blob_header`).
+    vlen, vdim, _, _, nvals = np.frombuffer(data, np.int64, count=5, offset=16).tolist()
+    if min(vlen, vdim, nvals) < 0:
+        raise ValueError("Not a serialized GraphBLAS object")
+    if format == lib.GxB_BY_ROW:
+        nrows, ncols = vdim, vlen
+    else:
+        nrows, ncols = vlen, vdim
+    if sparsity_status == lib.GxB_FULL:
+        # nvals isn't recorded for full matrices
+        nvals = nrows * ncols
+    return SerializedInfo(
+        type=None if T[0] == ffi.NULL else T[0],
+        type_name=type_name,
+        nrows=nrows,
+        ncols=ncols,
+        nvals=nvals,
+        format=format,
+        sparsity_status=sparsity_status,
+        sparsity_control=_serialized_get_int32(blob, size, lib.GxB_SPARSITY_CONTROL),
+        iso=bool(_serialized_get_int32(blob, size, lib.GxB_ISO)),
+    )
+
+
+from suitesparse_graphblas.api import context, matrix, vector  # noqa: E402 isort:skip
@@ -1,4 +1,21 @@
-from suitesparse_graphblas import _error_code_lookup, check_status, ffi, lib, supports_complex
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from suitesparse_graphblas import (
+    _error_code_lookup,
+    check_status,
+    ffi,
+    lib,
+    supports_complex,
+    utils,
+)
+
+from .grb_type import grb_type_size, grb_type_to_dtype
+from .matrix import matrix_export_hypercsc, matrix_export_hypercsr, matrix_type, matrix_wait
+from .utils import _output_array
+from .vector import vector_type
 
 
 def _check_info(info):
@@ -303,7 +320,10 @@ def row_iterator_next_col(it):
 
 
 def row_iterator_kseek(it, k):
-    """Seek the row iterator to the k-th entry in the current row.
+    """Seek the row iterator to the k-th row that it can visit.
+
+    `k` ranges from 0 to ``row_iterator_kount(it) - 1``; it equals the row
+    index unless the matrix is hypersparse.
 
     Returns ``lib.GrB_SUCCESS`` or ``lib.GxB_EXHAUSTED``.
     """
@@ -322,7 +342,7 @@ def row_iterator_get_col_index(it):
 
 
 def row_iterator_kount(it):
-    """Get the number of entries in the current row."""
+    """Get the number of rows the row iterator can visit (see `row_iterator_kseek`)."""
     return lib.GxB_rowIterator_kount(it[0])
 
 
@@ -393,7 +413,10 @@ def col_iterator_next_row(it):
 
 
 def col_iterator_kseek(it, k):
-    """Seek the column iterator to the k-th entry in the current column.
+    """Seek the column iterator to the k-th column that it can visit.
+
+    `k` ranges from 0 to ``col_iterator_kount(it) - 1``; it equals the
+    column index unless the matrix is hypersparse.
 
     Returns ``lib.GrB_SUCCESS`` or ``lib.GxB_EXHAUSTED``.
     """
@@ -412,7 +435,10 @@ def col_iterator_get_row_index(it):
 
 
 def col_iterator_kount(it):
-    """Get the number of entries in the current column."""
+    """Get the number of columns the column iterator can visit.
+
+    See `col_iterator_kseek`.
+    """
     return lib.GxB_colIterator_kount(it[0])
 
 
@@ -561,3 +587,274 @@ if supports_complex():
     def iterator_get_fc64(it):
         """Get the current fc64 value from the iterator."""
         return lib.GxB_Iterator_get_FC64(it[0])
+
+
+def iterator_get_udt(it, value):
+    """Copy the current value of the iterator into `value`.
+
+    `value` is a cdata pointer or a writable buffer (such as a NumPy
+    array) with room for one value of the type of the matrix or vector.
+    This works for every type, including user-defined types.
+    """
+    if not isinstance(value, ffi.CData):
+        value = ffi.from_buffer(value, require_writable=True)
+    lib.GxB_Iterator_get_UDT(it[0], value)
+
+
+# ---------------------------------------------------------------------------
+# Many entries at once
+# ---------------------------------------------------------------------------
+
+
+def _read_dtype(T, dtype):
+    """Return the dtype to read values of type `T` into, checking its size."""
+    if dtype is None:
+        try:
+            return grb_type_to_dtype(T)
+        except TypeError:
+            raise TypeError("dtype is required for user-defined types") from None
+    dtype = np.dtype(dtype)
+    size = grb_type_size(ffi.new("GrB_Type*", T))
+    if dtype.itemsize != size:
+        raise ValueError(f"dtype must have itemsize {size}; got {dtype} ({dtype.itemsize})")
+    return dtype
+
+
+def matrix_iterator_read(it, A, stop=None, *, dtype=None, out=None):
+    """Read the entries of a matrix entry iterator into NumPy arrays.
+
+    Starting at the current position of `it`, an entry iterator attached
+    to `A` and positioned by `matrix_iterator_seek`, the entries before
+    position `stop` (default: all remaining entries) are read in a single
+    compiled loop that does not hold the GIL.  Returns `(rows, cols,
+    values)` and leaves `it` at the next entry, if any.
+
+    The values are read as raw bytes into an array of `dtype`, which
+    defaults to the dtype of the type of `A`.  It may be any dtype of the
+    same size, so values of user-defined types can be read into NumPy
+    structured arrays.  See `matrix.matrix_extract_tuples_fp64` for
+    `out`; each output needs at least `stop - matrix_iterator_getp(it)`
+    elements.
+
+    >>> from suitesparse_graphblas import matrix
+    >>> A = matrix.matrix_new(lib.GxB_FC64, 100, 100)
+    >>> matrix.matrix_build(A, [0, 5, 9], [1, 2, 3], np.array([1j, 2, 3 + 4j]))
+    >>> it = iterator_new()
+    >>> matrix_iterator_attach(it, A) == matrix_iterator_seek(it, 0) == lib.GrB_SUCCESS
+    True
+    >>> rows, cols, values = matrix_iterator_read(it, A)
+    >>> rows.tolist(), cols.tolist(), values.tolist()
+    ([0, 5, 9], [1, 2, 3], [1j, (2+0j), (3+4j)])
+
+    Each entry of a user-defined pair of doubles as a structured array:
+
+    >>> from suitesparse_graphblas.api import grb_type
+    >>> T = grb_type.grb_type_new(16)
+    >>> A = matrix.matrix_new(T[0], 3, 3)
+    >>> edge = np.dtype([("weight", np.float64), ("length", np.float64)])
+    >>> value = np.array([(0.5, 2.0)], edge)
+    >>> info = lib.GrB_Matrix_setElement_UDT(A[0], ffi.from_buffer(value), 1, 2)
+    >>> matrix_iterator_attach(it, A) == matrix_iterator_seek(it, 0) == lib.GrB_SUCCESS
+    True
+    >>> _, _, values = matrix_iterator_read(it, A, dtype=edge)
+    >>> values["length"].tolist()
+    [2.0]
+
+    """
+    dtype = _read_dtype(matrix_type(A), dtype)
+    pmax = matrix_iterator_getpmax(it)
+    stop = pmax if stop is None else min(stop, pmax)
+    n = max(stop - matrix_iterator_getp(it), 0)
+    if out is None:
+        rows = np.empty(n, np.uint64)
+        cols = np.empty(n, np.uint64)
+        values = np.empty(n, dtype)
+    else:
+        rows, cols, values = out
+        rows = _output_array(rows, n, np.uint64, "rows")
+        cols = _output_array(cols, n, np.uint64, "cols")
+        values = _output_array(values, n, dtype, "values")
+    n = utils.matrix_iterator_read(it, stop, rows, cols, values, dtype.itemsize)
+    return tuple(None if x is None else x[:n] for x in (rows, cols, values))
+
+
+def vector_iterator_read(it, v, stop=None, *, dtype=None, out=None):
+    """Read the entries of a vector iterator into NumPy arrays `(indices, values)`.
+
+    See `matrix_iterator_read`.
+
+    >>> from suitesparse_graphblas import vector
+    >>> v = vector.vector_new(lib.GrB_INT16, 10)
+    >>> vector.vector_build(v, [7, 2], np.array([5, 6], np.int16))
+    >>> it = iterator_new()
+    >>> vector_iterator_attach(it, v) == vector_iterator_seek(it, 0) == lib.GrB_SUCCESS
+    True
+    >>> indices, values = vector_iterator_read(it, v)
+    >>> indices.tolist(), values.tolist()
+    ([2, 7], [6, 5])
+
+    """
+    dtype = _read_dtype(vector_type(v), dtype)
+    pmax = vector_iterator_getpmax(it)
+    stop = pmax if stop is None else min(stop, pmax)
+    n = max(stop - vector_iterator_getp(it), 0)
+    if out is None:
+        indices = np.empty(n, np.uint64)
+        values = np.empty(n, dtype)
+    else:
+        indices, values = out
+        indices = _output_array(indices, n, np.uint64, "indices")
+        values = _output_array(values, n, dtype, "values")
+    n = utils.vector_iterator_read(it, stop, indices, values, dtype.itemsize)
+    return tuple(None if x is None else x[:n] for x in (indices, values))
+
+
+# ---------------------------------------------------------------------------
+# Whole rows and columns as NumPy arrays
+# ---------------------------------------------------------------------------
+
+
+def _iter_vectors(export, A, copy):
+    # Export now rather than on the first call to `next`, so that `A` is
+    # emptied by `copy=False` even if the iterator is never used.
+    Ap, Ah, Ai, Ax, iso, _ = export(A, copy=copy)
+    if iso:
+        # A read-only view that repeats the single value
+        Ax = np.broadcast_to(Ax[:1], Ai.shape)
+    # Hypersparse matrices may keep a few empty vectors
+    nonempty = np.flatnonzero(Ap[1:] != Ap[:-1])
+
+    def vectors():
+        for index, start, stop in zip(Ah[nonempty], Ap[nonempty], Ap[nonempty + 1]):
+            yield int(index), Ai[start:stop], Ax[start:stop]
+
+    return vectors()
+
+
+def iter_rows(A, *, copy=True):
+    """Iterate over the non-empty rows of a matrix as NumPy arrays.
+
+    Yields `(row_index, col_indices, values)` for each row with entries, in
+    order, where `col_indices` and `values` are sorted by column and are
+    views into hypersparse CSR arrays of the whole matrix.  These arrays
+    are exported once by `matrix.matrix_export_hypercsr`, so iterating
+    costs no GraphBLAS calls per row or per entry.  By default a duplicate
+    of `A` is exported and `A` is unchanged; with `copy=False`, the entries
+    of `A` are moved into the arrays without copying, and `A` is empty as
+    soon as `iter_rows` returns.
+
+    >>> from suitesparse_graphblas import matrix
+    >>> A = matrix.matrix_new(lib.GrB_INT64, 3, 4)
+    >>> matrix.set_int64(A, 10, 0, 3)
+    >>> matrix.set_int64(A, 20, 2, 1)
+    >>> matrix.set_int64(A, 30, 2, 0)
+    >>> for row, cols, vals in iter_rows(A):
+    ...     print(row, cols.tolist(), vals.tolist())
+    0 [3] [10]
+    2 [0, 1] [30, 20]
+
+    """
+    return _iter_vectors(matrix_export_hypercsr, A, copy)
+
+
+def iter_cols(A, *, copy=True):
+    """Iterate over the non-empty columns of a matrix as NumPy arrays.
+
+    Yields `(col_index, row_indices, values)` for each column with entries.
+    See `iter_rows`.
+
+    >>> from suitesparse_graphblas import matrix
+    >>> A = matrix.matrix_new(lib.GrB_INT64, 3, 4)
+    >>> matrix.set_int64(A, 10, 0, 3)
+    >>> matrix.set_int64(A, 20, 2, 3)
+    >>> [(col, rows.tolist()) for col, rows, _ in iter_cols(A)]
+    [(3, [0, 2])]
+
+    """
+    return _iter_vectors(matrix_export_hypercsc, A, copy)
+
+
+# ---------------------------------------------------------------------------
+# Parallel iteration
+# ---------------------------------------------------------------------------
+
+
+def matrix_iterator_partition(A, nparts, *, rows=False, desc=None):
+    """Split the iteration over a matrix into `nparts` balanced ranges.
+
+    Returns a list of `(it, start, stop)`, one for each non-empty range,
+    where `it` is a new iterator attached to `A`.  By default these are
+    entry iterators for the positions from `start` up to `stop` (see
+    `matrix_iterator_getpmax`), so the ranges hold about the same number
+    of entries; start with `matrix_iterator_seek(it, start)`.  With
+    `rows=True`, they are row iterators for the `k` from `start` up to
+    `stop`; start with `row_iterator_kseek(it, start)`.  Row iterators
+    require `A` to be stored by row.
+
+    Pending work on `A` is finished first, so the iterators only read `A`
+    and may be used concurrently, one per thread, as long as `A` is not
+    modified.  See `matrix_iterate_parallel`.
+
+    >>> from suitesparse_graphblas import matrix
+    >>> A = matrix.matrix_new(lib.GrB_INT64, 100, 100)
+    >>> matrix.matrix_build_iso(A, [0, 1, 2, 2], [0, 1, 0, 2], 1)
+    >>> [(start, stop) for _, start, stop in matrix_iterator_partition(A, 2)]
+    [(0, 2), (2, 4)]
+
+    """
+    if nparts < 1:
+        raise ValueError(f"nparts must be at least 1; got {nparts}")
+    matrix_wait(A, lib.GrB_MATERIALIZE)
+    if rows:
+        attach, kount = row_iterator_attach, row_iterator_kount
+    else:
+        attach, kount = matrix_iterator_attach, matrix_iterator_getpmax
+    parts = []
+    it = iterator_new()
+    attach(it, A, desc)
+    pmax = kount(it)
+    nparts = min(nparts, pmax)
+    for t in range(nparts):
+        start = pmax * t // nparts
+        stop = pmax * (t + 1) // nparts
+        if t > 0:
+            it = iterator_new()
+            attach(it, A, desc)
+        parts.append((it, start, stop))
+    return parts
+
+
+def matrix_iterate_parallel(A, func, nparts=None, *, rows=False, max_workers=None, desc=None):
+    """Call `func(it, start, stop)` on balanced parts of a matrix in a thread pool.
+
+    The matrix is split by `matrix_iterator_partition` into `nparts` parts
+    (default: one per worker), and each part is handled by one of up to
+    `max_workers` threads (default: one per CPU) with its own iterator.
+    `func` should seek `it` to `start` and visit the entries while
+    `matrix_iterator_getp(it)` is less than `stop` (or, with `rows=True`,
+    the `stop - start` rows from `row_iterator_kseek(it, start)`).
+    Returns the results of `func` in order.
+
+    GraphBLAS calls release the GIL, but the threads only run Python code
+    concurrently with free-threaded Python.
+
+    >>> from suitesparse_graphblas import matrix
+    >>> A = matrix.matrix_new(lib.GrB_INT64, 100, 100)
+    >>> matrix.matrix_build_iso(A, list(range(100)), list(range(100)), 2)
+    >>> def total(it, start, stop):
+    ...     result = 0
+    ...     info = matrix_iterator_seek(it, start)
+    ...     while info == lib.GrB_SUCCESS and matrix_iterator_getp(it) < stop:
+    ...         result += iterator_get_int64(it)
+    ...         info = matrix_iterator_next(it)
+    ...     return result
+    >>> sum(matrix_iterate_parallel(A, total, 4))
+    200
+
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    parts = matrix_iterator_partition(A, nparts or max_workers, rows=rows, desc=desc)
+    if len(parts) <= 1:
+        return [func(*part) for part in parts]
+    with ThreadPoolExecutor(min(len(parts), max_workers)) as pool:
+        return list(pool.map(lambda part: func(*part), parts))
@@ -3,11 +3,30 @@
 import numpy as np
 
 from suitesparse_graphblas import check_status, ffi, lib, supports_complex
+from suitesparse_graphblas.utils import claim_buffer, claim_buffer_2d
 
+from .container import container_new
+from .grb_type import grb_type_from_dtype, grb_type_to_dtype
+from .scalar import scalar_from_value
 from .utils import _capture_c_output  # noqa: F401
+from .utils import (
+    _check_indices,
+    _compiled,
+    _detach,
+    _index_type,
+    _load_array,
+    _owned_array,
+    _owned_index_array,
+    _output_array,
+    _ptr,
+    _unload_array,
+)
+from .vector import _array_vector, _contiguous_1d, _index_array, vector_new
 
 from .io.serialize import deserialize_matrix as deserialize  # noqa: F401
+from .io.serialize import deserialize_matrix_from as deserialize_from  # noqa: F401
 from .io.serialize import serialize_matrix as serialize  # noqa: F401
+from .io.serialize import serialize_matrix_to as serialize_to  # noqa: F401
 
 
 def matrix_free(A):
@@ -15,7 +34,15 @@ def matrix_free(A):
     check_status(A, lib.GrB_Matrix_free(A))
 
 
-def matrix_new(T, nrows=lib.GxB_INDEX_MAX, ncols=lib.GxB_INDEX_MAX, *, free=matrix_free):
+def matrix_new(
+    T,
+    nrows=lib.GxB_INDEX_MAX,
+    ncols=lib.GxB_INDEX_MAX,
+    *,
+    free=matrix_free,
+    index_bits=None,
+    offset_bits=None,
+):
     """Create a new `GrB_Matrix` of type `T` and initialize it.  The
     following example creates an eight bit unsigned 2x2 matrix:
 
@@ -35,11 +62,17 @@ def matrix_new(T, nrows=lib.GxB_INDEX_MAX, ncols=lib.GxB_INDEX_MAX, *, free=matr
     there is no automatic garbage collection and it is up to the user
     to free the matrix.
 
+    `index_bits` and `offset_bits` (32 or 64) set the size of the
+    integers the matrix should use for its indices and offsets; see
+    `matrix_set_integer_bits`.
+
     """
     A = ffi.new("GrB_Matrix*")
     check_status(A, lib.GrB_Matrix_new(A, T, nrows, ncols))
     if free:
-        return ffi.gc(A, free)
+        A = ffi.gc(A, free)
+    if index_bits is not None or offset_bits is not None:
+        matrix_set_integer_bits(A, index_bits, offset_bits)
     return A
 
 
@@ -69,6 +102,9 @@ def matrix_nrows(A):
     return n[0]
 
 
+matrix_nrows = _compiled("matrix_nrows", matrix_nrows)
+
+
 def matrix_ncols(A):
     """Return the number of columns in the matrix.
 
@@ -82,6 +118,9 @@ def matrix_ncols(A):
     return n[0]
 
 
+matrix_ncols = _compiled("matrix_ncols", matrix_ncols)
+
+
 def matrix_nvals(A):
     """Return the number of stored elements in the matrix.
 
@@ -95,6 +134,9 @@ def matrix_nvals(A):
     return n[0]
 
 
+matrix_nvals = _compiled("matrix_nvals", matrix_nvals)
+
+
 def matrix_shape(A):
     """Return the shape of the matrix as a two tuple `(nrows, ncols)`
 
@@ -182,6 +224,68 @@ def matrix_set_bitmap_switch(A, bitmap_switch):
     check_status(A, lib.GxB_Matrix_Option_set_FP64(A[0], lib.GxB_BITMAP_SWITCH, bitmap_switch))
 
 
+def matrix_integer_bits(A):
+    """Return the sizes in bits of the integers used by the matrix.
+
+    Returns `(rowindex_bits, colindex_bits, offset_bits)`, each 32 or 64.
+    Row and column indices appear in the `Ah` and `Ai` arrays exported by
+    `matrix_export_csr` and friends, and offsets in the `Ap` array.
+    SuiteSparse:GraphBLAS uses 32-bit integers whenever they are large
+    enough, unless told otherwise with `matrix_set_integer_bits`.
+
+    >>> A = matrix_new(lib.GrB_FP64, 10, 10, index_bits=64)
+    >>> matrix_build(A, [2], [3], np.array([1.0]))
+    >>> matrix_integer_bits(A)
+    (64, 64, 32)
+
+    """
+    bits = ffi.new("int32_t*")
+    result = []
+    for field in (
+        lib.GxB_ROWINDEX_INTEGER_BITS,
+        lib.GxB_COLINDEX_INTEGER_BITS,
+        lib.GxB_OFFSET_INTEGER_BITS,
+    ):
+        check_status(A, lib.GrB_Matrix_get_INT32(A[0], bits, field))
+        result.append(bits[0])
+    return tuple(result)
+
+
+def matrix_set_integer_bits(A, index_bits=None, offset_bits=None):
+    """Set the preferred size in bits (32 or 64) of the integers of the matrix.
+
+    `index_bits` applies to row and column indices and `offset_bits` to
+    offsets, and None leaves a setting unchanged.  These are hints:
+    GraphBLAS uses 64-bit integers if 32 bits are not enough, and the
+    first entries added to an empty matrix by `set_fp64` and the like are
+    assembled with the global setting.  A matrix with entries is converted
+    immediately.
+
+    Bulk input and output use the integer sizes of the matrix, so that
+    `matrix_export_csr` of a matrix using 32-bit integers returns uint32
+    arrays, which take half the memory of uint64 arrays.
+
+    >>> A = matrix_new(lib.GrB_FP64, 10, 10)
+    >>> set_fp64(A, 1.0, 2, 3)
+    >>> matrix_set_integer_bits(A, 64, 64)
+    >>> matrix_integer_bits(A)
+    (64, 64, 64)
+
+    """
+    # Assemble any pending entries first so that they are converted too
+    check_status(A, lib.GrB_Matrix_wait(A[0], lib.GrB_MATERIALIZE))
+    for bits, fields in (
+        (index_bits, (lib.GxB_ROWINDEX_INTEGER_HINT, lib.GxB_COLINDEX_INTEGER_HINT)),
+        (offset_bits, (lib.GxB_OFFSET_INTEGER_HINT,)),
+    ):
+        if bits is None:
+            continue
+        if bits not in {32, 64}:
+            raise ValueError(f"Integer sizes must be 32 or 64 bits; got {bits}")
+        for field in fields:
+            check_status(A, lib.GrB_Matrix_set_INT32(A[0], bits, field))
+
+
 def matrix_option_get_int32(A, field):
     """Get a matrix option as an int32.
 
@@ -845,6 +949,104 @@ def matrix_row_assign(C, u, i, cols, ncols, mask=None, accum=None, desc=None):
     ))
 
 
+def matrix_build(C, rows, cols, vals, dup=None):
+    """Build a matrix from NumPy arrays of row indices, column indices and values.
+
+    The index arrays may be of any integer dtype and the values of any
+    dtype with a GraphBLAS type; they are passed to
+    `GxB_Matrix_build_Vector` without copying, and GraphBLAS uses 32-bit
+    indices directly.  Duplicate entries are combined with the binary
+    operator `dup`, or are an error if `dup` is None.  Unlike
+    `matrix_build_fp64` and the other typed functions, index arrays need
+    not be converted to uint64 first.
+
+    >>> C = matrix_new(lib.GrB_INT64, 3, 3)
+    >>> rows = np.array([0, 2, 2], np.int32)
+    >>> cols = np.array([1, 0, 0], np.int32)
+    >>> matrix_build(C, rows, cols, np.array([1, 2, 3]), lib.GrB_PLUS_INT64)
+    >>> matrix_nvals(C), get_int64(C, 2, 0)
+    (2, 5)
+
+    """
+    rows = _index_array(rows, "rows")
+    cols = _index_array(cols, "cols")
+    vals = _contiguous_1d(vals, "vals")
+    if not rows.size == cols.size == vals.size:
+        raise ValueError(
+            "rows, cols and vals must have the same length; "
+            f"got {rows.size}, {cols.size} and {vals.size}"
+        )
+    if vals.size == 0:
+        return
+    with _array_vector(rows) as Iv, _array_vector(cols) as Jv, _array_vector(vals) as Xv:
+        check_status(C, lib.GxB_Matrix_build_Vector(
+            C[0], Iv[0], Jv[0], Xv[0], ffi.NULL if dup is None else dup, ffi.NULL
+        ))
+
+
+def matrix_build_iso(C, rows, cols, value):
+    """Build an iso-valued matrix from NumPy arrays of row and column indices.
+
+    Every entry gets `value`, a `GrB_Scalar` or a value converted to the
+    type of `C`.  The matrix is built by `GxB_Matrix_build_Scalar_Vector`,
+    so no array of values is made or sorted and the matrix stores a single
+    value from the start, as suits the adjacency matrix of an unweighted
+    graph.  Duplicate entries are kept once.  See `matrix_build` for the
+    index arrays.
+
+    >>> C = matrix_new(lib.GrB_BOOL, 3, 3)
+    >>> matrix_build_iso(C, np.array([0, 2, 2], np.int32), np.array([1, 0, 0], np.int32), True)
+    >>> matrix_nvals(C), get_bool(C, 2, 0)
+    (2, True)
+
+    """
+    rows = _index_array(rows, "rows")
+    cols = _index_array(cols, "cols")
+    if rows.size != cols.size:
+        raise ValueError(
+            f"rows and cols must have the same length; got {rows.size} and {cols.size}"
+        )
+    if not isinstance(value, ffi.CData):
+        value = scalar_from_value(matrix_type(C), value)
+    if rows.size == 0:
+        return
+    with _array_vector(rows) as Iv, _array_vector(cols) as Jv:
+        check_status(C, lib.GxB_Matrix_build_Scalar_Vector(
+            C[0], Iv[0], Jv[0], value[0], ffi.NULL
+        ))
+
+
+def matrix_extract_tuples(A):
+    """Extract all entries of a matrix as NumPy arrays `(rows, cols, vals)`.
+
+    The entries are extracted by `GxB_Matrix_extractTuples_Vector`, which
+    returns row indices as uint32 if there are fewer than 2**31 rows, and
+    likewise for column indices, and uint64 otherwise; `vals` has the
+    dtype of the matrix type.  Unlike `matrix_extract_tuples_fp64` and the
+    other typed functions, indices are not widened to uint64, which halves
+    the memory they take.
+
+    >>> A = matrix_new(lib.GrB_FP64, 2, 3)
+    >>> matrix_build(A, [1, 0], [2, 1], np.array([1.5, 2.5]))
+    >>> rows, cols, vals = matrix_extract_tuples(A)
+    >>> rows.tolist(), cols.tolist(), vals.tolist()
+    ([0, 1], [1, 2], [2.5, 1.5])
+
+    """
+    T = matrix_type(A)
+    # Check the type before extracting anything
+    grb_type_to_dtype(T)
+    Iv = vector_new(lib.GrB_UINT64, 0)
+    Jv = vector_new(lib.GrB_UINT64, 0)
+    Xv = vector_new(T, 0)
+    check_status(A, lib.GxB_Matrix_extractTuples_Vector(Iv[0], Jv[0], Xv[0], A[0], ffi.NULL))
+    return (
+        _unload_array(Iv[0], unsigned=True),
+        _unload_array(Jv[0], unsigned=True),
+        _unload_array(Xv[0]),
+    )
+
+
 def matrix_build_bool(C, rows, cols, vals, nvals, dup):
     """Build a matrix from COO arrays of boolean values.
 
@@ -1076,10 +1278,35 @@ def matrix_build_fp64(C, rows, cols, vals, nvals, dup):
     ))
 
 
-def matrix_extract_tuples_int64(A):
+def _extract_tuples(A, extract, ctype, dtype, out):
+    """Extract the tuples of `A` with `extract`, a `GrB_Matrix_extractTuples_*` function.
+
+    `ctype` and `dtype` are the C and NumPy types of the values.  See
+    `matrix_extract_tuples_fp64` for `out`.
+    """
+    n = matrix_nvals(A)
+    if out is None:
+        rows = np.empty(n, dtype=np.uint64)
+        cols = np.empty(n, dtype=np.uint64)
+        vals = np.empty(n, dtype=dtype)
+    else:
+        rows, cols, vals = out
+        rows = _output_array(rows, n, np.uint64, "rows")
+        cols = _output_array(cols, n, np.uint64, "cols")
+        vals = _output_array(vals, n, dtype, "vals")
+    nvals_p = ffi.new("GrB_Index*", n)
+    if n > 0:
+        check_status(A, extract(
+            _ptr("GrB_Index*", rows), _ptr("GrB_Index*", cols), _ptr(ctype, vals), nvals_p, A[0]
+        ))
+    return rows, cols, vals
+
+
+def matrix_extract_tuples_int64(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_INT64, 2, 2)
     >>> set_int64(A, 42, 0, 0)
@@ -1090,22 +1317,10 @@ def matrix_extract_tuples_int64(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.int64)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_INT64(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("int64_t*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_INT64, "int64_t*", np.int64, out)
 
 
-def matrix_extract_tuples_fp64(A):
+def matrix_extract_tuples_fp64(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
     Returns (rows, cols, vals) as numpy arrays.
@@ -1118,25 +1333,26 @@ def matrix_extract_tuples_fp64(A):
     >>> float(vals[0]) == 1.5
     True
 
+    To reuse arrays, for example when extracting many matrices in a loop,
+    pass `out=(rows, cols, vals)`: uint64 arrays for the indices and an
+    array of the value dtype, each with at least `matrix_nvals(A)`
+    elements.  Views of their first `matrix_nvals(A)` elements are
+    returned.  An output given as None is neither allocated nor filled, as
+    GraphBLAS is passed NULL for it, and None is returned in its place:
+
+    >>> vals = np.empty(10)
+    >>> _, _, v = matrix_extract_tuples_fp64(A, out=(None, None, vals))
+    >>> v.tolist(), v.base is vals
+    ([1.5], True)
+
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.float64)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_FP64(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("double*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_FP64, "double*", np.float64, out)
 
-def matrix_extract_tuples_bool(A):
+def matrix_extract_tuples_bool(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_BOOL, 2, 2)
     >>> set_bool(A, True, 0, 0)
@@ -1147,24 +1363,13 @@ def matrix_extract_tuples_bool(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.bool_)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_BOOL(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("bool*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_BOOL, "bool*", np.bool_, out)
 
-def matrix_extract_tuples_int8(A):
+def matrix_extract_tuples_int8(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_INT8, 2, 2)
     >>> set_int8(A, 7, 0, 0)
@@ -1175,24 +1380,13 @@ def matrix_extract_tuples_int8(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.int8)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_INT8(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("int8_t*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_INT8, "int8_t*", np.int8, out)
 
-def matrix_extract_tuples_int16(A):
+def matrix_extract_tuples_int16(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_INT16, 2, 2)
     >>> set_int16(A, 7, 0, 0)
@@ -1203,24 +1397,13 @@ def matrix_extract_tuples_int16(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.int16)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_INT16(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("int16_t*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_INT16, "int16_t*", np.int16, out)
 
-def matrix_extract_tuples_int32(A):
+def matrix_extract_tuples_int32(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_INT32, 2, 2)
     >>> set_int32(A, 7, 0, 0)
@@ -1231,24 +1414,13 @@ def matrix_extract_tuples_int32(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.int32)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_INT32(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("int32_t*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_INT32, "int32_t*", np.int32, out)
 
-def matrix_extract_tuples_uint8(A):
+def matrix_extract_tuples_uint8(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_UINT8, 2, 2)
     >>> set_uint8(A, 7, 0, 0)
@@ -1259,24 +1431,13 @@ def matrix_extract_tuples_uint8(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.uint8)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_UINT8(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("uint8_t*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_UINT8, "uint8_t*", np.uint8, out)
 
-def matrix_extract_tuples_uint16(A):
+def matrix_extract_tuples_uint16(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_UINT16, 2, 2)
     >>> set_uint16(A, 7, 0, 0)
@@ -1287,24 +1448,13 @@ def matrix_extract_tuples_uint16(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.uint16)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_UINT16(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("uint16_t*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_UINT16, "uint16_t*", np.uint16, out)
 
-def matrix_extract_tuples_uint32(A):
+def matrix_extract_tuples_uint32(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_UINT32, 2, 2)
     >>> set_uint32(A, 7, 0, 0)
@@ -1315,24 +1465,13 @@ def matrix_extract_tuples_uint32(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.uint32)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_UINT32(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("uint32_t*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_UINT32, "uint32_t*", np.uint32, out)
 
-def matrix_extract_tuples_uint64(A):
+def matrix_extract_tuples_uint64(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_UINT64, 2, 2)
     >>> set_uint64(A, 7, 0, 0)
@@ -1343,24 +1482,13 @@ def matrix_extract_tuples_uint64(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.uint64)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_UINT64(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("uint64_t*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_UINT64, "uint64_t*", np.uint64, out)
 
-def matrix_extract_tuples_fp32(A):
+def matrix_extract_tuples_fp32(A, out=None):
     """Extract all tuples from a matrix as numpy arrays.
 
-    Returns (rows, cols, vals) as numpy arrays.
+    Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+    for `out`.
 
     >>> A = matrix_new(lib.GrB_FP32, 2, 2)
     >>> set_fp32(A, 1.5, 0, 0)
@@ -1371,19 +1499,7 @@ def matrix_extract_tuples_fp32(A):
     True
 
     """
-    n = matrix_nvals(A)
-    rows = np.empty(n, dtype=np.uint64)
-    cols = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.float32)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(A, lib.GrB_Matrix_extractTuples_FP32(
-            ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-            ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-            ffi.cast("float*", ffi.from_buffer(vals)),
-            nvals_p, A[0],
-        ))
-    return rows, cols, vals
+    return _extract_tuples(A, lib.GrB_Matrix_extractTuples_FP32, "float*", np.float32, out)
 
 
 def set_bool(A, value, i, j):
@@ -1672,6 +1788,9 @@ def get_fp64(A, i, j):
     return value[0]
 
 
+get_fp64 = _compiled("matrix_get_fp64", get_fp64)
+
+
 if supports_complex():
 
     def set_fc32(A, value, i, j):
@@ -1742,10 +1861,11 @@ if supports_complex():
             nvals, dup,
         ))
 
-    def matrix_extract_tuples_fc32(A):
+    def matrix_extract_tuples_fc32(A, out=None):
         """Extract all tuples from a matrix as numpy arrays.
 
-        Returns (rows, cols, vals) as numpy arrays.
+        Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+        for `out`.
 
         >>> A = matrix_new(lib.GxB_FC32, 2, 2)
         >>> set_fc32(A, 2+3j, 0, 0)
@@ -1756,19 +1876,9 @@ if supports_complex():
         True
 
         """
-        n = matrix_nvals(A)
-        rows = np.empty(n, dtype=np.uint64)
-        cols = np.empty(n, dtype=np.uint64)
-        vals = np.empty(n, dtype=np.complex64)
-        nvals_p = ffi.new("GrB_Index*", n)
-        if n > 0:
-            check_status(A, lib.GxB_Matrix_extractTuples_FC32(
-                ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-                ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-                ffi.cast("GxB_FC32_t*", ffi.from_buffer(vals)),
-                nvals_p, A[0],
-            ))
-        return rows, cols, vals
+        return _extract_tuples(
+            A, lib.GxB_Matrix_extractTuples_FC32, "GxB_FC32_t*", np.complex64, out
+        )
 
     def matrix_build_fc64(C, rows, cols, vals, nvals, dup):
         """Build a matrix from COO arrays of fc64 values.
@@ -1790,10 +1900,11 @@ if supports_complex():
             nvals, dup,
         ))
 
-    def matrix_extract_tuples_fc64(A):
+    def matrix_extract_tuples_fc64(A, out=None):
         """Extract all tuples from a matrix as numpy arrays.
 
-        Returns (rows, cols, vals) as numpy arrays.
+        Returns (rows, cols, vals) as numpy arrays.  See `matrix_extract_tuples_fp64`
+        for `out`.
 
         >>> A = matrix_new(lib.GxB_FC64, 2, 2)
         >>> set_fc64(A, 2+3j, 0, 0)
@@ -1804,16 +1915,768 @@ if supports_complex():
         True
 
         """
-        n = matrix_nvals(A)
-        rows = np.empty(n, dtype=np.uint64)
-        cols = np.empty(n, dtype=np.uint64)
-        vals = np.empty(n, dtype=np.complex128)
-        nvals_p = ffi.new("GrB_Index*", n)
-        if n > 0:
-            check_status(A, lib.GxB_Matrix_extractTuples_FC64(
-                ffi.cast("GrB_Index*", ffi.from_buffer(rows)),
-                ffi.cast("GrB_Index*", ffi.from_buffer(cols)),
-                ffi.cast("GxB_FC64_t*", ffi.from_buffer(vals)),
-                nvals_p, A[0],
-            ))
-        return rows, cols, vals
+        return _extract_tuples(
+            A, lib.GxB_Matrix_extractTuples_FC64, "GxB_FC64_t*", np.complex128, out
+        )
+
+
+# The typed extract_tuples functions by the dtype of their values
+_tuple_extractors = {
+    np.dtype(np.bool_): matrix_extract_tuples_bool,
+    np.dtype(np.int8): matrix_extract_tuples_int8,
+    np.dtype(np.int16): matrix_extract_tuples_int16,
+    np.dtype(np.int32): matrix_extract_tuples_int32,
+    np.dtype(np.int64): matrix_extract_tuples_int64,
+    np.dtype(np.uint8): matrix_extract_tuples_uint8,
+    np.dtype(np.uint16): matrix_extract_tuples_uint16,
+    np.dtype(np.uint32): matrix_extract_tuples_uint32,
+    np.dtype(np.uint64): matrix_extract_tuples_uint64,
+    np.dtype(np.float32): matrix_extract_tuples_fp32,
+    np.dtype(np.float64): matrix_extract_tuples_fp64,
+}
+if supports_complex():
+    _tuple_extractors[np.dtype(np.complex64)] = matrix_extract_tuples_fc32
+    _tuple_extractors[np.dtype(np.complex128)] = matrix_extract_tuples_fc64
+
+
+# ---------------------------------------------------------------------------
+# Many elements at once
+# ---------------------------------------------------------------------------
+
+# The FIRST operators by the dtype of their type, for `matrix_get_many`
+_first_ops = {
+    np.dtype(np.bool_): lib.GrB_FIRST_BOOL,
+    np.dtype(np.int8): lib.GrB_FIRST_INT8,
+    np.dtype(np.int16): lib.GrB_FIRST_INT16,
+    np.dtype(np.int32): lib.GrB_FIRST_INT32,
+    np.dtype(np.int64): lib.GrB_FIRST_INT64,
+    np.dtype(np.uint8): lib.GrB_FIRST_UINT8,
+    np.dtype(np.uint16): lib.GrB_FIRST_UINT16,
+    np.dtype(np.uint32): lib.GrB_FIRST_UINT32,
+    np.dtype(np.uint64): lib.GrB_FIRST_UINT64,
+    np.dtype(np.float32): lib.GrB_FIRST_FP32,
+    np.dtype(np.float64): lib.GrB_FIRST_FP64,
+}
+if supports_complex():
+    _first_ops[np.dtype(np.complex64)] = lib.GxB_FIRST_FC32
+    _first_ops[np.dtype(np.complex128)] = lib.GxB_FIRST_FC64
+
+
+def matrix_get_many(A, rows, cols, default=0):
+    """Get the elements of a matrix at many positions at once.
+
+    Returns `(values, present)`: NumPy arrays of the values of
+    `A[rows[k], cols[k]]`, or `default` where `A` has no entry, and of
+    whether `A` has an entry there.  The values have the dtype of the
+    matrix type.  Rather than one `get_fp64` call (and one `ffi.new`) per
+    element, the distinct positions are built into a pattern matrix `P`
+    and the entries of `A` there are found by one `GrB_Matrix_eWiseMult`
+    under the structural mask `P`, which only visits the entries of `P`.
+    The work is thus bounded by the number of positions, however many
+    entries their rows hold.  Positions may repeat.
+
+    >>> A = matrix_new(lib.GrB_INT64, 3, 3)
+    >>> matrix_build(A, [0, 2], [1, 2], np.array([10, 20]))
+    >>> values, present = matrix_get_many(A, [2, 0, 1, 2], [2, 1, 1, 2], default=-1)
+    >>> values.tolist(), present.tolist()
+    ([20, 10, -1, 20], [True, True, False, True])
+
+    """
+    rows = _index_array(rows, "rows")
+    cols = _index_array(cols, "cols")
+    if rows.size != cols.size:
+        raise ValueError(
+            f"rows and cols must have the same length; got {rows.size} and {cols.size}"
+        )
+    T = matrix_type(A)
+    dtype = grb_type_to_dtype(T)
+    values = np.full(rows.size, default, dtype)
+    present = np.zeros(rows.size, dtype=np.bool_)
+    if rows.size == 0:
+        return values, present
+    # Key the positions by the numbers of their distinct rows and columns,
+    # which fit in 64 bits together unlike the indices themselves
+    unique_rows, row_numbers = np.unique(rows, return_inverse=True)
+    unique_cols, col_numbers = np.unique(cols, return_inverse=True)
+    ncols_seen = unique_cols.size
+    keys = row_numbers.astype(np.int64) * ncols_seen + col_numbers
+    unique_keys, positions = np.unique(keys, return_inverse=True)
+    nrows, ncols = matrix_shape(A)
+    P = matrix_new(lib.GrB_BOOL, nrows, ncols)
+    matrix_build_iso(
+        P, unique_rows[unique_keys // ncols_seen], unique_cols[unique_keys % ncols_seen], True
+    )
+    C = matrix_new(T, nrows, ncols)
+    check_status(C, lib.GrB_Matrix_eWiseMult_BinaryOp(
+        C[0], P[0], ffi.NULL, _first_ops[dtype], A[0], P[0], lib.GrB_DESC_S
+    ))
+    i, j, vals = matrix_extract_tuples(C)
+    found = np.searchsorted(
+        unique_keys,
+        np.searchsorted(unique_rows, i).astype(np.int64) * ncols_seen
+        + np.searchsorted(unique_cols, j),
+    )
+    unique_values = np.full(unique_keys.size, default, dtype)
+    unique_values[found] = vals
+    unique_present = np.zeros(unique_keys.size, np.bool_)
+    unique_present[found] = True
+    return unique_values[positions], unique_present[positions]
+
+
+def matrix_set_many(A, rows, cols, vals):
+    """Set the elements of a matrix at many positions at once.
+
+    Sets `A[rows[k], cols[k]] = vals[k]` for every `k`, leaving the other
+    entries of `A` as they are.  `vals` may also be a single value for
+    every position.  The elements are built into a new matrix by
+    `matrix_build` (or `matrix_build_iso`) and assigned to `A` under its
+    own structure in one `GrB_Matrix_assign` call, instead of one
+    `set_fp64` call per element.  The last value given for a position
+    wins.
+
+    >>> A = matrix_new(lib.GrB_FP64, 2, 3)
+    >>> set_fp64(A, 1.0, 0, 0)
+    >>> matrix_set_many(A, [1, 0, 1], [2, 1, 2], np.array([2.0, 3.0, 4.0]))
+    >>> matrix_nvals(A), get_fp64(A, 0, 0), get_fp64(A, 1, 2)
+    (3, 1.0, 4.0)
+
+    """
+    nrows, ncols = matrix_shape(A)
+    B = matrix_new(matrix_type(A), nrows, ncols)
+    if np.ndim(vals) == 0:
+        matrix_build_iso(B, rows, cols, vals)
+    else:
+        matrix_build(B, rows, cols, vals, lib.GxB_IGNORE_DUP)
+    check_status(A, lib.GrB_Matrix_assign(
+        A[0], B[0], ffi.NULL, B[0], lib.GrB_ALL, nrows, lib.GrB_ALL, ncols, lib.GrB_DESC_S
+    ))
+
+
+def matrix_iter_tuples(A, block_rows=1 << 16, dtype=None):
+    """Iterate over the entries of a matrix in blocks of rows.
+
+    Yields `(rows, cols, vals)` NumPy arrays holding the entries of each
+    block of `block_rows` rows that has any, in row order, so a matrix too
+    large to extract at once can be streamed to a writer with memory
+    bounded by the largest block.  Each block is extracted by
+    `GrB_Matrix_extract` into one reused matrix and then by
+    `matrix_extract_tuples_fp64` (or the function for `dtype`) into one
+    set of reused arrays, which only grow when a block has more entries
+    than any before it.  The yielded arrays are views of those buffers
+    and are overwritten by the next block, so copy them to keep them.
+    Indices are uint64, and values are converted to `dtype` (by default,
+    the dtype of the matrix type).
+
+    Blocks of rows are cheap to extract from matrices stored by row, the
+    default; a matrix stored by column is scanned whole for every block.
+
+    >>> A = matrix_new(lib.GrB_INT32, 5, 3)
+    >>> matrix_build(A, [0, 1, 4], [2, 0, 1], np.array([7, 8, 9], np.int32))
+    >>> for rows, cols, vals in matrix_iter_tuples(A, block_rows=2, dtype=np.float64):
+    ...     print(rows.tolist(), cols.tolist(), vals.tolist())
+    [0, 1] [2, 0] [7.0, 8.0]
+    [4] [1] [9.0]
+
+    """
+    if block_rows < 1:
+        raise ValueError(f"block_rows must be positive; got {block_rows}")
+    T = matrix_type(A)
+    dtype = grb_type_to_dtype(T) if dtype is None else np.dtype(dtype)
+    extract_tuples = _tuple_extractors.get(dtype)
+    if extract_tuples is None:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    nrows, ncols = matrix_shape(A)
+    check_status(A, lib.GrB_Matrix_wait(A[0], lib.GrB_MATERIALIZE))
+    B = matrix_new(T, min(block_rows, nrows), ncols)
+    row_range = ffi.new("GrB_Index[2]")
+    out = (np.empty(0, np.uint64), np.empty(0, np.uint64), np.empty(0, dtype))
+    for start in range(0, nrows, block_rows):
+        stop = min(start + block_rows, nrows)
+        if stop - start != matrix_nrows(B):
+            check_status(B, lib.GrB_Matrix_resize(B[0], stop - start, ncols))
+        row_range[0] = start
+        row_range[1] = stop - 1
+        check_status(B, lib.GrB_Matrix_extract(
+            B[0], ffi.NULL, ffi.NULL, A[0], row_range, lib.GxB_RANGE, lib.GrB_ALL, ncols, ffi.NULL
+        ))
+        n = matrix_nvals(B)
+        if n == 0:
+            continue
+        if n > out[0].size:
+            out = (np.empty(n, np.uint64), np.empty(n, np.uint64), np.empty(n, dtype))
+        rows, cols, vals = extract_tuples(B, out=out)
+        rows += np.uint64(start)
+        yield rows, cols, vals
+
+
+# ---------------------------------------------------------------------------
+# Dense and bitmap NumPy arrays
+# ---------------------------------------------------------------------------
+
+
+def matrix_from_dense(array, *, take_ownership=False, free=matrix_free):
+    """Create a full matrix from a 2D NumPy array.
+
+    C-contiguous arrays become matrices stored by row and Fortran-contiguous
+    arrays matrices stored by column.  The array is copied, and the matrix
+    takes over the memory of the copy through `GxB_Matrix_pack_FullR` or
+    `GxB_Matrix_pack_FullC`.
+
+    With `take_ownership=True`, the matrix takes over the memory of the
+    array itself, so no elements are copied.  The array is then left empty
+    (with every dimension 0), as is the array owning its memory if it is a
+    view of all of it; other views of the memory must not be used
+    afterwards.  Arrays that can't be taken over (such as views of part of
+    an array, or non-contiguous arrays) are copied and left as they are.
+    This requires GraphBLAS to be initialized with the "numpy" memory
+    manager (the default).  This is the same for the other functions that
+    take over NumPy arrays, such as `matrix_import_csr`.
+
+    >>> A = matrix_from_dense(np.arange(6, dtype=np.int64).reshape(2, 3))
+    >>> matrix_shape(A), matrix_nvals(A)
+    ((2, 3), 6)
+    >>> get_int64(A, 1, 2)
+    5
+
+    """
+    array = np.asarray(array)
+    if array.ndim != 2:
+        raise ValueError(f"array must be 2-dimensional; got {array.ndim} dimensions")
+    T = grb_type_from_dtype(array.dtype)
+    array = _owned_array(array, take_ownership=take_ownership)
+    nrows, ncols = array.shape
+    A = matrix_new(T, nrows, ncols, free=free)
+    if array.size == 0:
+        return A
+    Ax = ffi.new("void**", ffi.cast("void*", array.ctypes.data))
+    if array.flags.c_contiguous:
+        check_status(A, lib.GxB_Matrix_pack_FullR(A[0], Ax, array.nbytes, False, ffi.NULL))
+    else:
+        check_status(A, lib.GxB_Matrix_pack_FullC(A[0], Ax, array.nbytes, False, ffi.NULL))
+    _detach(array)
+    return A
+
+
+def matrix_to_dense(A, *, copy=False):
+    """Return the values of a full matrix as a 2D NumPy array.
+
+    Every entry of the matrix must be present.  The array takes over the
+    memory of the matrix through `GxB_Matrix_unpack_FullR` or
+    `GxB_Matrix_unpack_FullC`, so no elements are copied and `A` is left
+    with no entries.  Matrices stored by row give C-contiguous arrays and
+    matrices stored by column Fortran-contiguous arrays.  With `copy=True`,
+    a duplicate of `A` is unpacked instead and `A` is unchanged.
+
+    >>> A = matrix_from_dense(np.array([[1.0, 2.0], [3.0, 4.0]]))
+    >>> matrix_to_dense(A, copy=True)
+    array([[1., 2.],
+           [3., 4.]])
+    >>> matrix_nvals(A)
+    4
+    >>> matrix_to_dense(A).flags.c_contiguous
+    True
+    >>> matrix_nvals(A)
+    0
+
+    """
+    nrows, ncols = matrix_shape(A)
+    dtype = grb_type_to_dtype(matrix_type(A))
+    if matrix_nvals(A) != nrows * ncols:
+        raise ValueError("Matrix must be full (have every entry present) to convert to dense")
+    if nrows * ncols == 0:
+        return np.empty((nrows, ncols), dtype)
+    if copy:
+        A = matrix_dup(A)
+    by_row = matrix_format(A) == lib.GxB_BY_ROW
+    Ax = ffi.new("void**")
+    Ax_size = ffi.new("GrB_Index*")
+    is_iso = ffi.new("bool*")
+    if by_row:
+        check_status(A, lib.GxB_Matrix_unpack_FullR(A[0], Ax, Ax_size, is_iso, ffi.NULL))
+    else:
+        check_status(A, lib.GxB_Matrix_unpack_FullC(A[0], Ax, Ax_size, is_iso, ffi.NULL))
+    if is_iso[0]:
+        value = claim_buffer(ffi, Ax[0], Ax_size[0] // dtype.itemsize, dtype)[0]
+        return np.full((nrows, ncols), value, dtype, order="C" if by_row else "F")
+    return claim_buffer_2d(ffi, Ax[0], Ax_size[0] // dtype.itemsize, nrows, ncols, dtype, by_row)
+
+
+def matrix_from_bitmap(values, present, *, take_ownership=False, free=matrix_free):
+    """Create a bitmap matrix from 2D NumPy arrays of values and presence.
+
+    `present` is a bool or int8 array of the same shape as `values` that is
+    1 (or True) where an entry is present and 0 elsewhere; the values where
+    it is 0 are ignored.  C-contiguous arrays become matrices stored by row
+    and Fortran-contiguous arrays matrices stored by column, and both arrays
+    must have the same layout.  The matrix takes over the memory of (copies
+    of) the arrays through `GxB_Matrix_pack_BitmapR` or
+    `GxB_Matrix_pack_BitmapC`; see `matrix_from_dense` for `take_ownership`.
+    With `take_ownership=True`, a `present` array of the other layout is
+    still copied.
+
+    >>> values = np.array([[1.0, 0.0], [0.0, 4.0]])
+    >>> A = matrix_from_bitmap(values, values != 0)
+    >>> matrix_nvals(A), get_fp64(A, 1, 1)
+    (2, 4.0)
+
+    """
+    values = np.asarray(values)
+    present = np.asarray(present)
+    if values.ndim != 2:
+        raise ValueError(f"values must be 2-dimensional; got {values.ndim} dimensions")
+    if present.shape != values.shape:
+        raise ValueError(
+            f"present must have the same shape as values; got {present.shape} and {values.shape}"
+        )
+    if present.dtype == np.bool_:
+        # Same bytes, and always 0 or 1
+        present = present.view(np.int8)
+    elif np.any((present != 0) & (present != 1)):
+        raise ValueError("present must be 0 or 1")
+    T = grb_type_from_dtype(values.dtype)
+    values = _owned_array(values, take_ownership=take_ownership)
+    by_row = values.flags.c_contiguous
+    if not (present.flags.c_contiguous if by_row else present.flags.f_contiguous):
+        present = np.array(present, np.int8, order="C" if by_row else "F")
+    present = _owned_array(present, np.int8, take_ownership=take_ownership)
+    nrows, ncols = values.shape
+    A = matrix_new(T, nrows, ncols, free=free)
+    if values.size == 0:
+        return A
+    nvals = np.count_nonzero(present)
+    Ab = ffi.new("int8_t**", ffi.cast("int8_t*", present.ctypes.data))
+    Ax = ffi.new("void**", ffi.cast("void*", values.ctypes.data))
+    if by_row:
+        pack = lib.GxB_Matrix_pack_BitmapR
+    else:
+        pack = lib.GxB_Matrix_pack_BitmapC
+    check_status(A, pack(A[0], Ab, Ax, present.nbytes, values.nbytes, False, nvals, ffi.NULL))
+    _detach(present)
+    _detach(values)
+    return A
+
+
+def matrix_to_bitmap(A, *, copy=False):
+    """Return the entries of a matrix as 2D NumPy arrays `(values, present)`.
+
+    `present` is an int8 array that is 1 where `A` has an entry and 0
+    elsewhere, and `values` holds the values of the entries; its other
+    elements are undefined.  The arrays take over the memory of the matrix
+    through `GxB_Matrix_unpack_BitmapR` or `GxB_Matrix_unpack_BitmapC`
+    (converting `A` to bitmap first if needed), so no elements are copied
+    and `A` is left with no entries.  Matrices stored by row give
+    C-contiguous arrays and matrices stored by column Fortran-contiguous
+    arrays.  With `copy=True`, a duplicate of `A` is unpacked instead and
+    `A` is unchanged.
+
+    >>> A = matrix_new(lib.GrB_INT64, 2, 3)
+    >>> set_int64(A, 5, 0, 2)
+    >>> values, present = matrix_to_bitmap(A)
+    >>> present
+    array([[0, 0, 1],
+           [0, 0, 0]], dtype=int8)
+    >>> values[present == 1]
+    array([5])
+
+    """
+    nrows, ncols = matrix_shape(A)
+    dtype = grb_type_to_dtype(matrix_type(A))
+    if nrows * ncols == 0:
+        return np.empty((nrows, ncols), dtype), np.empty((nrows, ncols), np.int8)
+    if copy:
+        A = matrix_dup(A)
+    by_row = matrix_format(A) == lib.GxB_BY_ROW
+    Ab = ffi.new("int8_t**")
+    Ax = ffi.new("void**")
+    Ab_size = ffi.new("GrB_Index*")
+    Ax_size = ffi.new("GrB_Index*")
+    is_iso = ffi.new("bool*")
+    nvals = ffi.new("GrB_Index*")
+    if by_row:
+        unpack = lib.GxB_Matrix_unpack_BitmapR
+    else:
+        unpack = lib.GxB_Matrix_unpack_BitmapC
+    check_status(A, unpack(A[0], Ab, Ax, Ab_size, Ax_size, is_iso, nvals, ffi.NULL))
+    present = claim_buffer_2d(ffi, Ab[0], Ab_size[0], nrows, ncols, np.dtype(np.int8), by_row)
+    if is_iso[0]:
+        value = claim_buffer(ffi, Ax[0], Ax_size[0] // dtype.itemsize, dtype)[0]
+        values = np.full((nrows, ncols), value, dtype, order="C" if by_row else "F")
+    else:
+        values = claim_buffer_2d(
+            ffi, Ax[0], Ax_size[0] // dtype.itemsize, nrows, ncols, dtype, by_row
+        )
+    return values, present
+
+
+# ---------------------------------------------------------------------------
+# CSR, CSC and hypersparse NumPy arrays
+# ---------------------------------------------------------------------------
+
+
+def _export(A, format, sparsity, copy, jumbled):
+    """Move the entries of `A` into NumPy arrays through a `GxB_Container`.
+
+    `A` is first converted to the given format and sparsity.  Returns
+    `(Ap, Ah, Ai, Ax, iso, jumbled)`, where `Ah` is None unless the
+    sparsity is hypersparse.  The index arrays are uint32 or uint64,
+    depending on the integers used by `A`.
+    """
+    if copy:
+        A = matrix_dup(A)
+    # Check the type before anything is moved out of A
+    grb_type_to_dtype(matrix_type(A))
+    # Only change what differs; any change makes GraphBLAS rebuild the
+    # matrix, possibly with different integer sizes.
+    old_format = matrix_format(A)
+    old_sparsity = matrix_sparsity_control(A)
+    if format != old_format:
+        matrix_set_format(A, format)
+    if sparsity != old_sparsity:
+        matrix_set_sparsity_control(A, sparsity)
+    if not jumbled:
+        # Finish all pending work, which includes sorting the indices
+        check_status(A, lib.GrB_Matrix_wait(A[0], lib.GrB_MATERIALIZE))
+    C = container_new()
+    check_status(A, lib.GxB_unload_Matrix_into_Container(A[0], C[0], ffi.NULL))
+    if format != old_format:
+        matrix_set_format(A, old_format)
+    if sparsity != old_sparsity:
+        matrix_set_sparsity_control(A, old_sparsity)
+    c = C[0]
+    return (
+        _unload_array(c.p, unsigned=True),
+        _unload_array(c.h, unsigned=True) if sparsity == lib.GxB_HYPERSPARSE else None,
+        _unload_array(c.i, unsigned=True),
+        _unload_array(c.x),
+        bool(c.iso),
+        bool(c.jumbled),
+    )
+
+
+def matrix_export_csr(A, *, copy=False, jumbled=False):
+    """Export a matrix as CSR NumPy arrays without copying.
+
+    Returns `(Ap, Ai, Ax, iso, jumbled)`: the row pointers and column
+    indices, the values, and whether the matrix is iso-valued (all values
+    equal, and `Ax` has a single element) or jumbled (column indices
+    within a row are unsorted).  The pointers and indices are uint32 or
+    uint64, following the integers used by `A` (see
+    `matrix_set_integer_bits`).  The arrays take over the memory of the
+    matrix through `GxB_unload_Matrix_into_Container`, leaving `A` with no
+    entries, unless `copy` is True, in which case a duplicate of `A` is
+    exported.  The column indices are sorted unless `jumbled` is True,
+    which lets GraphBLAS skip sorting them.
+
+    >>> A = matrix_new(lib.GrB_FP64, 2, 3)
+    >>> set_fp64(A, 1.5, 0, 2)
+    >>> set_fp64(A, 2.5, 1, 0)
+    >>> Ap, Ai, Ax, iso, jumbled = matrix_export_csr(A)
+    >>> Ap.tolist(), Ai.tolist(), Ax.tolist(), iso, jumbled
+    ([0, 1, 2], [2, 0], [1.5, 2.5], False, False)
+    >>> matrix_nvals(A)
+    0
+
+    """
+    Ap, _, Ai, Ax, iso, jumbled = _export(A, lib.GxB_BY_ROW, lib.GxB_SPARSE, copy, jumbled)
+    return Ap, Ai, Ax, iso, jumbled
+
+
+def matrix_export_csc(A, *, copy=False, jumbled=False):
+    """Export a matrix as CSC NumPy arrays without copying.
+
+    Returns `(Ap, Ai, Ax, iso, jumbled)` with column pointers and row
+    indices.  See `matrix_export_csr`.
+
+    >>> A = matrix_new(lib.GrB_INT32, 2, 3)
+    >>> set_int32(A, 7, 1, 2)
+    >>> Ap, Ai, Ax, iso, jumbled = matrix_export_csc(A, copy=True)
+    >>> Ap.tolist(), Ai.tolist(), Ax.tolist()
+    ([0, 0, 0, 1], [1], [7])
+    >>> matrix_nvals(A)
+    1
+
+    """
+    Ap, _, Ai, Ax, iso, jumbled = _export(A, lib.GxB_BY_COL, lib.GxB_SPARSE, copy, jumbled)
+    return Ap, Ai, Ax, iso, jumbled
+
+
+def matrix_export_hypercsr(A, *, copy=False, jumbled=False):
+    """Export a matrix as hypersparse CSR NumPy arrays without copying.
+
+    Returns `(Ap, Ah, Ai, Ax, iso, jumbled)`, where `Ah` holds the indices
+    of the non-empty rows and `Ap` has one more element than `Ah`.  See
+    `matrix_export_csr`.
+
+    >>> A = matrix_new(lib.GrB_BOOL, 1000, 1000)
+    >>> set_bool(A, True, 500, 7)
+    >>> Ap, Ah, Ai, Ax, iso, jumbled = matrix_export_hypercsr(A)
+    >>> Ap.tolist(), Ah.tolist(), Ai.tolist(), Ax.tolist(), iso
+    ([0, 1], [500], [7], [True], True)
+
+    """
+    return _export(A, lib.GxB_BY_ROW, lib.GxB_HYPERSPARSE, copy, jumbled)
+
+
+def matrix_export_hypercsc(A, *, copy=False, jumbled=False):
+    """Export a matrix as hypersparse CSC NumPy arrays without copying.
+
+    Returns `(Ap, Ah, Ai, Ax, iso, jumbled)`, where `Ah` holds the indices
+    of the non-empty columns.  See `matrix_export_csr`.
+
+    >>> A = matrix_new(lib.GrB_BOOL, 1000, 1000)
+    >>> set_bool(A, True, 500, 7)
+    >>> Ap, Ah, Ai, Ax, iso, jumbled = matrix_export_hypercsc(A)
+    >>> Ap.tolist(), Ah.tolist(), Ai.tolist()
+    ([0, 1], [7], [500])
+
+    """
+    return _export(A, lib.GxB_BY_COL, lib.GxB_HYPERSPARSE, copy, jumbled)
+
+
+def _import(
+    format, sparsity, Ap, Ah, Ai, Ax, nrows, ncols, *, iso, jumbled, take_ownership, trusted, free
+):
+    """Create a matrix taking over NumPy arrays through a `GxB_Container`.
+
+    `Ah` is None unless `sparsity` is hypersparse.  32-bit and 64-bit index
+    arrays are used as they are; the matrix uses integers of the same sizes.
+    The arrays are checked unless `trusted` is True.
+    """
+    Ap = _owned_index_array(Ap, take_ownership=take_ownership)
+    if Ah is not None:
+        Ah = _owned_index_array(Ah, take_ownership=take_ownership)
+        nvec = Ah.size
+    else:
+        nvec = nrows if format == lib.GxB_BY_ROW else ncols
+    Ai = _owned_index_array(Ai, take_ownership=take_ownership)
+    Ax = _owned_array(Ax, take_ownership=take_ownership)
+    if Ap.ndim != 1 or Ap.size != nvec + 1:
+        raise ValueError(f"Ap must have {nvec + 1} elements; got {Ap.size}")
+    nvals = int(Ap[-1])
+    if Ai.ndim != 1 or Ai.size != nvals or Ax.ndim != 1 or Ax.size != (1 if iso else nvals):
+        raise ValueError(
+            f"Ai and Ax must have {nvals} elements (Ax 1 if iso); got {Ai.size} and {Ax.size}"
+        )
+    if not trusted:
+        by_row = format == lib.GxB_BY_ROW
+        nouter, ninner = (nrows, ncols) if by_row else (ncols, nrows)
+        _check_indices(Ap, Ah, Ai, nouter, ninner, jumbled)
+    A = matrix_new(grb_type_from_dtype(Ax.dtype), nrows, ncols, free=free)
+    C = container_new()
+    c = C[0]
+    c.nrows = nrows
+    c.ncols = ncols
+    c.nrows_nonempty = -1
+    c.ncols_nonempty = -1
+    c.nvals = nvals
+    c.format = sparsity
+    c.orientation = lib.GrB_ROWMAJOR if format == lib.GxB_BY_ROW else lib.GrB_COLMAJOR
+    c.iso = iso
+    c.jumbled = jumbled
+    _load_array(c.p, Ap, _index_type(Ap, unsigned=True))
+    if Ah is not None:
+        _load_array(c.h, Ah, _index_type(Ah))
+    _load_array(c.i, Ai, _index_type(Ai))
+    _load_array(c.x, Ax)
+    check_status(A, lib.GxB_load_Matrix_from_Container(A[0], C[0], ffi.NULL))
+    return A
+
+
+def matrix_import_csr(
+    Ap, Ai, Ax, nrows, ncols, *,
+    iso=False, jumbled=False, take_ownership=False, trusted=False, free=matrix_free,
+):
+    """Create a matrix from CSR NumPy arrays.
+
+    `Ap` and `Ai` are the row pointers and column indices, and the type of
+    the matrix is given by the dtype of `Ax`.  If `iso` is True, every
+    value equals `Ax[0]`.  Set `jumbled` if the column indices within a row
+    may be unsorted.  The matrix takes over the memory of (copies of) the
+    arrays through `GxB_load_Matrix_from_Container`; see `matrix_from_dense`
+    for `take_ownership`.  32-bit and 64-bit integer arrays (signed or
+    unsigned) are used as they are, and the matrix uses integers of the
+    same sizes; other index arrays are copied to uint64.
+
+    The arrays are checked first: `Ap` must be non-decreasing from 0, and
+    the indices in `Ai` in range and, unless `jumbled`, sorted and unique
+    within each row.  ValueError is raised otherwise.  The checks take
+    time proportional to the number of entries; pass `trusted=True` to
+    skip them for arrays known to be valid, such as those returned by
+    `matrix_export_csr`.  GraphBLAS does not check the arrays itself, so
+    invalid arrays with `trusted=True` corrupt memory.
+
+    >>> Ap = np.array([0, 1, 2], np.uint64)
+    >>> Ai = np.array([2, 0], np.uint64)
+    >>> A = matrix_import_csr(Ap, Ai, np.array([1.5, 2.5]), 2, 3)
+    >>> get_fp64(A, 0, 2), get_fp64(A, 1, 0)
+    (1.5, 2.5)
+
+    """
+    return _import(
+        lib.GxB_BY_ROW, lib.GxB_SPARSE, Ap, None, Ai, Ax, nrows, ncols,
+        iso=iso,
+        jumbled=jumbled,
+        take_ownership=take_ownership,
+        trusted=trusted,
+        free=free,
+    )
+
+
+def matrix_import_csc(
+    Ap, Ai, Ax, nrows, ncols, *,
+    iso=False, jumbled=False, take_ownership=False, trusted=False, free=matrix_free,
+):
+    """Create a matrix from CSC NumPy arrays.
+
+    `Ap` and `Ai` are the column pointers and row indices.  See
+    `matrix_import_csr`.
+
+    >>> Ap = np.array([0, 0, 0, 1], np.uint64)
+    >>> A = matrix_import_csc(Ap, np.array([1], np.uint64), np.array([7], np.int32), 2, 3)
+    >>> get_int32(A, 1, 2)
+    7
+
+    """
+    return _import(
+        lib.GxB_BY_COL, lib.GxB_SPARSE, Ap, None, Ai, Ax, nrows, ncols,
+        iso=iso,
+        jumbled=jumbled,
+        take_ownership=take_ownership,
+        trusted=trusted,
+        free=free,
+    )
+
+
+def matrix_import_hypercsr(
+    Ap, Ah, Ai, Ax, nrows, ncols, *,
+    iso=False, jumbled=False, take_ownership=False, trusted=False, free=matrix_free,
+):
+    """Create a matrix from hypersparse CSR NumPy arrays.
+
+    `Ah` holds the sorted indices of the non-empty rows.  See
+    `matrix_import_csr`.
+
+    >>> Ap, Ah, Ai = (np.array(x, np.uint64) for x in ([0, 1], [500], [7]))
+    >>> A = matrix_import_hypercsr(Ap, Ah, Ai, np.array([True]), 1000, 1000, iso=True)
+    >>> get_bool(A, 500, 7)
+    True
+
+    """
+    return _import(
+        lib.GxB_BY_ROW, lib.GxB_HYPERSPARSE, Ap, Ah, Ai, Ax, nrows, ncols,
+        iso=iso,
+        jumbled=jumbled,
+        take_ownership=take_ownership,
+        trusted=trusted,
+        free=free,
+    )
+
+
+def matrix_import_hypercsc(
+    Ap, Ah, Ai, Ax, nrows, ncols, *,
+    iso=False, jumbled=False, take_ownership=False, trusted=False, free=matrix_free,
+):
+    """Create a matrix from hypersparse CSC NumPy arrays.
+
+    `Ah` holds the sorted indices of the non-empty columns.  See
+    `matrix_import_csr`.
+
+    >>> Ap, Ah, Ai = (np.array(x, np.uint64) for x in ([0, 1], [7], [500]))
+    >>> A = matrix_import_hypercsc(Ap, Ah, Ai, np.array([True]), 1000, 1000)
+    >>> get_bool(A, 500, 7)
+    True
+
+    """
+    return _import(
+        lib.GxB_BY_COL, lib.GxB_HYPERSPARSE, Ap, Ah, Ai, Ax, nrows, ncols,
+        iso=iso,
+        jumbled=jumbled,
+        take_ownership=take_ownership,
+        trusted=trusted,
+        free=free,
+    )
+
+
+# ---------------------------------------------------------------------------
+# SciPy sparse arrays
+# ---------------------------------------------------------------------------
+
+
+def matrix_from_scipy(S, *, take_ownership=False, free=matrix_free):
+    """Create a matrix from a SciPy sparse array or matrix.
+
+    CSR and CSC arrays are passed to `matrix_import_csr` and
+    `matrix_import_csc`, which copy the `indptr`, `indices` and `data`
+    arrays of `S` (and check them).  SciPy's int32 and int64 indices are
+    used as they are, as 32-bit and 64-bit integers.  Other formats, such
+    as COO, and arrays with duplicate or unsorted indices are first
+    converted to canonical CSR by SciPy.
+
+    With `take_ownership=True`, the matrix takes over the arrays of `S`
+    instead of copies, and `S` is left with no entries (and new, empty
+    arrays); see `matrix_from_dense`.
+
+    SciPy is imported when this is called; it is not a dependency of this
+    package.
+    """
+    import scipy.sparse
+
+    if not scipy.sparse.issparse(S):
+        raise TypeError(f"Expected a SciPy sparse array or matrix; got {type(S).__name__}")
+    source = S
+    if S.format not in {"csr", "csc"} or not S.has_canonical_format:
+        S = S.tocsr(copy=True) if S.format != "csc" else S.copy()
+        S.sum_duplicates()
+        # The arrays of the converted S are ours to give away
+        take_ownership = True
+    nrows, ncols = S.shape
+    import_ = matrix_import_csr if S.format == "csr" else matrix_import_csc
+    A = import_(
+        S.indptr, S.indices, S.data, nrows, ncols, take_ownership=take_ownership, free=free
+    )
+    if take_ownership and S is source:
+        # Its arrays are detached; leave S a valid matrix with no entries
+        nvec = nrows if S.format == "csr" else ncols
+        S.indptr = np.zeros(nvec + 1, S.indptr.dtype)
+        S.indices = np.empty(0, S.indices.dtype)
+        S.data = np.empty(0, S.data.dtype)
+    return A
+
+
+def matrix_to_scipy(A, format="csr", *, copy=False):
+    """Return a matrix as a SciPy sparse array.
+
+    `format` is "csr", "csc" or "coo".  The array takes over the memory of
+    the matrix through `matrix_export_csr` or `matrix_export_csc`, leaving
+    `A` with no entries unless `copy` is True.  The unsigned indices are
+    viewed as signed integers for SciPy, so nothing is copied except the
+    value of an iso-valued matrix, which is expanded into one value per
+    entry, and the row pointers, which are expanded into row indices for
+    "coo".  The indices are int32 if the matrix uses 32-bit integers.
+
+    SciPy is imported when this is called; it is not a dependency of this
+    package.
+    """
+    import scipy.sparse
+
+    if format not in {"csr", "csc", "coo"}:
+        raise ValueError(f'format must be "csr", "csc" or "coo"; got {format!r}')
+    shape = matrix_shape(A)
+    if format == "csc":
+        Ap, Ai, Ax, iso, jumbled = matrix_export_csc(A, copy=copy)
+    else:
+        Ap, Ai, Ax, iso, jumbled = matrix_export_csr(A, copy=copy)
+    if iso:
+        Ax = np.full(Ai.size, Ax[0], Ax.dtype)
+    # SciPy wants signed indices and offsets of the same size, which only
+    # needs a copy if the matrix uses 32-bit and 64-bit integers together.
+    if Ap.dtype == np.uint32 and Ap[-1] > np.iinfo(np.int32).max:
+        Ap = Ap.astype(np.int64)
+    index = np.dtype(np.int64 if max(Ap.itemsize, Ai.itemsize) == 8 else np.int32)
+    Ap, Ai = (x.view(index) if x.itemsize == index.itemsize else x.astype(index) for x in (Ap, Ai))
+    if format == "coo":
+        rows = np.repeat(np.arange(shape[0], dtype=np.int64), np.diff(Ap))
+        return scipy.sparse.coo_array((Ax, (rows, Ai)), shape=shape)
+    if format == "csr":
+        return scipy.sparse.csr_array((Ax, Ai, Ap), shape=shape, copy=False)
+    return scipy.sparse.csc_array((Ax, Ai, Ap), shape=shape, copy=False)
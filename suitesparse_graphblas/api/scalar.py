@@ -41,6 +41,32 @@ def scalar_type(s):
     return T[0]
 
 
+def scalar_from_value(T, value, *, free=scalar_free):
+    """Create a new scalar of type `T` holding `value`.
+
+    `value` is converted to `T` like the argument of `set_fp64` and the
+    other typed setters.  For a user-defined type, `value` must be a buffer
+    (such as a NumPy scalar or array) holding exactly the bytes of the value.
+
+    >>> s = scalar_from_value(lib.GrB_FP32, 2.5)
+    >>> get_fp32(s)
+    2.5
+
+    """
+    s = scalar_new(T, free=free)
+    setter = _setters.get(T)
+    if setter is None:
+        buffer = ffi.from_buffer(value)
+        size = ffi.new("size_t*")
+        check_status(s, lib.GxB_Type_size(size, T))
+        if len(buffer) != size[0]:
+            raise ValueError(f"value must have {size[0]} bytes; got {len(buffer)}")
+        check_status(s, lib.GrB_Scalar_setElement_UDT(s[0], buffer))
+    else:
+        setter(s, value)
+    return s
+
+
 # ---------------------------------------------------------------------------
 # GraphBLAS operations
 # ---------------------------------------------------------------------------
@@ -492,3 +518,21 @@ if supports_complex():
         if res == exceptions.NoValue:
             return None
         return value[0]
+
+
+_setters = {
+    lib.GrB_BOOL: set_bool,
+    lib.GrB_INT8: set_int8,
+    lib.GrB_INT16: set_int16,
+    lib.GrB_INT32: set_int32,
+    lib.GrB_INT64: set_int64,
+    lib.GrB_UINT8: set_uint8,
+    lib.GrB_UINT16: set_uint16,
+    lib.GrB_UINT32: set_uint32,
+    lib.GrB_UINT64: set_uint64,
+    lib.GrB_FP32: set_fp32,
+    lib.GrB_FP64: set_fp64,
+}
+if supports_complex():
+    _setters[lib.GxB_FC32] = set_fc32
+    _setters[lib.GxB_FC64] = set_fc64
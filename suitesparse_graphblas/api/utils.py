@@ -1,6 +1,11 @@
 import os
 import sys
 
+import numpy as np
+
+from suitesparse_graphblas import check_status, ffi, lib, utils
+from suitesparse_graphblas.utils import claim_buffer, detach_buffer
+
 
 def _capture_c_output(fn, *args):
     """Capture C-level stdout output from a function call."""
@@ -14,3 +19,228 @@ def _capture_c_output(fn, *args):
     out = os.read(r, 100000).decode()
     os.close(r)
     return out
+
+
+def _compiled(name, func):
+    """Return the compiled version of the accessor `func`, or `func` if there is none.
+
+    `suitesparse_graphblas.utils` compiles the hottest accessors with Cython
+    (under `name`), which makes them a few times faster to call.  `func`
+    remains the reference implementation; its name, docstring and signature
+    are copied to the compiled function.
+    """
+    compiled = getattr(utils, name, None)
+    if compiled is None:  # pragma: no cover (extension built without them)
+        return func
+    compiled.__name__ = func.__name__
+    compiled.__qualname__ = func.__qualname__
+    compiled.__module__ = func.__module__
+    compiled.__doc__ = func.__doc__
+    compiled.__wrapped__ = func
+    return compiled
+
+
+# ---------------------------------------------------------------------------
+# Passing memory between NumPy and GraphBLAS
+# ---------------------------------------------------------------------------
+
+
+def _data_owner(array):
+    """Return the array that owns the memory of `array`, or None.
+
+    That is `array` itself or, if `array` is a view of all of the memory of
+    another array (as SciPy often makes), that other array.
+    """
+    if array.flags.owndata:
+        return array
+    base = array.base
+    if (
+        isinstance(base, np.ndarray)
+        and base.flags.owndata
+        and base.ctypes.data == array.ctypes.data
+        and base.nbytes == array.nbytes
+    ):
+        return base
+    return None
+
+
+def _owned_array(array, dtype=None, *, take_ownership=False):
+    """Return `array` as an array whose memory GraphBLAS can take over.
+
+    That is an aligned, contiguous, writable array of `dtype` that owns its
+    data (or views all of the data of an array that does).  Unless
+    `take_ownership` is True, this is always a new copy, so that the
+    caller's array is left alone.  If `take_ownership` is True, `array` is
+    returned as is if possible, and copied otherwise.  Call `_detach` once
+    GraphBLAS has taken the memory.
+    """
+    array = np.asarray(array)
+    flags = array.flags
+    is_owned = (
+        _data_owner(array) is not None
+        and flags.writeable
+        and flags.aligned
+        and (flags.c_contiguous or flags.f_contiguous)
+        and (dtype is None or array.dtype == dtype)
+    )
+    if not (take_ownership and is_owned):
+        order = "F" if flags.f_contiguous and not flags.c_contiguous else "C"
+        array = np.array(array, dtype, order=order, copy=True)
+    return array
+
+
+def _detach(array):
+    """Detach `array`, and the array owning its memory, from that memory.
+
+    GraphBLAS has taken over the memory, so the arrays no longer free it,
+    and are made empty (every dimension 0) so that they no longer read or
+    write it either.
+    """
+    owner = _data_owner(array)
+    detach_buffer(array)
+    if owner is not None and owner is not array:
+        detach_buffer(owner)
+
+
+def _owned_index_array(array, *, take_ownership=False):
+    """Like `_owned_array` for arrays of indices or offsets.
+
+    GraphBLAS stores these as 32-bit or 64-bit integers, so arrays of
+    either size are taken over as they are; signed and unsigned arrays
+    have the same bytes, since indices are never negative.  Arrays of
+    other dtypes are copied to uint64.
+    """
+    array = np.asarray(array)
+    if array.dtype.kind in "iu" and array.dtype.itemsize in {4, 8}:
+        return _owned_array(array, take_ownership=take_ownership)
+    return _owned_array(array, np.uint64, take_ownership=take_ownership)
+
+
+def _check_indices(Ap, Ah, Ai, nouter, ninner, jumbled, name="Ai"):
+    """Raise ValueError unless `Ap`, `Ah` and `Ai` are a valid sparse structure.
+
+    That is the offsets `Ap` of the vectors (rows or columns) into the
+    indices `Ai`, and `Ah`, the indices of those vectors if hypersparse
+    (otherwise None), of a matrix with `nouter` vectors of length `ninner`.
+    GraphBLAS trusts the arrays it takes over, so invalid arrays would make
+    it read and write out of bounds.  `name` is the name of `Ai` in errors.
+    """
+    if Ap[0] != 0 or np.any(Ap[1:] < Ap[:-1]):
+        raise ValueError("Ap must start at 0 and be non-decreasing")
+    if Ah is not None and Ah.size > 0:
+        if Ah.min() < 0 or Ah.max() >= nouter:
+            raise ValueError(f"Ah must be less than {nouter}")
+        if np.any(Ah[1:] <= Ah[:-1]):
+            raise ValueError("Ah must be sorted and unique")
+    if Ai.size == 0:
+        return
+    if Ai.min() < 0 or Ai.max() >= ninner:
+        raise ValueError(f"{name} must be less than {ninner}")
+    if not jumbled:
+        is_sorted = Ai[1:] > Ai[:-1]
+        # A vector's first index only needs to follow the previous index within the vector
+        starts = Ap[1:-1]
+        starts = starts[(starts > 0) & (starts < Ai.size)].astype(np.intp)
+        is_sorted[starts - 1] = True
+        if not is_sorted.all():
+            raise ValueError(f"{name} must be sorted and unique within each vector unless jumbled")
+
+
+def _claim(ptr, size, n, dtype):
+    """Give NumPy ownership of `size` bytes at `ptr` holding `n` elements of `dtype`."""
+    array = claim_buffer(ffi, ptr, size // dtype.itemsize, dtype)
+    if array.size != n:
+        # GraphBLAS may allocate more than needed.  Copy the rare over-allocated
+        # array so that every returned array owns its data and can be passed
+        # back to GraphBLAS without copying.
+        array = array[:n].copy()
+    return array
+
+
+def _output_array(array, n, dtype, name):
+    """Return the first `n` elements of the caller-provided output `array`.
+
+    `array` must be a writable, contiguous, 1-dimensional array of `dtype`
+    with at least `n` elements, so that GraphBLAS can write into it.  None
+    is returned as is, for outputs that are not wanted.
+    """
+    if array is None:
+        return None
+    if (
+        not isinstance(array, np.ndarray)
+        or array.dtype != dtype
+        or array.ndim != 1
+        or not array.flags.c_contiguous
+        or not array.flags.writeable
+    ):
+        raise ValueError(f"{name} must be a writable, contiguous 1-d array of {np.dtype(dtype)}")
+    if array.size < n:
+        raise ValueError(f"{name} must have at least {n} elements; got {array.size}")
+    return array[:n]
+
+
+def _ptr(ctype, array):
+    """Return a `ctype` pointer to the data of `array`, or NULL if `array` is None."""
+    if array is None:
+        return ffi.NULL
+    return ffi.cast(ctype, ffi.from_buffer(array))
+
+
+_index_types = {
+    (True, 4): lib.GrB_UINT32,
+    (True, 8): lib.GrB_UINT64,
+    (False, 4): lib.GrB_INT32,
+    (False, 8): lib.GrB_INT64,
+}
+
+
+def _index_type(array, *, unsigned=False):
+    """Return the GraphBLAS type of the 32-bit or 64-bit integer index `array`.
+
+    Container offsets (`p`) are unsigned and indices (`h` and `i`) signed.
+    """
+    return _index_types[unsigned, array.dtype.itemsize]
+
+
+def _unload_array(v, *, unsigned=False):
+    """Move the entries of the full GrB_Vector `v` into a new NumPy array.
+
+    The array takes over the memory of `v` through `GxB_Vector_unload`,
+    leaving `v` empty.  Its dtype follows the type of `v`, except that
+    integers are returned as unsigned integers of the same size if
+    `unsigned` is True (as for indices).
+    """
+    X = ffi.new("void**")
+    T = ffi.new("GrB_Type*")
+    n = ffi.new("uint64_t*")
+    X_size = ffi.new("uint64_t*")
+    handling = ffi.new("int*")
+    check_status(v, lib.GxB_Vector_unload(v, X, T, n, X_size, handling, ffi.NULL))
+    dtype = grb_type.grb_type_to_dtype(T[0])
+    if unsigned:
+        dtype = np.dtype(f"uint{8 * dtype.itemsize}")
+    if X[0] == ffi.NULL:
+        return np.empty(0, dtype)
+    if handling[0] == lib.GxB_IS_READONLY:
+        # e.g. a memory-mapped file; the memory isn't ours to take
+        return np.frombuffer(ffi.buffer(X[0], n[0] * dtype.itemsize), dtype).copy()
+    return _claim(X[0], X_size[0], n[0], dtype)
+
+
+def _load_array(v, array, T=None):
+    """Move the owned, contiguous NumPy `array` into the GrB_Vector `v`.
+
+    `v` takes over the memory of `array` through `GxB_Vector_load` and
+    becomes a full vector of type `T` (by default, the type of the dtype).
+    Get `array` from `_owned_array` first; it is detached afterwards.
+    """
+    if T is None:
+        T = grb_type.grb_type_from_dtype(array.dtype)
+    X = ffi.new("void**", ffi.cast("void*", array.ctypes.data))
+    check_status(
+        v, lib.GxB_Vector_load(v, X, T, array.size, max(array.nbytes, 1), lib.GrB_DEFAULT, ffi.NULL)
+    )
+    _detach(array)
+
+
+from . import grb_type  # noqa: E402 isort:skip
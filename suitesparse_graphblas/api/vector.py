@@ -1,13 +1,26 @@
 """Create, manipulate, and query GrB_Vector objects."""
 
+from contextlib import contextmanager
+
 import numpy as np
 
 from suitesparse_graphblas import check_status, ffi, lib, supports_complex
 
+from .container import container_new
+from .grb_type import grb_type_from_dtype, grb_type_to_dtype
+from .scalar import scalar_from_value
 from .utils import _capture_c_output  # noqa: F401
-
-from .io.serialize import deserialize_vector as deserialize  # noqa: F401
-from .io.serialize import serialize_vector as serialize  # noqa: F401
+from .utils import (
+    _check_indices,
+    _compiled,
+    _index_type,
+    _load_array,
+    _output_array,
+    _owned_array,
+    _owned_index_array,
+    _ptr,
+    _unload_array,
+)
 
 
 def vector_free(v):
@@ -67,6 +80,9 @@ def vector_size(v):
     return n[0]
 
 
+vector_size = _compiled("vector_size", vector_size)
+
+
 def vector_nvals(v):
     """Return the number of stored elements in the vector.
 
@@ -83,6 +99,9 @@ def vector_nvals(v):
     return n[0]
 
 
+vector_nvals = _compiled("vector_nvals", vector_nvals)
+
+
 def vector_option_get_int32(v, field):
     """Get a vector option as an int32.
 
@@ -605,6 +624,117 @@ def vector_extract(w, u, indices, ni, mask=None, accum=None, desc=None):
     ))
 
 
+def _index_array(array, name):
+    """Return `array` as a contiguous 1D array of integer indices."""
+    array = np.asarray(array)
+    if array.size == 0 and array.dtype.kind not in "iu":
+        # e.g. an empty list
+        array = array.astype(np.uint64)
+    if array.dtype.kind not in "iu":
+        raise TypeError(f"{name} must be an array of integers; got dtype {array.dtype}")
+    return _contiguous_1d(array, name)
+
+
+def _contiguous_1d(array, name):
+    array = np.ascontiguousarray(array)
+    if array.ndim != 1:
+        raise ValueError(f"{name} must be 1-dimensional; got {array.ndim} dimensions")
+    return array
+
+
+@contextmanager
+def _array_vector(array):
+    """Use the contiguous 1D `array` as a full vector inside the `with` block.
+
+    The vector is loaded with `GxB_IS_READONLY`, so it refers to the memory
+    of `array` without copying or taking it over, and is freed on exit.
+    """
+    T = grb_type_from_dtype(array.dtype)
+    v = vector_new(T, 0, free=None)
+    try:
+        X = ffi.new("void**", ffi.cast("void*", array.ctypes.data))
+        check_status(v, lib.GxB_Vector_load(
+            v[0], X, T, array.size, array.nbytes, lib.GxB_IS_READONLY, ffi.NULL
+        ))
+        yield v
+    finally:
+        vector_free(v)
+
+
+def vector_build(w, indices, vals, dup=None):
+    """Build a vector from NumPy arrays of indices and values.
+
+    `indices` may be of any integer dtype and the values of any dtype with
+    a GraphBLAS type; both are passed to `GxB_Vector_build_Vector` without
+    copying, and GraphBLAS uses 32-bit indices directly.  Duplicate indices
+    are combined with the binary operator `dup`, or are an error if `dup`
+    is None.
+
+    >>> w = vector_new(lib.GrB_FP64, 4)
+    >>> vector_build(w, np.array([3, 1, 3], np.int32), np.array([1.0, 2.0, 4.0]), lib.GrB_PLUS_FP64)
+    >>> get_fp64(w, 3)
+    5.0
+
+    """
+    indices = _index_array(indices, "indices")
+    vals = _contiguous_1d(vals, "vals")
+    if indices.size != vals.size:
+        raise ValueError(
+            f"indices and vals must have the same length; got {indices.size} and {vals.size}"
+        )
+    if vals.size == 0:
+        return
+    with _array_vector(indices) as Iv, _array_vector(vals) as Xv:
+        check_status(w, lib.GxB_Vector_build_Vector(
+            w[0], Iv[0], Xv[0], ffi.NULL if dup is None else dup, ffi.NULL
+        ))
+
+
+def vector_build_iso(w, indices, value):
+    """Build an iso-valued vector from a NumPy array of indices.
+
+    Every entry gets `value`, a `GrB_Scalar` or a value converted to the
+    type of `w`, through `GxB_Vector_build_Scalar_Vector`.  See
+    `matrix.matrix_build_iso`.
+
+    >>> w = vector_new(lib.GrB_INT64, 4)
+    >>> vector_build_iso(w, [3, 1, 3], 7)
+    >>> vector_nvals(w), get_int64(w, 3)
+    (2, 7)
+
+    """
+    indices = _index_array(indices, "indices")
+    if not isinstance(value, ffi.CData):
+        value = scalar_from_value(vector_type(w), value)
+    if indices.size == 0:
+        return
+    with _array_vector(indices) as Iv:
+        check_status(w, lib.GxB_Vector_build_Scalar_Vector(w[0], Iv[0], value[0], ffi.NULL))
+
+
+def vector_extract_tuples(v):
+    """Extract all entries of a vector as NumPy arrays `(indices, vals)`.
+
+    The entries are extracted by `GxB_Vector_extractTuples_Vector`, so the
+    indices are uint32 if the vector is shorter than 2**31 and uint64
+    otherwise.  See `matrix.matrix_extract_tuples`.
+
+    >>> v = vector_new(lib.GrB_INT32, 5)
+    >>> vector_build(v, [4, 1], np.array([7, 8], np.int32))
+    >>> indices, vals = vector_extract_tuples(v)
+    >>> indices.tolist(), vals.tolist()
+    ([1, 4], [8, 7])
+
+    """
+    T = vector_type(v)
+    # Check the type before extracting anything
+    grb_type_to_dtype(T)
+    Iv = vector_new(lib.GrB_UINT64, 0)
+    Xv = vector_new(T, 0)
+    check_status(v, lib.GxB_Vector_extractTuples_Vector(Iv[0], Xv[0], v[0], ffi.NULL))
+    return _unload_array(Iv[0], unsigned=True), _unload_array(Xv[0])
+
+
 def vector_build_int64(w, indices, vals, nvals, dup):
     """Build a vector from index and int64 value arrays.
 
@@ -645,10 +775,31 @@ def vector_build_fp64(w, indices, vals, nvals, dup):
     ))
 
 
-def vector_extract_tuples_int64(v):
+def _extract_tuples(v, extract, ctype, dtype, out):
+    """Extract the tuples of `v` with `extract`, a `GrB_Vector_extractTuples_*` function.
+
+    `ctype` and `dtype` are the C and NumPy types of the values.  See
+    `matrix.matrix_extract_tuples_fp64` for `out`.
+    """
+    n = vector_nvals(v)
+    if out is None:
+        indices = np.empty(n, dtype=np.uint64)
+        vals = np.empty(n, dtype=dtype)
+    else:
+        indices, vals = out
+        indices = _output_array(indices, n, np.uint64, "indices")
+        vals = _output_array(vals, n, dtype, "vals")
+    nvals_p = ffi.new("GrB_Index*", n)
+    if n > 0:
+        check_status(v, extract(_ptr("GrB_Index*", indices), _ptr(ctype, vals), nvals_p, v[0]))
+    return indices, vals
+
+
+def vector_extract_tuples_int64(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_INT64, 3)
     >>> set_int64(v, 42, 1)
@@ -661,20 +812,10 @@ def vector_extract_tuples_int64(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.int64)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_INT64(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("int64_t*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_INT64, "int64_t*", np.int64, out)
 
 
-def vector_extract_tuples_fp64(v):
+def vector_extract_tuples_fp64(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
     Returns (indices, vals) as numpy arrays.
@@ -687,18 +828,11 @@ def vector_extract_tuples_fp64(v):
     >>> float(vals[0]) == 1.5
     True
 
+    Pass `out=(indices, vals)` to reuse arrays, or None for an output that
+    is not wanted; see `matrix.matrix_extract_tuples_fp64`.
+
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.float64)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_FP64(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("double*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_FP64, "double*", np.float64, out)
 
 def vector_build_bool(w, indices, vals, nvals, dup):
     """Build a vector from index and bool value arrays.
@@ -862,10 +996,11 @@ def vector_build_fp32(w, indices, vals, nvals, dup):
         nvals, dup,
     ))
 
-def vector_extract_tuples_bool(v):
+def vector_extract_tuples_bool(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_BOOL, 3)
     >>> set_bool(v, True, 0)
@@ -876,22 +1011,13 @@ def vector_extract_tuples_bool(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.bool_)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_BOOL(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("bool*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_BOOL, "bool*", np.bool_, out)
 
-def vector_extract_tuples_int8(v):
+def vector_extract_tuples_int8(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_INT8, 3)
     >>> set_int8(v, 7, 0)
@@ -902,22 +1028,13 @@ def vector_extract_tuples_int8(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.int8)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_INT8(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("int8_t*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_INT8, "int8_t*", np.int8, out)
 
-def vector_extract_tuples_int16(v):
+def vector_extract_tuples_int16(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_INT16, 3)
     >>> set_int16(v, 7, 0)
@@ -928,22 +1045,13 @@ def vector_extract_tuples_int16(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.int16)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_INT16(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("int16_t*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_INT16, "int16_t*", np.int16, out)
 
-def vector_extract_tuples_int32(v):
+def vector_extract_tuples_int32(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_INT32, 3)
     >>> set_int32(v, 7, 0)
@@ -954,22 +1062,13 @@ def vector_extract_tuples_int32(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.int32)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_INT32(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("int32_t*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_INT32, "int32_t*", np.int32, out)
 
-def vector_extract_tuples_uint8(v):
+def vector_extract_tuples_uint8(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_UINT8, 3)
     >>> set_uint8(v, 7, 0)
@@ -980,22 +1079,13 @@ def vector_extract_tuples_uint8(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.uint8)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_UINT8(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("uint8_t*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_UINT8, "uint8_t*", np.uint8, out)
 
-def vector_extract_tuples_uint16(v):
+def vector_extract_tuples_uint16(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_UINT16, 3)
     >>> set_uint16(v, 7, 0)
@@ -1006,22 +1096,13 @@ def vector_extract_tuples_uint16(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.uint16)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_UINT16(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("uint16_t*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_UINT16, "uint16_t*", np.uint16, out)
 
-def vector_extract_tuples_uint32(v):
+def vector_extract_tuples_uint32(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_UINT32, 3)
     >>> set_uint32(v, 7, 0)
@@ -1032,22 +1113,13 @@ def vector_extract_tuples_uint32(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.uint32)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_UINT32(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("uint32_t*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_UINT32, "uint32_t*", np.uint32, out)
 
-def vector_extract_tuples_uint64(v):
+def vector_extract_tuples_uint64(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_UINT64, 3)
     >>> set_uint64(v, 7, 0)
@@ -1058,22 +1130,13 @@ def vector_extract_tuples_uint64(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.uint64)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_UINT64(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("uint64_t*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_UINT64, "uint64_t*", np.uint64, out)
 
-def vector_extract_tuples_fp32(v):
+def vector_extract_tuples_fp32(v, out=None):
     """Extract all tuples from a vector as numpy arrays.
 
-    Returns (indices, vals) as numpy arrays.
+    Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+    for `out`.
 
     >>> v = vector_new(lib.GrB_FP32, 3)
     >>> set_fp32(v, 1.5, 0)
@@ -1084,17 +1147,7 @@ def vector_extract_tuples_fp32(v):
     True
 
     """
-    n = vector_nvals(v)
-    indices = np.empty(n, dtype=np.uint64)
-    vals = np.empty(n, dtype=np.float32)
-    nvals_p = ffi.new("GrB_Index*", n)
-    if n > 0:
-        check_status(v, lib.GrB_Vector_extractTuples_FP32(
-            ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-            ffi.cast("float*", ffi.from_buffer(vals)),
-            nvals_p, v[0],
-        ))
-    return indices, vals
+    return _extract_tuples(v, lib.GrB_Vector_extractTuples_FP32, "float*", np.float32, out)
 
 
 def set_bool(v, value, i):
@@ -1383,6 +1436,9 @@ def get_fp64(v, i):
     return value[0]
 
 
+get_fp64 = _compiled("vector_get_fp64", get_fp64)
+
+
 if supports_complex():
 
     def set_fc32(v, value, i):
@@ -1451,10 +1507,11 @@ if supports_complex():
             nvals, dup,
         ))
 
-    def vector_extract_tuples_fc32(v):
+    def vector_extract_tuples_fc32(v, out=None):
         """Extract all tuples from a vector as numpy arrays.
 
-        Returns (indices, vals) as numpy arrays.
+        Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+        for `out`.
 
         >>> v = vector_new(lib.GxB_FC32, 3)
         >>> set_fc32(v, 2+3j, 0)
@@ -1465,17 +1522,9 @@ if supports_complex():
         True
 
         """
-        n = vector_nvals(v)
-        indices = np.empty(n, dtype=np.uint64)
-        vals = np.empty(n, dtype=np.complex64)
-        nvals_p = ffi.new("GrB_Index*", n)
-        if n > 0:
-            check_status(v, lib.GxB_Vector_extractTuples_FC32(
-                ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-                ffi.cast("GxB_FC32_t*", ffi.from_buffer(vals)),
-                nvals_p, v[0],
-            ))
-        return indices, vals
+        return _extract_tuples(
+            v, lib.GxB_Vector_extractTuples_FC32, "GxB_FC32_t*", np.complex64, out
+        )
 
     def vector_build_fc64(w, indices, vals, nvals, dup):
         """Build a vector from index and fc64 value arrays.
@@ -1495,10 +1544,11 @@ if supports_complex():
             nvals, dup,
         ))
 
-    def vector_extract_tuples_fc64(v):
+    def vector_extract_tuples_fc64(v, out=None):
         """Extract all tuples from a vector as numpy arrays.
 
-        Returns (indices, vals) as numpy arrays.
+        Returns (indices, vals) as numpy arrays.  See `vector_extract_tuples_fp64`
+        for `out`.
 
         >>> v = vector_new(lib.GxB_FC64, 3)
         >>> set_fc64(v, 2+3j, 0)
@@ -1509,14 +1559,153 @@ if supports_complex():
         True
 
         """
-        n = vector_nvals(v)
-        indices = np.empty(n, dtype=np.uint64)
-        vals = np.empty(n, dtype=np.complex128)
-        nvals_p = ffi.new("GrB_Index*", n)
-        if n > 0:
-            check_status(v, lib.GxB_Vector_extractTuples_FC64(
-                ffi.cast("GrB_Index*", ffi.from_buffer(indices)),
-                ffi.cast("GxB_FC64_t*", ffi.from_buffer(vals)),
-                nvals_p, v[0],
-            ))
-        return indices, vals
+        return _extract_tuples(
+            v, lib.GxB_Vector_extractTuples_FC64, "GxB_FC64_t*", np.complex128, out
+        )
+
+
+# ---------------------------------------------------------------------------
+# Dense and sparse NumPy arrays
+# ---------------------------------------------------------------------------
+
+
+def vector_from_dense(array, *, take_ownership=False, free=vector_free):
+    """Create a full vector from a 1D NumPy array.
+
+    The array is copied, and the vector takes over the memory of the copy
+    through `GxB_Vector_load`.  With `take_ownership=True`, the vector
+    takes over the memory of the array itself, which is left empty; see
+    `matrix.matrix_from_dense`.
+
+    >>> v = vector_from_dense(np.array([1.5, 2.5, 3.5]))
+    >>> vector_size(v), vector_nvals(v), get_fp64(v, 2)
+    (3, 3, 3.5)
+
+    """
+    array = np.asarray(array)
+    if array.ndim != 1:
+        raise ValueError(f"array must be 1-dimensional; got {array.ndim} dimensions")
+    T = grb_type_from_dtype(array.dtype)
+    array = _owned_array(array, take_ownership=take_ownership)
+    v = vector_new(T, 0, free=free)
+    _load_array(v[0], array, T)
+    return v
+
+
+def vector_to_dense(v, *, copy=False):
+    """Return the values of a full vector as a 1D NumPy array.
+
+    Every entry of the vector must be present.  The array takes over the
+    memory of the vector through `GxB_Vector_unload`, so no elements are
+    copied and `v` is left empty, with length 0.  With `copy=True`, a
+    duplicate of `v` is unloaded instead and `v` is unchanged.
+
+    >>> v = vector_from_dense(np.array([1, 2, 3]))
+    >>> vector_to_dense(v, copy=True)
+    array([1, 2, 3])
+    >>> vector_to_dense(v)
+    array([1, 2, 3])
+    >>> vector_size(v)
+    0
+
+    """
+    # Check the type before anything is moved out of v
+    grb_type_to_dtype(vector_type(v))
+    if vector_nvals(v) != vector_size(v):
+        raise ValueError("Vector must be full (have every entry present) to convert to dense")
+    if copy:
+        v = vector_dup(v)
+    return _unload_array(v[0])
+
+
+def vector_from_sparse(
+    indices, values, size, *, jumbled=False, take_ownership=False, trusted=False, free=vector_free
+):
+    """Create a sparse vector of length `size` from NumPy arrays of indices and values.
+
+    The indices must be less than `size` and unique, and sorted unless
+    `jumbled` is True; ValueError is raised otherwise, unless `trusted` is
+    True.  The type of the vector is given by the dtype of `values`.  The
+    vector takes over the memory of (copies of) the arrays through
+    `GxB_load_Vector_from_Container`; see `matrix.matrix_import_csr` for
+    the index dtypes, `take_ownership` and `trusted`.
+
+    >>> v = vector_from_sparse(np.array([1, 4], np.uint64), np.array([2.5, 1.5]), 5)
+    >>> vector_size(v), vector_nvals(v), get_fp64(v, 4)
+    (5, 2, 1.5)
+
+    """
+    indices = _owned_index_array(indices, take_ownership=take_ownership)
+    values = _owned_array(values, take_ownership=take_ownership)
+    if indices.ndim != 1 or values.ndim != 1:
+        raise ValueError("indices and values must be 1-dimensional")
+    if indices.size != values.size:
+        raise ValueError(
+            f"indices and values must have the same length; got {indices.size} and {values.size}"
+        )
+    offsets = np.array([0, indices.size], np.uint64)
+    if not trusted:
+        _check_indices(offsets, None, indices, 1, size, jumbled, "indices")
+    T = grb_type_from_dtype(values.dtype)
+    v = vector_new(T, size, free=free)
+    C = container_new()
+    c = C[0]
+    c.nrows = size
+    c.ncols = 1
+    c.nrows_nonempty = -1
+    c.ncols_nonempty = -1
+    c.nvals = indices.size
+    c.format = lib.GxB_SPARSE
+    c.orientation = lib.GrB_COLMAJOR
+    c.iso = False
+    c.jumbled = jumbled
+    _load_array(c.p, offsets, lib.GrB_UINT64)
+    _load_array(c.i, indices, _index_type(indices))
+    _load_array(c.x, values, T)
+    check_status(v, lib.GxB_load_Vector_from_Container(v[0], C[0], ffi.NULL))
+    return v
+
+
+def vector_to_sparse(v, *, copy=False):
+    """Return the entries of a vector as NumPy arrays `(indices, values)`.
+
+    The indices are sorted, and are uint32 or uint64 depending on the
+    integers used by `v`.  The arrays take over the memory of the vector
+    through `GxB_unload_Vector_into_Container`, so no elements are copied
+    (unless the vector is iso-valued, whose single value is expanded) and
+    `v` is left empty, with length 0.  With `copy=True`, a duplicate of `v` is
+    unloaded instead and `v` is unchanged.
+
+    >>> v = vector_from_sparse(np.array([1, 4], np.uint64), np.array([2.5, 1.5]), 5)
+    >>> indices, values = vector_to_sparse(v)
+    >>> indices.tolist(), values.tolist(), vector_size(v)
+    ([1, 4], [2.5, 1.5], 0)
+
+    """
+    if copy:
+        v = vector_dup(v)
+    # Check the type before anything is moved out of v
+    grb_type_to_dtype(vector_type(v))
+    old_sparsity = vector_option_get_int32(v, lib.GxB_SPARSITY_CONTROL)
+    if old_sparsity != lib.GxB_SPARSE:
+        vector_option_set_int32(v, lib.GxB_SPARSITY_CONTROL, lib.GxB_SPARSE)
+    # Finish all pending work, which includes sorting the indices
+    check_status(v, lib.GrB_Vector_wait(v[0], lib.GrB_MATERIALIZE))
+    C = container_new()
+    check_status(v, lib.GxB_unload_Vector_into_Container(v[0], C[0], ffi.NULL))
+    if old_sparsity != lib.GxB_SPARSE:
+        vector_option_set_int32(v, lib.GxB_SPARSITY_CONTROL, old_sparsity)
+    c = C[0]
+    nvals = c.nvals
+    indices = _unload_array(c.i, unsigned=True)
+    values = _unload_array(c.x)
+    if c.iso:
+        values = np.full(nvals, values[0], values.dtype)
+    return indices, values
+
+
+# Imported last: io.serialize imports matrix, which imports helpers defined above
+from .io.serialize import deserialize_vector as deserialize  # noqa: E402,F401 isort:skip
+from .io.serialize import deserialize_vector_from as deserialize_from  # noqa: E402,F401 isort:skip
+from .io.serialize import serialize_vector as serialize  # noqa: E402,F401 isort:skip
+from .io.serialize import serialize_vector_to as serialize_to  # noqa: E402,F401 isort:skip
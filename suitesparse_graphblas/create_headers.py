@@ -1,5 +1,6 @@
 """
-Script to generate suitesparse_graphblas.h, suitesparse_graphblas_no_complex.h, and source.c files.
+Script to generate suitesparse_graphblas.h, suitesparse_graphblas_no_complex.h, source.c,
+and _lib_types.py files.
 
     - Copy the SuiteSparse header file GraphBLAS.h to the local directory.
     - Run the C preprocessor (cleans it up, but also loses #define values).
@@ -834,6 +835,59 @@ def create_source_text(groups, *, char_defines=None):
     return text
 
 
+_QUALIFIERS = {"const", "signed", "struct", "unsigned", "volatile"}
+
+
+def _declaration_type(line):
+    """Return the C type declared by a function or object declaration, without names.
+
+    Returns None for lines that are not such declarations.
+    """
+    match = re.match(r"^extern (.*?)\b\w+;$", line)
+    if match:
+        return match.group(1).strip()
+    match = re.match(r"^(?!typedef)(.*?)\b\w+\((.*)\);$", line)
+    if match is None:
+        return None
+    params = []
+    for param in match.group(2).split(","):
+        # Drop the parameter name, keeping any pointer stars
+        tokens = param.replace("*", " * ").split()
+        if (
+            len(tokens) > 1
+            and re.fullmatch(r"\w+", tokens[-1])
+            and set(tokens[:-1]) - _QUALIFIERS - {"*"}
+        ):
+            tokens = tokens[:-1]
+        params.append(" ".join(tokens))
+    return f"{match.group(1).strip()}({', '.join(params)})"
+
+
+def create_lib_types_text(*header_texts):
+    """Create a Python module naming one declaration for each distinct C type.
+
+    Touching these attributes of `lib` makes cffi realize every C type used
+    by the declarations in the headers (see `suitesparse_graphblas.initialize`).
+    Names come from the first header in which their type appears, so pass
+    the header without complex types first.
+    """
+    names = {}
+    for text in header_texts:
+        for line in "\n".join(text).splitlines():
+            ctype = _declaration_type(line)
+            if ctype is not None and ctype not in names:
+                names[ctype] = re.search(r"(\w+)(?:;|\()", line.removeprefix("extern ")).group(1)
+    text = [
+        "# This file is automatically generated by create_headers.py",
+        '"""One attribute of `lib` for each distinct C type of its functions and objects."""',
+        "",
+        "TYPE_REPRESENTATIVES = (",
+    ]
+    text.extend(f'    "{name}",' for name in sorted(names.values(), key=sort_key))
+    text.append(")")
+    return text
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -859,6 +913,7 @@ def main():
     # final_arm64_h = os.path.join(thisdir, "suitesparse_graphblas_arm64.h")
     final_no_complex_h = os.path.join(thisdir, "suitesparse_graphblas_no_complex.h")
     source_c = os.path.join(thisdir, "source.c")
+    lib_types_py = os.path.join(thisdir, "_lib_types.py")
 
     # Copy original file
     print(f"Step 1: copy {args.graphblas} to {graphblas_h}")
@@ -880,9 +935,9 @@ def main():
     # Create final header file
     print(f"Step 3: parse header file to create {final_h}")
     groups = parse_header(processed_h, skip_complex=False)
-    text = create_header_text(groups)
+    complex_text = create_header_text(groups)
     with open(final_h, "w") as f:
-        f.write("\n".join(text) + "\n")
+        f.write("\n".join(complex_text) + "\n")
 
     # NOTE:suitesparse_graphblas.h and suitesparse_graphblas_arm64.h are the same now
     # # Create final header file (arm64)
@@ -897,9 +952,9 @@ def main():
     # Create final header file (no complex)
     print(f"Step 4: parse header file to create {final_no_complex_h}")
     groups_no_complex = parse_header(processed_h, skip_complex=True)
-    text = create_header_text(groups_no_complex)
+    no_complex_text = create_header_text(groups_no_complex)
     with open(final_no_complex_h, "w") as f:
-        f.write("\n".join(text) + "\n")
+        f.write("\n".join(no_complex_text) + "\n")
 
     # Create source
     print(f"Step 5: create {source_c}")
@@ -907,8 +962,14 @@ def main():
     with open(source_c, "w") as f:
         f.write("\n".join(text) + "\n")
 
+    # Create list of names to realize the C types of lib
+    print(f"Step 6: create {lib_types_py}")
+    text = create_lib_types_text(no_complex_text, complex_text)
+    with open(lib_types_py, "w") as f:
+        f.write("\n".join(text) + "\n")
+
     # Check defines
-    print("Step 6: check #define definitions")
+    print("Step 7: check #define definitions")
     with open(graphblas_h) as f:
         text = f.read()
     define_lines = re.compile(r".*?#define\s+\w+\s+")
@@ -64,3 +64,7 @@ class NotImplementedException(GraphBLASException):
 
 class JitError(GraphBLASException):
     pass
+
+
+class OutputIsReadonly(GraphBLASException):
+    pass
@@ -1 +1,16 @@
-from suitesparse_graphblas.api.io import binary, serialize  # noqa: F401
+from importlib import import_module
+
+# Backward-compatible aliases of suitesparse_graphblas.api.io, imported on first use
+_submodules = frozenset(["archive", "binary", "serialize"])
+
+
+def __getattr__(name):
+    if name in _submodules:
+        value = import_module(f"suitesparse_graphblas.api.io.{name}")
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(globals().keys() | _submodules)
@@ -19,6 +19,7 @@ def test_run_doctests():
         unaryop,
         vector,
     )
+    from suitesparse_graphblas.api.io import archive
 
     for mod in (
         matrix,
@@ -37,5 +38,6 @@ def test_run_doctests():
         descriptor,
         selectop,
         container,
+        archive,
     ):
         doctest.testmod(mod, optionflags=doctest.ELLIPSIS, raise_on_error=True)
@@ -1,15 +1,20 @@
 import bz2
 import gzip
+import io
 import lzma
+import mmap
 import platform
+import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from suitesparse_graphblas import (
     bool_types,
     check_status,
     complex_types,
+    exceptions,
     ffi,
     grb_types,
     lib,
@@ -24,7 +29,7 @@ from suitesparse_graphblas import (
 if platform.system() == "Windows":
     pytest.skip("skipping windows-only tests", allow_module_level=True)
 
-from suitesparse_graphblas.io import binary  # isort:skip
+from suitesparse_graphblas.io import archive, binary, serialize  # isort:skip
 
 NULL = ffi.NULL
 
@@ -198,3 +203,649 @@ def test_matrix_binfile_read_write(tmp_path):
                     )
 
                     assert is_eq[0]
+
+
+def test_matrix_binfile_mmap(tmp_path):
+    for align in (None, 64):
+        for format in (lib.GxB_BY_ROW, lib.GxB_BY_COL):
+            for T in grb_types:
+                for sparsity in (lib.GxB_HYPERSPARSE, lib.GxB_SPARSE, lib.GxB_BITMAP, lib.GxB_FULL):
+                    A = matrix.matrix_new(T, 2, 2)
+                    for args in zip(*_test_elements(T)):
+                        f = _element_setters[T]
+                        check_status(A, f(A[0], *args))
+                    matrix.matrix_set_sparsity_control(A, sparsity)
+                    matrix.matrix_set_format(A, format)
+
+                    binfilef = tmp_path / "binfilemmap_test.binfile"
+                    binary.binwrite(A, binfilef, align=align)
+                    B = binary.binread(binfilef, mmap=True)
+
+                    assert matrix.matrix_type(A) == matrix.matrix_type(B)
+                    assert matrix.matrix_shape(A) == matrix.matrix_shape(B)
+                    assert matrix.matrix_sparsity_status(A) == matrix.matrix_sparsity_status(B)
+
+                    C = matrix.matrix_new(lib.GrB_BOOL, 2, 2)
+                    check_status(
+                        C,
+                        lib.GrB_Matrix_eWiseAdd_BinaryOp(
+                            C[0], NULL, NULL, _eq_ops[T], A[0], B[0], NULL
+                        ),
+                    )
+                    assert (
+                        matrix.matrix_nvals(A) == matrix.matrix_nvals(B) == matrix.matrix_nvals(C)
+                    )
+                    is_eq = ffi.new("bool*")
+                    check_status(
+                        C,
+                        lib.GrB_Matrix_reduce_BOOL(
+                            is_eq, NULL, lib.GrB_LAND_MONOID_BOOL, C[0], NULL
+                        ),
+                    )
+                    assert is_eq[0]
+
+                    if align is not None:
+                        is_readonly = ffi.new("int32_t*")
+                        check_status(
+                            B, lib.GrB_Matrix_get_INT32(B[0], is_readonly, lib.GxB_IS_READONLY)
+                        )
+                        assert is_readonly[0]
+                        with pytest.raises(exceptions.OutputIsReadonly):
+                            check_status(
+                                B, _element_setters[T](B[0], *_test_elements(T)[0][:1], 0, 1)
+                            )
+                    del B
+
+    with pytest.raises(ValueError, match="mmap"):
+        binary.binread(binfilef, opener=gzip.open, mmap=True)
+    with pytest.raises(ValueError, match="align"):
+        binary.binwrite(A, binfilef, align=3)
+
+
+_vector_element_setters = {
+    lib.GrB_BOOL: lib.GrB_Vector_setElement_BOOL,
+    lib.GrB_INT8: lib.GrB_Vector_setElement_INT8,
+    lib.GrB_INT16: lib.GrB_Vector_setElement_INT16,
+    lib.GrB_INT32: lib.GrB_Vector_setElement_INT32,
+    lib.GrB_INT64: lib.GrB_Vector_setElement_INT64,
+    lib.GrB_UINT8: lib.GrB_Vector_setElement_UINT8,
+    lib.GrB_UINT16: lib.GrB_Vector_setElement_UINT16,
+    lib.GrB_UINT32: lib.GrB_Vector_setElement_UINT32,
+    lib.GrB_UINT64: lib.GrB_Vector_setElement_UINT64,
+    lib.GrB_FP32: lib.GrB_Vector_setElement_FP32,
+    lib.GrB_FP64: lib.GrB_Vector_setElement_FP64,
+}
+
+if supports_complex():
+    _vector_element_setters.update(
+        {
+            lib.GxB_FC32: lib.GxB_Vector_setElement_FC32,
+            lib.GxB_FC64: lib.GxB_Vector_setElement_FC64,
+        }
+    )
+
+
+def _assert_vectors_equal(T, v, w):
+    assert vector.vector_type(v) == vector.vector_type(w)
+    assert vector.vector_size(v) == vector.vector_size(w)
+    x = vector.vector_new(lib.GrB_BOOL, vector.vector_size(v))
+    check_status(
+        x,
+        lib.GrB_Vector_eWiseAdd_BinaryOp(x[0], NULL, NULL, _eq_ops[T], v[0], w[0], NULL),
+    )
+    assert vector.vector_nvals(v) == vector.vector_nvals(w) == vector.vector_nvals(x)
+    is_eq = ffi.new("bool*")
+    check_status(
+        x,
+        lib.GrB_Vector_reduce_BOOL(is_eq, NULL, lib.GrB_LAND_MONOID_BOOL, x[0], NULL),
+    )
+    assert is_eq[0]
+
+
+def test_binread_mmap_closes_on_error(tmp_path, monkeypatch):
+    maps = []
+
+    class RecordingMmap(mmap.mmap):
+        def __init__(self, *args, **kwargs):
+            maps.append(self)
+
+    monkeypatch.setattr(binary._mmap, "mmap", RecordingMmap)
+    binfilef = tmp_path / "binfile_mmap_error.binfile"
+    v = vector.vector_new(lib.GrB_INT64, 3)
+    binary.vector_binwrite(v, binfilef)
+    with pytest.raises(ValueError, match="Not a SuiteSparse:GraphBLAS matrix"):
+        binary.binread(binfilef, mmap=True)
+
+    A = matrix.matrix_new(lib.GrB_INT64, 2, 2)
+    check_status(A, lib.GrB_Matrix_setElement_INT64(A[0], 7, 1, 0))
+    binary.binwrite(A, binfilef)
+    size = binfilef.stat().st_size
+    for length in (size - 1, binary.GRB_HEADER_LEN + 8):
+        with open(binfilef, "r+b") as f:
+            f.truncate(length)
+        with pytest.raises(ValueError, match="truncated"):
+            binary.binread(binfilef, mmap=True)
+    assert len(maps) == 3
+    assert all(mm.closed for mm in maps)
+
+    # A failure while loading the arrays frees the new object and unmaps the file
+    load_mapped = binary._load_mapped
+    freed = []
+
+    def failing_load(*args):
+        load_mapped(*args)
+        raise RuntimeError("load failed")
+
+    def recording_free(free):
+        def wrapper(obj):
+            freed.append(obj)
+            free(obj)
+
+        return wrapper
+
+    vecfilef = tmp_path / "binfile_mmap_error_vector.binfile"
+    binary.binwrite(A, binfilef, align=64)
+    vector.vector_build(v, [1], np.array([5]))
+    binary.vector_binwrite(v, vecfilef, align=64)
+    monkeypatch.setattr(binary, "_load_mapped", failing_load)
+    monkeypatch.setattr(matrix, "matrix_free", recording_free(matrix.matrix_free))
+    monkeypatch.setattr(vector, "vector_free", recording_free(vector.vector_free))
+    with pytest.raises(RuntimeError, match="load failed"):
+        binary.binread(binfilef, mmap=True)
+    with pytest.raises(RuntimeError, match="load failed"):
+        binary.vector_binread(vecfilef, mmap=True)
+    assert len(maps) == 5
+    assert all(mm.closed for mm in maps)
+    assert len(freed) == 2 and all(obj[0] == NULL for obj in freed)
+
+
+def test_vector_binfile_read_write(tmp_path):
+    binfilef = tmp_path / "vector_binfile_test.binfile"
+    for opener in (Path.open, gzip.open):
+        for T in grb_types:
+            for sparsity in (lib.GxB_SPARSE, lib.GxB_BITMAP, lib.GxB_FULL):
+                for align in (None, 64):
+                    v = vector.vector_new(T, 2)
+                    for i, value in enumerate(_test_elements(T)[0]):
+                        if sparsity == lib.GxB_FULL or i == 0:
+                            check_status(v, _vector_element_setters[T](v[0], value, i))
+                    vector.vector_option_set_int32(v, lib.GxB_SPARSITY_CONTROL, sparsity)
+
+                    binary.vector_binwrite(v, binfilef, opener=opener, align=align)
+                    w = binary.vector_binread(binfilef, opener=opener)
+                    _assert_vectors_equal(T, v, w)
+                    assert vector.vector_option_get_int32(
+                        v, lib.GxB_SPARSITY_STATUS
+                    ) == vector.vector_option_get_int32(w, lib.GxB_SPARSITY_STATUS)
+
+                    if opener is Path.open:
+                        w = binary.vector_binread(binfilef, mmap=True)
+                        _assert_vectors_equal(T, v, w)
+
+    with pytest.raises(ValueError, match="Not a SuiteSparse:GraphBLAS matrix"):
+        binary.binread(binfilef, opener=gzip.open)
+    A = matrix.matrix_new(lib.GrB_INT64, 2, 2)
+    binary.binwrite(A, binfilef)
+    with pytest.raises(ValueError, match="Not a SuiteSparse:GraphBLAS vector"):
+        binary.vector_binread(binfilef)
+
+
+def test_binread_info(tmp_path):
+    binfilef = tmp_path / "binfile_info_test.binfile"
+    A = matrix.matrix_new(lib.GrB_FP64, 3, 5)
+    check_status(A, lib.GrB_Matrix_setElement_FP64(A[0], 1.5, 0, 4))
+    check_status(A, lib.GrB_Matrix_setElement_FP64(A[0], 2.5, 2, 1))
+    for opener in (Path.open, gzip.open):
+        for align in (None, 64):
+            binary.binwrite(A, binfilef, opener=opener, align=align)
+            info = binary.binread_info(binfilef, opener=opener)
+            assert info.kind == "matrix"
+            assert info.type == lib.GrB_FP64
+            assert (info.nrows, info.ncols, info.nvals) == (3, 5, 2)
+            assert info.format == matrix.matrix_option_get_int32(A, lib.GxB_FORMAT)
+            assert info.sparsity_status == matrix.matrix_option_get_int32(
+                A, lib.GxB_SPARSITY_STATUS
+            )
+            assert info.typesize == 8
+            assert not info.iso
+            assert info.align == (align or 0)
+
+    v = vector.vector_new(lib.GrB_INT8, 7)
+    check_status(v, lib.GrB_Vector_setElement_INT8(v[0], 3, 6))
+    binary.vector_binwrite(v, binfilef)
+    info = binary.binread_info(str(binfilef))
+    assert info.kind == "vector"
+    assert info.type == lib.GrB_INT8
+    assert (info.nrows, info.ncols, info.nvals) == (7, 1, 1)
+    assert info.format == lib.GxB_BY_COL
+
+    binfilef.write_bytes(b"not a binfile\n" * 64)
+    with pytest.raises(ValueError, match="Not a SuiteSparse:GraphBLAS binary file"):
+        binary.binread_info(binfilef)
+
+
+def test_serialized_info():
+    A = matrix.matrix_new(lib.GrB_INT32, 4, 6)
+    check_status(A, lib.GrB_Matrix_setElement_INT32(A[0], 7, 3, 5))
+    check_status(A, lib.GrB_Matrix_setElement_INT32(A[0], 8, 0, 0))
+    for fmt in (lib.GxB_BY_ROW, lib.GxB_BY_COL):
+        matrix.matrix_option_set_int32(A, lib.GxB_FORMAT, fmt)
+        info = serialize.serialized_info(matrix.serialize(A))
+        assert info.type == lib.GrB_INT32
+        assert info.type_name == "GrB_INT32"
+        assert (info.nrows, info.ncols, info.nvals) == (4, 6, 2)
+        assert info.format == fmt
+        assert info.sparsity_status == matrix.matrix_option_get_int32(A, lib.GxB_SPARSITY_STATUS)
+        assert not info.iso
+
+    v = vector.vector_new(lib.GrB_BOOL, 5)
+    check_status(v, lib.GrB_Vector_assign_BOOL(v[0], NULL, NULL, True, lib.GrB_ALL, 5, NULL))
+    info = serialize.serialized_info(vector.serialize(v, lib.GxB_COMPRESSION_NONE))
+    assert info.type == lib.GrB_BOOL
+    assert (info.nrows, info.ncols, info.nvals) == (5, 1, 5)
+    assert info.iso
+
+    data = bytearray(matrix.serialize(A))
+    with pytest.raises(ValueError, match="header says"):
+        serialize.serialized_info(data[:-1])
+    with pytest.raises(ValueError, match="Not a serialized"):
+        serialize.serialized_info(data[:20])
+    bad = data.copy()
+    bad[12:16] = (1000000).to_bytes(4, sys.byteorder)
+    with pytest.raises(ValueError, match="version"):
+        serialize.serialized_info(bad)
+
+
+def _assert_matrices_equal(T, A, B):
+    assert matrix.matrix_type(A) == matrix.matrix_type(B)
+    assert matrix.matrix_shape(A) == matrix.matrix_shape(B)
+    C = matrix.matrix_new(lib.GrB_BOOL, *matrix.matrix_shape(A))
+    check_status(
+        C,
+        lib.GrB_Matrix_eWiseAdd_BinaryOp(C[0], NULL, NULL, _eq_ops[T], A[0], B[0], NULL),
+    )
+    assert matrix.matrix_nvals(A) == matrix.matrix_nvals(B) == matrix.matrix_nvals(C)
+    is_eq = ffi.new("bool*")
+    check_status(
+        C,
+        lib.GrB_Matrix_reduce_BOOL(is_eq, NULL, lib.GrB_LAND_MONOID_BOOL, C[0], NULL),
+    )
+    assert is_eq[0]
+
+
+def test_matrix_binfile_slice(tmp_path):
+    binfilef = tmp_path / "binfileslice_test.binfile"
+    T = lib.GrB_FP64
+    nrows, ncols = 10, 6
+    for opener in (Path.open, gzip.open):
+        for format in (lib.GxB_BY_ROW, lib.GxB_BY_COL):
+            for sparsity in (lib.GxB_HYPERSPARSE, lib.GxB_SPARSE, lib.GxB_BITMAP, lib.GxB_FULL):
+                for iso in (False, True):
+                    A = matrix.matrix_new(T, nrows, ncols)
+                    for i in range(nrows):
+                        for j in range(ncols):
+                            if sparsity == lib.GxB_FULL or (i * ncols + j) % 7 == 0 and i != 4:
+                                value = 1.0 if iso else float(i * ncols + j)
+                                check_status(A, lib.GrB_Matrix_setElement_FP64(A[0], value, i, j))
+                    matrix.matrix_set_sparsity_control(A, sparsity)
+                    matrix.matrix_set_format(A, format)
+                    binary.binwrite(A, binfilef, opener=opener, align=64 if iso else None)
+
+                    by_row = format == lib.GxB_BY_ROW
+                    n = nrows if by_row else ncols
+                    for start, stop in ((2, n - 2), (0, n), (3, 3), (4, 5), (n - 1, n)):
+                        indices = ffi.new("GrB_Index[]", list(range(start, stop)))
+                        if by_row:
+                            B = binary.binread(binfilef, opener=opener, rows=slice(start, stop))
+                            expected = matrix.matrix_new(T, stop - start, ncols)
+                            check_status(
+                                expected,
+                                lib.GrB_Matrix_extract(
+                                    expected[0],
+                                    NULL,
+                                    NULL,
+                                    A[0],
+                                    indices,
+                                    stop - start,
+                                    lib.GrB_ALL,
+                                    ncols,
+                                    NULL,
+                                ),
+                            )
+                        else:
+                            B = binary.binread(binfilef, opener=opener, cols=slice(start, stop))
+                            expected = matrix.matrix_new(T, nrows, stop - start)
+                            check_status(
+                                expected,
+                                lib.GrB_Matrix_extract(
+                                    expected[0],
+                                    NULL,
+                                    NULL,
+                                    A[0],
+                                    lib.GrB_ALL,
+                                    nrows,
+                                    indices,
+                                    stop - start,
+                                    NULL,
+                                ),
+                            )
+                        _assert_matrices_equal(T, expected, B)
+
+    binary.binwrite(A, binfilef)
+    B = binary.binread(binfilef, cols=slice(-2, None))
+    assert matrix.matrix_shape(B) == (nrows, 2)
+    with pytest.raises(ValueError, match="stored by row"):
+        binary.binread(binfilef, rows=slice(0, 2))
+    with pytest.raises(ValueError, match="step"):
+        binary.binread(binfilef, cols=slice(0, 4, 2))
+    with pytest.raises(ValueError, match="mmap"):
+        binary.binread(binfilef, cols=slice(0, 2), mmap=True)
+
+
+def test_binwrite_long_comments(tmp_path):
+    binfilef = tmp_path / "binfile_comments_test.binfile"
+    A = matrix.matrix_new(lib.GrB_INT64, 2, 2)
+    check_status(A, lib.GrB_Matrix_setElement_INT64(A[0], 7, 1, 0))
+    binary.binwrite(A, binfilef, comments="short enough")
+    B = binary.binread(binfilef)
+    assert matrix.matrix_nvals(B) == 1
+
+    with pytest.raises(ValueError, match="longer than the 512 allowed"):
+        binary.binwrite(A, tmp_path / "long.binfile", comments="x" * 512)
+    assert not (tmp_path / "long.binfile").exists()
+    # A is left intact after the failed write
+    assert matrix.matrix_nvals(A) == 1
+
+    v = vector.vector_new(lib.GrB_INT64, 2)
+    with pytest.raises(ValueError, match="longer than the 512 allowed"):
+        binary.vector_binwrite(v, tmp_path / "long.binfile", comments="x" * 512)
+
+
+def test_binfile_header_comments(tmp_path):
+    binfilef = tmp_path / "binfile_header_test.binfile"
+    T = lib.GrB_INT64
+    A = matrix.matrix_new(T, 3, 3)
+    check_status(A, lib.GrB_Matrix_setElement_INT64(A[0], 7, 1, 0))
+    comments = "compression: zlib\nblocksize: 10\nalign: 64\nintbits: 32 32 32"
+    binary.binwrite(A, binfilef, comments=comments)
+    info = binary.binread_info(binfilef)
+    assert (info.align, info.compression, info.intbits) == (0, None, (64, 64, 64))
+    _assert_matrices_equal(T, A, binary.binread(binfilef))
+
+    # Files written before the option lines existed have their comments there
+    data = binfilef.read_bytes()
+    lines = data[: binary.GRB_HEADER_LEN].decode("ascii").splitlines()
+    assert lines[14:18] == comments.splitlines()
+    legacy = "\n".join(lines[:10] + lines[14:]) + "\n"
+    binfilef.write_bytes(
+        legacy.ljust(binary.GRB_HEADER_LEN).encode() + data[binary.GRB_HEADER_LEN :]
+    )
+    info = binary.binread_info(binfilef)
+    assert (info.align, info.compression, info.intbits) == (0, None, (64, 64, 64))
+    _assert_matrices_equal(T, A, binary.binread(binfilef))
+    _assert_matrices_equal(T, A, binary.binread(binfilef, mmap=True))
+
+
+def test_binfile_compression(tmp_path):
+    binfilef = tmp_path / "binfilecompressed_test.binfile"
+    T = lib.GrB_INT64
+    for compression in ("zlib", "bz2", "lzma"):
+        for format in (lib.GxB_BY_ROW, lib.GxB_BY_COL):
+            for sparsity in (lib.GxB_HYPERSPARSE, lib.GxB_SPARSE, lib.GxB_BITMAP, lib.GxB_FULL):
+                A = matrix.matrix_new(T, 40, 30)
+                for i in range(40):
+                    for j in range(30):
+                        if sparsity == lib.GxB_FULL or (i + j) % 3 == 0:
+                            check_status(A, lib.GrB_Matrix_setElement_INT64(A[0], i * j, i, j))
+                matrix.matrix_set_sparsity_control(A, sparsity)
+                matrix.matrix_set_format(A, format)
+                # Small blocks so that every array is split into several blocks
+                binary.binwrite(A, binfilef, compression=compression, block_size=100, nthreads=4)
+                assert binary.binread_info(binfilef).compression == compression
+                B = binary.binread(binfilef, nthreads=3)
+                _assert_matrices_equal(T, A, B)
+                assert matrix.matrix_sparsity_status(A) == matrix.matrix_sparsity_status(B)
+
+    binary.binwrite(A, binfilef, opener=gzip.open, compression="zlib", level=1, nthreads=1)
+    _assert_matrices_equal(T, A, binary.binread(binfilef, opener=gzip.open, nthreads=1))
+
+    uncompressed = tmp_path / "binfileuncompressed_test.binfile"
+    binary.binwrite(A, uncompressed)
+    binary.binwrite(A, binfilef, compression="zlib")
+    assert binfilef.stat().st_size < uncompressed.stat().st_size
+    assert binary.binread_info(uncompressed).compression is None
+
+    v = vector.vector_new(lib.GrB_FP64, 1000)
+    for i in range(0, 1000, 7):
+        check_status(v, lib.GrB_Vector_setElement_FP64(v[0], i / 2, i))
+    binary.vector_binwrite(v, binfilef, compression="lzma", block_size=256)
+    _assert_vectors_equal(lib.GrB_FP64, v, binary.vector_binread(binfilef))
+
+    with pytest.raises(ValueError, match="uncompressed"):
+        binary.vector_binread(binfilef, mmap=True)
+    binary.binwrite(A, binfilef, compression="zlib")
+    with pytest.raises(ValueError, match="without compression"):
+        binary.binread(binfilef, rows=slice(0, 2))
+    with pytest.raises(ValueError, match="compression must be"):
+        binary.binwrite(A, binfilef, compression="lz4")
+    with pytest.raises(ValueError, match="align"):
+        binary.binwrite(A, binfilef, compression="zlib", align=64)
+
+    # Flip a byte of the last compressed block
+    data = bytearray(binfilef.read_bytes())
+    data[-2] ^= 0xFF
+    binfilef.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="Corrupt"):
+        binary.binread(binfilef)
+
+    # Truncate the file inside a compressed block, and inside a block header
+    binary.binwrite(A, binfilef, compression="zlib")
+    data = binfilef.read_bytes()
+    for length in (len(data) - 1, binary.GRB_HEADER_LEN + binary._fixed_size + 5):
+        binfilef.write_bytes(data[:length])
+        with pytest.raises(ValueError, match="Corrupt compressed block"):
+            binary.binread(binfilef)
+    binary.binwrite(A, binfilef)
+    binfilef.write_bytes(binfilef.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        binary.binread(binfilef)
+
+
+def test_binfile_integer_bits(tmp_path):
+    binfilef = tmp_path / "binfileintbits_test.binfile"
+    T = lib.GrB_FP64
+    for bits in (32, 64):
+        for format in (lib.GxB_BY_ROW, lib.GxB_BY_COL):
+            for sparsity in (lib.GxB_HYPERSPARSE, lib.GxB_SPARSE):
+                A = matrix.matrix_new(T, 100, 80, index_bits=bits, offset_bits=bits)
+                matrix.matrix_set_format(A, format)
+                matrix.matrix_build(A, [1, 50, 99, 99], [2, 3, 0, 79], np.arange(4.0))
+                matrix.matrix_set_sparsity_control(A, sparsity)
+                intbits = matrix.matrix_integer_bits(A)
+                for index_bits in (32, 64):
+                    for kwargs in ({}, {"align": 64}, {"compression": "zlib"}):
+                        binary.binwrite(A, binfilef, index_bits=index_bits, **kwargs)
+                        data = binfilef.read_bytes()
+                        # Writing leaves the matrix as it was
+                        binary.binwrite(A, binfilef, index_bits=index_bits, **kwargs)
+                        assert binfilef.read_bytes() == data
+                        info = binary.binread_info(binfilef)
+                        if index_bits == 64:
+                            assert info.intbits == (64, 64, 64)
+                        else:
+                            assert info.intbits[0] == intbits[2]
+                        B = binary.binread(binfilef)
+                        _assert_matrices_equal(T, A, B)
+                        # Reading keeps the integer sizes of the file
+                        binary.binwrite(B, binfilef, index_bits=index_bits, **kwargs)
+                        assert binfilef.read_bytes() == data
+                        if "compression" not in kwargs:
+                            _assert_matrices_equal(T, A, binary.binread(binfilef, mmap=True))
+                            if format == lib.GxB_BY_ROW:
+                                B = binary.binread(binfilef, rows=slice(0, 60))
+                            else:
+                                B = binary.binread(binfilef, cols=slice(2, 4))
+                            assert matrix.matrix_nvals(B) == 2
+
+    # 64-bit integers are written by default, for readers that expect them
+    binary.binwrite(A, binfilef)
+    assert binary.binread_info(binfilef).intbits == (64, 64, 64)
+    with pytest.raises(ValueError, match="index_bits"):
+        binary.binwrite(A, binfilef, index_bits=None)
+
+    # Files without an intbits line hold 64-bit integers
+    data = bytearray(binfilef.read_bytes())
+    start = data.index(b"intbits:")
+    end = data.index(b"\n", start)
+    data[start : end + 1] = b" " * (end + 1 - start)
+    binfilef.write_bytes(bytes(data))
+    assert binary.binread_info(binfilef).intbits == (64, 64, 64)
+    _assert_matrices_equal(T, A, binary.binread(binfilef))
+
+    v = vector.vector_new(lib.GrB_INT8, 100)
+    vector.vector_build(v, np.array([3, 70], np.int32), np.array([1, 2], np.int8))
+    for index_bits in (32, 64):
+        binary.vector_binwrite(v, binfilef, index_bits=index_bits)
+        pbits, _, ibits = binary.binread_info(binfilef).intbits
+        assert (pbits, ibits) == (index_bits, index_bits)
+        _assert_vectors_equal(lib.GrB_INT8, v, binary.vector_binread(binfilef))
+        _assert_vectors_equal(lib.GrB_INT8, v, binary.vector_binread(binfilef, mmap=True))
+
+    with pytest.raises(ValueError, match="index_bits"):
+        binary.binwrite(A, binfilef, index_bits=16)
+
+
+def test_serialize_to_file(tmp_path):
+    T = lib.GrB_INT64
+    A = matrix.matrix_new(T, 50, 40)
+    for i in range(50):
+        check_status(A, lib.GrB_Matrix_setElement_INT64(A[0], i * 3, i, i % 40))
+    path = tmp_path / "serialized_test.bin"
+
+    nbytes = serialize.serialize_matrix_to(A, path, lib.GxB_COMPRESSION_NONE, chunk_size=100)
+    assert nbytes == path.stat().st_size == matrix.serialize(A, lib.GxB_COMPRESSION_NONE).nbytes
+    _assert_matrices_equal(T, A, serialize.deserialize_matrix_from(path))
+    _assert_matrices_equal(T, A, serialize.deserialize_matrix_from(str(path), nthreads=2))
+    with open(path, "rb") as f:
+        _assert_matrices_equal(T, A, serialize.deserialize_matrix_from(f, chunk_size=64))
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        _assert_matrices_equal(T, A, serialize.deserialize_matrix_from(mm))
+
+    with gzip.open(path, "wb") as f:
+        serialize.serialize_matrix_to(A, f, lib.GxB_COMPRESSION_ZSTD, level=3)
+    with gzip.open(path, "rb") as f:
+        _assert_matrices_equal(T, A, serialize.deserialize_matrix_from(f))
+
+    # The default compression is serialized directly into the file, wherever it is
+    with open(path, "w+b") as f:
+        f.write(b"x" * 5000)
+        nbytes = serialize.serialize_matrix_to(A, f)
+        f.write(b"tail")
+    data = path.read_bytes()
+    assert data[5000 : 5000 + nbytes] == bytes(matrix.serialize(A))
+    assert data[:5000] == b"x" * 5000 and data[5000 + nbytes :] == b"tail"
+    with open(path, "wb") as f:
+        serialize.serialize_matrix_to(A, f)
+    _assert_matrices_equal(T, A, serialize.deserialize_matrix_from(path))
+
+    buf = io.BytesIO()
+    serialize.serialize_matrix_to(A, buf)
+    assert buf.getvalue() == bytes(matrix.serialize(A))
+    buf.seek(0)
+    _assert_matrices_equal(T, A, serialize.deserialize_matrix_from(buf))
+    with pytest.raises(ValueError, match="Expected"):
+        serialize.deserialize_matrix_from(io.BytesIO(buf.getvalue()[:-10]))
+    with pytest.raises(ValueError, match="Not a serialized"):
+        serialize.deserialize_matrix_from(io.BytesIO(b"\x01"))
+
+    v = vector.vector_new(lib.GrB_FP64, 20)
+    check_status(v, lib.GrB_Vector_setElement_FP64(v[0], 1.5, 3))
+    check_status(v, lib.GrB_Vector_setElement_FP64(v[0], 2.5, 17))
+    # Finish pending work, which the first serialization records otherwise
+    vector.vector_wait(v, lib.GrB_MATERIALIZE)
+    serialize.serialize_vector_to(v, path, chunk_size=7)
+    assert path.read_bytes() == bytes(vector.serialize(v))
+    _assert_vectors_equal(lib.GrB_FP64, v, serialize.deserialize_vector_from(path))
+    with open(path, "rb") as f:
+        _assert_vectors_equal(lib.GrB_FP64, v, serialize.deserialize_vector_from(f, chunk_size=5))
+
+
+def test_nthreads_context_restores_engaged():
+    from suitesparse_graphblas.api import context
+
+    outer = context.context_new()
+    context.context_set_nthreads(outer, 3)
+    context.context_engage(outer)
+    try:
+        with serialize.nthreads_context(2):
+            assert context.context_engaged() is not outer
+            assert context.context_get_nthreads(context.context_engaged()) == 2
+        assert context.context_engaged() is outer
+        A = matrix.matrix_new(lib.GrB_INT64, 2, 2)
+        matrix.serialize(A, nthreads=1)
+        assert context.context_engaged() is outer
+    finally:
+        context.context_disengage(outer)
+    with serialize.nthreads_context(2):
+        pass
+    assert context.context_engaged() is None
+
+
+def test_deserialize_nthreads_and_type():
+    T = lib.GrB_FP32
+    A = matrix.matrix_new(T, 30, 30)
+    for i in range(30):
+        check_status(A, lib.GrB_Matrix_setElement_FP32(A[0], i / 4, i, 29 - i))
+    data = matrix.serialize(A, lib.GxB_COMPRESSION_ZSTD, level=5, nthreads=2)
+    _assert_matrices_equal(T, A, matrix.deserialize(data, T, nthreads=2))
+    _assert_matrices_equal(T, A, matrix.deserialize(data, nthreads=1))
+    with pytest.raises(exceptions.DomainMismatch):
+        matrix.deserialize(data, lib.GrB_FP64)
+
+    v = vector.vector_new(lib.GrB_UINT16, 10)
+    check_status(v, lib.GrB_Vector_setElement_UINT16(v[0], 7, 4))
+    data = vector.serialize(v, nthreads=3)
+    _assert_vectors_equal(lib.GrB_UINT16, v, vector.deserialize(data, lib.GrB_UINT16, nthreads=3))
+    with pytest.raises(exceptions.DomainMismatch):
+        vector.deserialize(data, lib.GrB_INT16)
+
+
+def test_archive(tmp_path):
+    path = tmp_path / "archive_test.grb"
+    members = {}
+    for k in range(6):
+        A = matrix.matrix_new(lib.GrB_INT64, 10 + k, 10)
+        for i in range(k + 1):
+            check_status(A, lib.GrB_Matrix_setElement_INT64(A[0], k * 100 + i, i, 9 - i))
+        members[f"A{k}"] = A
+    d = vector.vector_new(lib.GrB_FP64, 7)
+    check_status(d, lib.GrB_Vector_setElement_FP64(d[0], 0.5, 6))
+    members["degree"] = d
+    archive.archive_write(path, members, lib.GxB_COMPRESSION_LZ4)
+
+    index = archive.archive_members(path)
+    assert list(index) == list(members)
+    assert index["degree"].kind == "vector"
+    assert all(member.offset % 8 == 0 for member in index.values())
+
+    result = archive.archive_read(path)
+    assert list(result) == list(members)
+    for k in range(6):
+        _assert_matrices_equal(lib.GrB_INT64, members[f"A{k}"], result[f"A{k}"])
+    _assert_vectors_equal(lib.GrB_FP64, d, result["degree"])
+
+    result = archive.archive_read(str(path), ["degree", "A3"], max_workers=2)
+    assert list(result) == ["degree", "A3"]
+    _assert_matrices_equal(lib.GrB_INT64, members["A3"], result["A3"])
+    _assert_vectors_equal(lib.GrB_FP64, d, result["degree"])
+    assert archive.archive_read(path, []) == {}
+
+    with pytest.raises(KeyError, match="'B'"):
+        archive.archive_read(path, ["A0", "B"])
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="Corrupt"):
+        archive.archive_read(path)
+    with pytest.raises(ValueError, match="Not a GraphBLAS archive"):
+        archive.archive_members(__file__)
+    with pytest.raises(TypeError, match="GrB_Matrix"):
+        archive.archive_write(path, {"x": ffi.new("GrB_Scalar*")})
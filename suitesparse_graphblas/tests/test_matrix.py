@@ -0,0 +1,877 @@
+import numpy as np
+import pytest
+
+from suitesparse_graphblas import (
+    check_status,
+    exceptions,
+    ffi,
+    iterator,
+    lib,
+    matrix,
+    scalar,
+    vector,
+)
+from suitesparse_graphblas.api import grb_type
+
+
+def test_matrix_dense_round_trip():
+    for dtype in (np.bool_, np.int8, np.uint16, np.int64, np.float32, np.complex128):
+        for order in ("C", "F"):
+            array = np.asarray(np.arange(12).reshape(3, 4) % 5, dtype=dtype, order=order)
+            expected = array.copy()
+            ptr = array.ctypes.data
+            A = matrix.matrix_from_dense(array, take_ownership=True)
+            assert matrix.matrix_shape(A) == (3, 4)
+            assert matrix.matrix_nvals(A) == 12
+            assert matrix.matrix_format(A) == (lib.GxB_BY_ROW if order == "C" else lib.GxB_BY_COL)
+            # The matrix took over the array's memory, and the array is empty
+            assert array.shape == (0, 0)
+            assert not array.flags.owndata
+
+            result = matrix.matrix_to_dense(A, copy=True)
+            np.testing.assert_array_equal(result, expected)
+            assert result.ctypes.data != ptr
+            assert matrix.matrix_nvals(A) == 12
+
+            result = matrix.matrix_to_dense(A)
+            np.testing.assert_array_equal(result, expected)
+            assert result.dtype == expected.dtype
+            assert result.ctypes.data == ptr
+            assert result.flags[f"{order}_CONTIGUOUS"]
+            assert result.flags.owndata
+            assert matrix.matrix_nvals(A) == 0
+            assert matrix.matrix_shape(A) == (3, 4)
+
+
+def test_matrix_from_dense_copies():
+    base = np.arange(20, dtype=np.float64).reshape(4, 5)
+    view = base[::2, 1:4]
+    A = matrix.matrix_from_dense(view, take_ownership=True)
+    np.testing.assert_array_equal(matrix.matrix_to_dense(A), view)
+    assert base.flags.writeable and view.shape == (2, 3)
+
+    # The array is copied by default, and stays usable after the matrix is freed
+    array = np.arange(1e4).reshape(100, 100)
+    A = matrix.matrix_from_dense(array)
+    assert array.shape == (100, 100) and array.base.flags.owndata
+    matrix.set_fp64(A, -1.0, 0, 5)
+    assert array[0, 5] == 5.0
+    array[0, 0] = 5
+    assert matrix.get_fp64(A, 0, 0) == 0.0
+    del A
+    assert array.sum() == np.arange(1e4).sum() + 5
+
+    # A view of all of an array detaches the array too
+    base = np.arange(6, dtype=np.int32)
+    A = matrix.matrix_from_dense(base.reshape(2, 3), take_ownership=True)
+    assert base.shape == (0,) and base.sum() == 0
+    assert matrix.get_int32(A, 1, 2) == 5
+
+    A = matrix.matrix_from_dense([[1, 2], [3, 4]])
+    assert matrix.matrix_type(A) == lib.GrB_INT64
+
+    with pytest.raises(ValueError, match="2-dimensional"):
+        matrix.matrix_from_dense(np.zeros(3))
+    with pytest.raises(TypeError, match="dtype"):
+        matrix.matrix_from_dense(np.zeros((2, 2), ">f8"))
+
+    A = matrix.matrix_from_dense(np.zeros((0, 3), np.uint8))
+    assert matrix.matrix_shape(A) == (0, 3)
+    assert matrix.matrix_to_dense(A).shape == (0, 3)
+
+
+def test_matrix_to_dense_sparse_and_iso():
+    A = matrix.matrix_new(lib.GrB_FP64, 2, 3)
+    for i in range(2):
+        for j in range(3):
+            matrix.set_fp64(A, i * 3 + j, i, j)
+    matrix.matrix_set_sparsity_control(A, lib.GxB_SPARSE)
+    np.testing.assert_array_equal(
+        matrix.matrix_to_dense(A), np.arange(6, dtype=np.float64).reshape(2, 3)
+    )
+
+    A = matrix.matrix_new(lib.GrB_INT16, 3, 2)
+    check_status(
+        A,
+        lib.GrB_Matrix_assign_INT16(
+            A[0], ffi.NULL, ffi.NULL, 7, lib.GrB_ALL, 3, lib.GrB_ALL, 2, ffi.NULL
+        ),
+    )
+    np.testing.assert_array_equal(matrix.matrix_to_dense(A), np.full((3, 2), 7, np.int16))
+
+    A = matrix.matrix_new(lib.GrB_INT16, 3, 2)
+    matrix.set_int16(A, 1, 0, 0)
+    with pytest.raises(ValueError, match="full"):
+        matrix.matrix_to_dense(A)
+
+
+def _random_matrix(nrows, ncols, nvals, seed=0):
+    rng = np.random.default_rng(seed)
+    A = matrix.matrix_new(lib.GrB_FP64, nrows, ncols)
+    for _ in range(nvals):
+        i, j = int(rng.integers(nrows)), int(rng.integers(ncols))
+        matrix.set_fp64(A, float(rng.integers(1, 100)), i, j)
+    return A
+
+
+def _assert_same(A, B):
+    assert matrix.matrix_shape(A) == matrix.matrix_shape(B)
+    assert matrix.matrix_type(A) == matrix.matrix_type(B)
+    entries = [
+        set(zip(*map(np.ndarray.tolist, matrix.matrix_extract_tuples_fp64(M)))) for M in (A, B)
+    ]
+    assert entries[0] == entries[1]
+
+
+def test_matrix_export_import_csr_csc():
+    for kind in ("csr", "csc", "hypercsr", "hypercsc"):
+        export = getattr(matrix, f"matrix_export_{kind}")
+        import_ = getattr(matrix, f"matrix_import_{kind}")
+        for bits in (32, 64):
+            for nvals in (0, 1, 50):
+                A = _random_matrix(20, 30, nvals)
+                matrix.matrix_set_integer_bits(A, bits, bits)
+                expected = matrix.matrix_dup(A)
+                arrays = export(A, copy=True)
+                assert matrix.matrix_nvals(A) == matrix.matrix_nvals(expected)
+                arrays = export(A)
+                assert matrix.matrix_nvals(A) == 0
+                *indices, Ax, iso, jumbled = arrays
+                # The arrays use the integers of the matrix
+                assert all(x.dtype == np.dtype(f"uint{bits}") for x in indices)
+                assert Ax.dtype == np.float64
+                assert not jumbled
+                pointers = [x.ctypes.data for x in arrays[:-2]]
+
+                B = import_(*indices, Ax, 20, 30, iso=iso, take_ownership=True)
+                _assert_same(expected, B)
+                assert all(not x.flags.owndata and x.size == 0 for x in arrays[:-2])
+                # The arrays made the round trip without being copied
+                arrays = export(B)
+                assert [x.ctypes.data for x in arrays[:-2]] == pointers
+                assert all(x.dtype == np.dtype(f"uint{bits}") for x in arrays[:-3])
+
+
+def test_matrix_import_mixed_integers():
+    # 64-bit offsets with 32-bit indices
+    Ap = np.array([0, 1, 3], np.int64)
+    Ai = np.array([2, 0, 1], np.int32)
+    A = matrix.matrix_import_csr(Ap, Ai, np.arange(3.0), 2, 3, take_ownership=True)
+    assert matrix.matrix_integer_bits(A) == (32, 32, 64)
+    Ap, Ai, Ax, iso, jumbled = matrix.matrix_export_csr(A)
+    assert (Ap.dtype, Ai.dtype) == (np.uint64, np.uint32)
+    assert Ai.tolist() == [2, 0, 1]
+
+    # Other integer dtypes are copied to 64 bits
+    A = matrix.matrix_import_csr(
+        np.array([0, 1], np.uint8), np.array([1], np.int16), np.ones(1), 1, 2
+    )
+    assert matrix.matrix_integer_bits(A)[1:] == (64, 64)
+
+    with pytest.raises(ValueError, match="Ap must have 3 elements"):
+        matrix.matrix_import_csr([0, 1], [0], np.ones(1), 2, 2)
+    with pytest.raises(ValueError, match="Ai and Ax"):
+        matrix.matrix_import_csr([0, 1, 2], [0], np.ones(2), 2, 2)
+
+
+def test_matrix_import_checks():
+    Ax = np.ones(3)
+    for Ap, Ai, match in [
+        ([1, 2, 3], [0, 1, 2], "start at 0"),
+        ([0, 3, 2], [0, 1], "non-decreasing"),
+        ([0, 2, 3], [0, 3, 1], "less than 3"),
+        ([0, 2, 3], np.array([0, -1, 1], np.int64), "less than 3"),
+        ([0, 2, 3], [1, 0, 1], "sorted and unique"),
+        ([0, 2, 3], [1, 1, 0], "sorted and unique"),
+    ]:
+        with pytest.raises(ValueError, match=match):
+            matrix.matrix_import_csr(Ap, Ai, Ax[: Ap[-1]], 2, 3)
+    # Unsorted indices within a row are allowed if jumbled, and each row may start lower
+    A = matrix.matrix_import_csr([0, 2, 3], [1, 0, 0], Ax, 2, 3, jumbled=True)
+    assert matrix.matrix_nvals(A) == 3
+    A = matrix.matrix_import_csc([0, 0, 2, 2, 3], [0, 2, 1], Ax, 3, 4)
+    assert matrix.matrix_nvals(A) == 3
+    with pytest.raises(ValueError, match="less than 3"):
+        matrix.matrix_import_csc([0, 0, 2, 2, 3], [0, 3, 1], Ax, 3, 4)
+
+    Ai = np.array([7], np.uint64)
+    for Ah, match in [([1000], "less than 1000"), ([5, 5], "sorted and unique")]:
+        Ap = np.arange(len(Ah) + 1, dtype=np.uint64).clip(0, 1)
+        with pytest.raises(ValueError, match=match):
+            matrix.matrix_import_hypercsr(Ap, np.array(Ah, np.uint64), Ai, np.ones(1), 1000, 10)
+    # Trusted arrays are not checked
+    B = _random_matrix(20, 30, 50)
+    Ap, Ai, Ax, iso, jumbled = matrix.matrix_export_csr(B, copy=True)
+    A = matrix.matrix_import_csr(Ap, Ai, Ax, 20, 30, take_ownership=True, trusted=True)
+    _assert_same(A, B)
+    with pytest.raises(ValueError, match="32 or 64"):
+        matrix.matrix_new(lib.GrB_FP64, 2, 2, index_bits=16)
+
+
+def test_matrix_import_csr_copies():
+    Ap = [0, 2, 3]
+    Ai = np.array([0, 4, 1], np.int16)
+    Ax = np.arange(3, dtype=np.int16)
+    A = matrix.matrix_import_csr(Ap, Ai, Ax, 2, 5)
+    assert Ai.flags.owndata and Ai.flags.writeable
+    assert Ax.flags.owndata and Ax.flags.writeable
+    A = matrix.matrix_import_csr(Ap, Ai, Ax, 2, 5, take_ownership=True)
+    assert Ai.flags.owndata and Ai.size == 3
+    assert not Ax.flags.owndata and Ax.size == 0
+    # int32 and int64 indices are taken over like unsigned indices
+    Ai = np.array([0, 4, 1], np.int32)
+    A = matrix.matrix_import_csr(Ap, Ai, np.arange(3, dtype=np.int16), 2, 5, take_ownership=True)
+    assert not Ai.flags.owndata and Ai.size == 0
+    assert matrix.get_int16(A, 0, 4) == 1
+    assert matrix.get_int16(A, 1, 1) == 2
+
+    Ai = np.array([0, 4, 1], np.int32)
+    Ax = np.array([3.0])
+    A = matrix.matrix_import_csr(Ap, Ai, Ax, 2, 5, iso=True)
+    assert Ax.flags.owndata and Ax.flags.writeable
+    assert matrix.get_fp64(A, 1, 1) == 3.0
+    Ap, Ai, Ax, iso, jumbled = matrix.matrix_export_csr(A)
+    assert iso and Ax.tolist() == [3.0]
+
+    # Unsorted indices within a row
+    A = matrix.matrix_import_csr(
+        [0, 3], np.array([4, 0, 2], np.uint64), np.array([1, 2, 3]), 1, 5, jumbled=True
+    )
+    Ap, Ai, Ax, iso, jumbled = matrix.matrix_export_csr(A)
+    assert Ai.tolist() == [0, 2, 4]
+    assert Ax.tolist() == [2, 3, 1]
+
+
+def test_matrix_scipy_round_trip():
+    sparse = pytest.importorskip("scipy.sparse")
+    rng = np.random.default_rng(0)
+    for fmt in ("csr", "csc"):
+        for dtype in (np.bool_, np.int32, np.float64, np.complex64):
+            S = sparse.random_array((30, 20), density=0.2, format=fmt, dtype=dtype, rng=rng)
+            expected = S.toarray()
+            S.indptr = S.indptr.astype(np.int64)
+            S.indices = S.indices.astype(np.int64)
+            arrays = (S.indptr, S.indices, S.data)
+            pointers = [x.ctypes.data for x in arrays]
+            nnz = S.nnz
+            A = matrix.matrix_from_scipy(S, take_ownership=True)
+            assert matrix.matrix_shape(A) == (30, 20)
+            assert matrix.matrix_nvals(A) == nnz
+            assert all(not x.flags.owndata and x.size == 0 for x in arrays)
+            # S is left with no entries
+            assert S.nnz == 0 and S.shape == (30, 20)
+            assert not S.toarray().any()
+
+            result = matrix.matrix_to_scipy(A, fmt)
+            assert result.format == fmt
+            assert result.dtype == dtype
+            np.testing.assert_array_equal(result.toarray(), expected)
+            # The arrays made the round trip without being copied
+            assert [x.ctypes.data for x in (result.indptr, result.indices, result.data)] == (
+                pointers
+            )
+            assert matrix.matrix_nvals(A) == 0
+
+
+def test_matrix_scipy_conversions():
+    sparse = pytest.importorskip("scipy.sparse")
+    dense = np.array([[0, 1, 0], [2, 0, 3]], np.int64)
+
+    # int32 indices are used as 32-bit integers
+    S = sparse.csr_matrix(dense)
+    assert S.indices.dtype == np.int32
+    A = matrix.matrix_from_scipy(S)
+    # S is copied, and stays usable after the matrix is freed
+    assert S.data.flags.writeable and S.indices.flags.writeable
+    del A
+    np.testing.assert_array_equal(S.toarray(), dense)
+    A = matrix.matrix_from_scipy(S, take_ownership=True)
+    assert S.nnz == 0 and S.indptr.tolist() == [0, 0, 0]
+    assert matrix.matrix_integer_bits(A)[1:] == (32, 32)
+    assert matrix.get_int64(A, 1, 2) == 3
+    np.testing.assert_array_equal(matrix.matrix_to_scipy(A, "coo", copy=True).toarray(), dense)
+    np.testing.assert_array_equal(matrix.matrix_to_scipy(A, "csc").toarray(), dense)
+
+    # COO with duplicates and CSR with unsorted indices are converted
+    S = sparse.coo_array((np.array([1.0, 2.0, 4.0]), ([0, 0, 1], [1, 1, 0])), shape=(2, 2))
+    A = matrix.matrix_from_scipy(S)
+    assert matrix.matrix_nvals(A) == 2
+    assert matrix.get_fp64(A, 0, 1) == 3.0
+    S = sparse.csr_array((np.array([1.0, 2.0]), np.array([2, 0]), np.array([0, 2])), shape=(1, 3))
+    assert not S.has_canonical_format
+    A = matrix.matrix_from_scipy(S, take_ownership=True)
+    assert S.indices.tolist() == [2, 0]
+    assert matrix.matrix_to_scipy(A).indices.tolist() == [0, 2]
+
+    # Iso-valued matrices are expanded
+    A = matrix.matrix_new(lib.GrB_INT8, 3, 3)
+    matrix.set_int8(A, 5, 0, 0)
+    matrix.set_int8(A, 5, 2, 1)
+    S = matrix.matrix_to_scipy(A)
+    assert S.data.tolist() == [5, 5]
+    assert S.data.dtype == np.int8
+
+    with pytest.raises(TypeError, match="SciPy"):
+        matrix.matrix_from_scipy(dense)
+    with pytest.raises(ValueError, match="format"):
+        matrix.matrix_to_scipy(A, "lil")
+
+
+def test_matrix_build():
+    rng = np.random.default_rng(1)
+    rows64 = rng.integers(0, 50, 200)
+    cols64 = rng.integers(0, 40, 200)
+    expected = matrix.matrix_new(lib.GrB_FP64, 50, 40)
+    matrix.matrix_build_fp64(
+        expected,
+        rows64.astype(np.uint64),
+        cols64.astype(np.uint64),
+        np.ones(200),
+        200,
+        lib.GrB_PLUS_FP64,
+    )
+    for index_dtype in (np.int32, np.uint32, np.int64, np.uint64, np.uint8):
+        for dtype in (np.float64, np.int16, np.float32):
+            C = matrix.matrix_new(lib.GrB_FP64, 50, 40)
+            matrix.matrix_build(
+                C,
+                rows64.astype(index_dtype),
+                cols64.astype(index_dtype),
+                np.ones(200, dtype),
+                lib.GrB_PLUS_FP64,
+            )
+            _assert_same(expected, C)
+
+    # Non-contiguous arrays and lists
+    C = matrix.matrix_new(lib.GrB_INT32, 3, 3)
+    rows = np.array([[0, 9], [2, 9]], np.int32)[:, 0]
+    matrix.matrix_build(C, rows, [1, 2], np.array([5, 6], np.int32))
+    assert matrix.get_int32(C, 2, 2) == 6
+    matrix.matrix_build(matrix.matrix_new(lib.GrB_INT32, 3, 3), [], [], np.array([], np.int32))
+
+    C = matrix.matrix_new(lib.GrB_FP64, 3, 3)
+    with pytest.raises(TypeError, match="integers"):
+        matrix.matrix_build(C, np.array([0.0]), [0], np.array([1.0]))
+    with pytest.raises(ValueError, match="same length"):
+        matrix.matrix_build(C, [0, 1], [0], np.array([1.0]))
+    with pytest.raises(ValueError, match="1-dimensional"):
+        matrix.matrix_build(C, [[0]], [[0]], np.array([[1.0]]))
+    with pytest.raises(exceptions.InvalidValue):
+        matrix.matrix_build(C, [0, 0], [1, 1], np.array([1.0, 2.0]))
+    C = matrix.matrix_new(lib.GrB_FP64, 3, 3)
+    with pytest.raises(exceptions.IndexOutOfBound):
+        matrix.matrix_build(C, [0, 3], [1, 1], np.array([1.0, 2.0]))
+
+
+def test_matrix_extract_tuples():
+    rows = np.array([3, 0, 3], np.int32)
+    cols = np.array([1, 2, 0], np.int32)
+    A = matrix.matrix_new(lib.GrB_INT16, 4, 5)
+    matrix.matrix_build(A, rows, cols, np.array([1, 2, 3], np.int16))
+    I, J, X = matrix.matrix_extract_tuples(A)
+    assert I.dtype == J.dtype == np.uint32
+    assert X.dtype == np.int16
+    assert sorted(zip(I.tolist(), J.tolist(), X.tolist())) == [(0, 2, 2), (3, 0, 3), (3, 1, 1)]
+
+    # 64-bit row indices for a tall matrix
+    A = matrix.matrix_new(lib.GrB_BOOL, 2**40, 5)
+    matrix.matrix_build(A, [2**39], [4], np.array([True]))
+    I, J, X = matrix.matrix_extract_tuples(A)
+    assert (I.dtype, J.dtype) == (np.uint64, np.uint32)
+    assert (I.tolist(), J.tolist(), X.tolist()) == ([2**39], [4], [True])
+
+    I, J, X = matrix.matrix_extract_tuples(matrix.matrix_new(lib.GrB_FP32, 2, 2))
+    assert I.size == J.size == X.size == 0
+    assert X.dtype == np.float32
+
+
+def test_matrix_build_iso():
+    rng = np.random.default_rng(2)
+    rows = rng.integers(0, 30, 100).astype(np.int32)
+    cols = rng.integers(0, 20, 100).astype(np.int32)
+    expected = matrix.matrix_new(lib.GrB_BOOL, 30, 20)
+    matrix.matrix_build(expected, rows, cols, np.ones(100, bool), lib.GrB_LOR)
+    C = matrix.matrix_new(lib.GrB_BOOL, 30, 20)
+    matrix.matrix_build_iso(C, rows, cols, True)
+    _assert_same(expected, C)
+    is_iso = ffi.new("int32_t*")
+    check_status(C, lib.GrB_Matrix_get_INT32(C[0], is_iso, lib.GxB_ISO))
+    assert is_iso[0]
+
+    # The value is converted to the matrix type, or given as a scalar
+    C = matrix.matrix_new(lib.GrB_FP32, 3, 3)
+    matrix.matrix_build_iso(C, [0, 1], [1, 2], 2)
+    assert matrix.get_fp32(C, 1, 2) == 2.0
+    s = scalar.scalar_new(lib.GrB_INT8)
+    scalar.set_int8(s, -3)
+    C = matrix.matrix_new(lib.GrB_INT64, 3, 3)
+    matrix.matrix_build_iso(C, [2], [2], s)
+    assert matrix.get_int64(C, 2, 2) == -3
+
+    with pytest.raises(ValueError, match="same length"):
+        matrix.matrix_build_iso(C, [0, 1], [0], 1)
+    with pytest.raises(exceptions.EmptyObject):
+        matrix.matrix_build_iso(C, [0], [0], scalar.scalar_new(lib.GrB_INT64))
+
+    w = vector.vector_new(lib.GrB_UINT8, 5)
+    vector.vector_build_iso(w, np.array([4, 0, 4], np.uint64), 9)
+    assert vector.vector_extract_tuples(w)[0].tolist() == [0, 4]
+    assert vector.get_uint8(w, 0) == 9
+
+
+def test_matrix_extract_tuples_out():
+    A = matrix.matrix_new(lib.GrB_INT32, 3, 4)
+    matrix.matrix_build(A, [0, 2, 2], [3, 0, 1], np.array([5, 6, 7], np.int32))
+    expected = [x.tolist() for x in matrix.matrix_extract_tuples_int32(A)]
+
+    rows = np.empty(10, np.uint64)
+    cols = np.empty(3, np.uint64)
+    vals = np.empty(5, np.int32)
+    for _ in range(2):
+        r, c, v = matrix.matrix_extract_tuples_int32(A, out=(rows, cols, vals))
+        assert [r.tolist(), c.tolist(), v.tolist()] == expected
+        assert r.base is rows and c.base is cols and v.base is vals
+
+    # Outputs given as None are skipped
+    r, c, v = matrix.matrix_extract_tuples_int32(A, out=(None, cols, None))
+    assert r is None and v is None
+    assert c.tolist() == expected[1]
+    r, c, v = matrix.matrix_extract_tuples_int32(A, out=(None, None, vals))
+    assert v.tolist() == expected[2]
+
+    with pytest.raises(ValueError, match="at least 3"):
+        matrix.matrix_extract_tuples_int32(A, out=(rows, cols, vals[:2]))
+    with pytest.raises(ValueError, match="int32"):
+        matrix.matrix_extract_tuples_int32(A, out=(rows, cols, np.empty(3, np.int64)))
+    with pytest.raises(ValueError, match="uint64"):
+        matrix.matrix_extract_tuples_int32(A, out=(rows[::2], cols, vals))
+
+    indices, values = vector.vector_extract_tuples_fp64(
+        vector.vector_new(lib.GrB_FP64, 3), out=(np.empty(0, np.uint64), None)
+    )
+    assert indices.size == 0 and values is None
+    w = vector.vector_new(lib.GrB_FP64, 3)
+    vector.vector_build(w, [2], np.array([1.5]))
+    indices, values = vector.vector_extract_tuples_fp64(w, out=(None, np.zeros(4)))
+    assert indices is None and values.tolist() == [1.5]
+
+
+def test_matrix_get_set_many():
+    rng = np.random.default_rng(3)
+    A = matrix.matrix_new(lib.GrB_INT64, 50, 40)
+    matrix.matrix_build(
+        A, rng.integers(0, 50, 300), rng.integers(0, 40, 300), np.arange(300), lib.GrB_MAX_INT64
+    )
+    rows = rng.integers(0, 50, 1000)
+    cols = rng.integers(0, 40, 1000)
+    values, present = matrix.matrix_get_many(A, rows, cols, default=-1)
+    assert values.dtype == np.int64
+    value = ffi.new("int64_t*")
+    for i, j, v, p in zip(rows.tolist(), cols.tolist(), values.tolist(), present.tolist()):
+        info = lib.GrB_Matrix_extractElement_INT64(value, A[0], i, j)
+        assert p == (info == lib.GrB_SUCCESS)
+        assert v == (value[0] if p else -1)
+
+    # Matrices of maximal size and no positions
+    B = matrix.matrix_new(lib.GrB_FP32)
+    matrix.set_fp32(B, 1.5, 2**50, 7)
+    values, present = matrix.matrix_get_many(B, [2**50, 2**50, 3], [7, 8, 7])
+    assert values.tolist() == [1.5, 0.0, 0.0]
+    assert present.tolist() == [True, False, False]
+    values, present = matrix.matrix_get_many(B, [], [])
+    assert values.size == present.size == 0
+
+    matrix.matrix_set_many(A, rows[:10], cols[:10], np.arange(10) + 1000)
+    matrix.matrix_set_many(A, [0, 0], [0, 0], np.array([5, 6]))
+    values, present = matrix.matrix_get_many(A, rows[:10], cols[:10])
+    assert present.all()
+    # Repeated positions take their last value
+    expected = {}
+    for k, (i, j) in enumerate(zip(rows[:10].tolist(), cols[:10].tolist())):
+        expected[i, j] = k + 1000
+    assert values.tolist() == [expected[i, j] for i, j in zip(rows[:10], cols[:10])]
+    assert matrix.get_int64(A, 0, 0) == 6
+    nvals = matrix.matrix_nvals(A)
+    matrix.matrix_set_many(A, [49, 49], [39, 38], 7)
+    assert matrix.matrix_nvals(A) >= nvals
+    assert matrix.matrix_get_many(A, [49, 49], [39, 38])[0].tolist() == [7, 7]
+
+    # Many probes of a full row only look at the probed positions
+    H = matrix.matrix_new(lib.GrB_BOOL, 3, 100_000)
+    matrix.matrix_build_iso(H, np.zeros(100_000, np.int64), np.arange(100_000), True)
+    probes = np.tile([5, 99_999, 7], 100_000)
+    values, present = matrix.matrix_get_many(H, np.zeros(probes.size, np.int64), probes)
+    assert values.dtype == np.bool_ and values.all() and present.all()
+    values, present = matrix.matrix_get_many(H, [1, 0, 0], [5, 5, 5], default=False)
+    assert values.tolist() == present.tolist() == [False, True, True]
+
+    with pytest.raises(ValueError, match="same length"):
+        matrix.matrix_get_many(A, [0, 1], [0])
+    with pytest.raises(exceptions.IndexOutOfBound):
+        matrix.matrix_get_many(A, [50], [0])
+
+
+def test_matrix_iter_tuples():
+    rng = np.random.default_rng(4)
+    A = matrix.matrix_new(lib.GrB_INT16, 103, 40)
+    rows = rng.integers(0, 103, 500)
+    rows[rows // 10 == 5] = 0  # leave rows 50-59 empty
+    matrix.matrix_build(
+        A, rows, rng.integers(0, 40, 500), np.ones(500, np.int16), lib.GrB_PLUS_INT16
+    )
+    expected = [x.tolist() for x in matrix.matrix_extract_tuples_int16(A)]
+    for fmt in (lib.GxB_BY_ROW, lib.GxB_BY_COL):
+        matrix.matrix_set_format(A, fmt)
+        for block_rows in (1, 10, 103, 1000):
+            chunks = []
+            buffers = set()
+            for r, c, v in matrix.matrix_iter_tuples(A, block_rows=block_rows):
+                assert r.dtype == c.dtype == np.uint64 and v.dtype == np.int16
+                assert r.size and (r // block_rows == r[0] // block_rows).all()
+                buffers.add(v.base.ctypes.data)
+                chunks.append((r.tolist(), c.tolist(), v.tolist()))
+            assert [sum((chunk[k] for chunk in chunks), []) for k in range(3)] == expected
+            # Buffers are only replaced to grow
+            assert len(buffers) <= len(chunks)
+            if block_rows == 10:
+                assert len(chunks) == 10
+
+    (r, c, v), *rest = matrix.matrix_iter_tuples(A, dtype=np.float64)
+    assert not rest and v.dtype == np.float64 and v.tolist() == expected[2]
+    assert list(matrix.matrix_iter_tuples(matrix.matrix_new(lib.GrB_BOOL, 0, 3))) == []
+    with pytest.raises(ValueError, match="block_rows"):
+        next(matrix.matrix_iter_tuples(A, block_rows=0))
+    with pytest.raises(ValueError, match="dtype"):
+        next(matrix.matrix_iter_tuples(A, dtype=np.float16))
+
+
+def test_vector_dense_sparse():
+    x = np.arange(5, dtype=np.float64)
+    address = x.ctypes.data
+    v = vector.vector_from_dense(x, take_ownership=True)
+    assert x.size == 0
+    y = vector.vector_to_dense(v)
+    assert y.ctypes.data == address
+    assert y.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert vector.vector_nvals(v) == 0
+
+    # Arrays are copied by default, and stay usable after the vector is freed
+    x = np.arange(1e5)
+    v = vector.vector_from_dense(x)
+    vector.set_fp64(v, -1.0, 3)
+    assert x[3] == 3.0
+    del v
+    assert x.sum() == np.arange(1e5).sum()
+    indices, values = np.array([1, 3], np.int64), np.array([1.5, 2.5])
+    v = vector.vector_from_sparse(indices, values, 4)
+    del v
+    assert indices.tolist() == [1, 3] and values.tolist() == [1.5, 2.5]
+
+    # views are copied
+    v = vector.vector_from_dense(np.arange(10)[::2], take_ownership=True)
+    assert vector.vector_to_dense(v, copy=True).tolist() == [0, 2, 4, 6, 8]
+    assert vector.vector_nvals(v) == 5
+    assert vector.vector_to_dense(vector.vector_from_dense(np.empty(0, np.int8))).size == 0
+
+    w = vector.vector_new(lib.GrB_INT32, 3)
+    vector.set_int32(w, 1, 0)
+    with pytest.raises(ValueError, match="full"):
+        vector.vector_to_dense(w)
+    vector.vector_clear(w)
+    vector.vector_build_iso(w, [0, 1, 2], 4)
+    assert vector.vector_to_dense(w).tolist() == [4, 4, 4]
+    with pytest.raises(ValueError):
+        vector.vector_from_dense(np.zeros((2, 2)))
+
+    indices = np.array([1, 3, 6], np.int32)
+    values = np.array([1.5, 2.5, 3.5])
+    address = values.ctypes.data
+    v = vector.vector_from_sparse(indices, values, 8, take_ownership=True)
+    assert vector.vector_size(v) == 8
+    assert vector.get_fp64(v, 6) == 3.5
+    indices, values = vector.vector_to_sparse(v)
+    assert values.ctypes.data == address
+    assert indices.tolist() == [1, 3, 6]
+    assert values.tolist() == [1.5, 2.5, 3.5]
+    assert vector.vector_size(v) == 0
+
+    with pytest.raises(ValueError, match="same length"):
+        vector.vector_from_sparse([0, 1], np.array([1.0]), 3)
+    with pytest.raises(ValueError, match="less than 3"):
+        vector.vector_from_sparse([0, 3], np.ones(2), 3)
+    with pytest.raises(ValueError, match="less than 3"):
+        vector.vector_from_sparse(np.array([-1, 1], np.int64), np.ones(2), 3)
+    with pytest.raises(ValueError, match="sorted and unique"):
+        vector.vector_from_sparse([2, 0], np.ones(2), 3)
+    with pytest.raises(ValueError, match="sorted and unique"):
+        vector.vector_from_sparse([1, 1], np.ones(2), 3)
+    v = vector.vector_from_sparse([0, 2], np.ones(2), 3, trusted=True)
+    assert vector.vector_nvals(v) == 2
+    v = vector.vector_from_sparse([], np.empty(0, np.bool_), 3)
+    assert vector.vector_size(v) == 3
+    assert [a.size for a in vector.vector_to_sparse(v)] == [0, 0]
+
+    # Jumbled, full, bitmap and iso vectors are all returned as sorted entries
+    v = vector.vector_from_sparse(np.array([4, 0], np.uint64), np.array([1, 2]), 5, jumbled=True)
+    indices, values = vector.vector_to_sparse(v, copy=True)
+    assert indices.tolist() == [0, 4]
+    assert values.tolist() == [2, 1]
+    v = vector.vector_from_dense(np.array([7, 8, 9], np.uint16))
+    indices, values = vector.vector_to_sparse(v, copy=True)
+    assert indices.tolist() == [0, 1, 2]
+    assert values.dtype == np.uint16
+    vector.vector_option_set_int32(v, lib.GxB_SPARSITY_CONTROL, lib.GxB_BITMAP)
+    vector.vector_to_sparse(v)
+    assert vector.vector_option_get_int32(v, lib.GxB_SPARSITY_CONTROL) == lib.GxB_BITMAP
+    w = vector.vector_new(lib.GrB_INT64, 10)
+    vector.vector_build_iso(w, [2, 5], 3)
+    indices, values = vector.vector_to_sparse(w)
+    assert indices.tolist() == [2, 5]
+    assert values.tolist() == [3, 3]
+
+
+def test_matrix_bitmap():
+    values = np.arange(6, dtype=np.float64).reshape(2, 3)
+    present = np.array([[1, 0, 1], [0, 0, 1]], np.int8)
+    addresses = values.ctypes.data, present.ctypes.data
+    A = matrix.matrix_from_bitmap(values, present, take_ownership=True)
+    assert matrix.matrix_nvals(A) == 3
+    assert values.shape == present.shape == (0, 0)
+    assert matrix.get_fp64(A, 1, 2) == 5.0
+    assert matrix.matrix_sparsity_status(A) == lib.GxB_BITMAP
+    values, present = matrix.matrix_to_bitmap(A)
+    assert (values.ctypes.data, present.ctypes.data) == addresses
+    assert values.flags.c_contiguous and present.dtype == np.int8
+    assert present.tolist() == [[1, 0, 1], [0, 0, 1]]
+    assert values[present == 1].tolist() == [0.0, 2.0, 5.0]
+    assert matrix.matrix_nvals(A) == 0
+
+    # Fortran order, bool presence, and arrays in different layouts
+    values = np.asfortranarray([[1, 2], [3, 4]], np.int32)
+    A = matrix.matrix_from_bitmap(values, np.array([[True, False], [False, True]]))
+    assert matrix.matrix_format(A) == lib.GxB_BY_COL
+    with pytest.raises(ValueError, match="same shape"):
+        matrix.matrix_from_bitmap(np.ones((2, 2)), np.ones((2, 3), np.int8))
+    with pytest.raises(ValueError, match="0 or 1"):
+        matrix.matrix_from_bitmap(np.ones((2, 2)), np.full((2, 2), 2, np.int8))
+    values, present = matrix.matrix_to_bitmap(A, copy=True)
+    assert values.flags.f_contiguous
+    assert present.tolist() == [[1, 0], [0, 1]]
+    assert values[present == 1].tolist() == [1, 4]
+    assert matrix.matrix_nvals(A) == 2
+
+    # Sparse and iso matrices are converted
+    A = matrix.matrix_new(lib.GrB_UINT8, 3, 2)
+    matrix.matrix_build_iso(A, [2, 0], [1, 1], 7)
+    values, present = matrix.matrix_to_bitmap(A)
+    assert present.tolist() == [[0, 1], [0, 0], [0, 1]]
+    assert values.dtype == np.uint8 and values[present == 1].tolist() == [7, 7]
+    values, present = matrix.matrix_to_bitmap(matrix.matrix_new(lib.GrB_BOOL, 0, 4))
+    assert values.shape == present.shape == (0, 4)
+
+    # The arrays are copied by default, and stay usable after the matrix is freed
+    values = np.arange(1e4).reshape(100, 100)
+    present = values % 3 == 0
+    A = matrix.matrix_from_bitmap(values, present)
+    matrix.set_fp64(A, -1.0, 0, 3)
+    assert values[0, 3] == 3.0
+    del A
+    assert values.sum() == np.arange(1e4).sum() and present.sum() == 3334
+
+
+def test_compiled_accessors():
+    A = matrix.matrix_new(lib.GrB_FP64, 3, 4)
+    matrix.set_fp64(A, 2.5, 1, 2)
+    v = vector.vector_new(lib.GrB_FP64, 5)
+    vector.set_fp64(v, 1.5, 4)
+    cases = [
+        (matrix.matrix_nrows, (A,), 3),
+        (matrix.matrix_ncols, (A,), 4),
+        (matrix.matrix_nvals, (A,), 1),
+        (matrix.get_fp64, (A, 1, 2), 2.5),
+        (matrix.get_fp64, (A, 0, 0), 0.0),  # no entry
+        (vector.vector_size, (v,), 5),
+        (vector.vector_nvals, (v,), 1),
+        (vector.get_fp64, (v, 4), 1.5),
+    ]
+    for func, args, expected in cases:
+        # The Python version is the reference
+        assert func(*args) == func.__wrapped__(*args) == expected
+    assert matrix.matrix_shape(A) == (3, 4)
+    with pytest.raises(exceptions.InvalidIndex):
+        matrix.get_fp64(A, 3, 0)
+    with pytest.raises(exceptions.InvalidIndex):
+        vector.get_fp64(v, 5)
+    with pytest.raises(OverflowError):
+        vector.get_fp64(v, -1)
+    with pytest.raises(TypeError):
+        matrix.matrix_nvals(v)
+    with pytest.raises(TypeError):
+        vector.vector_nvals(A)
+
+
+def test_iter_rows_cols():
+    rng = np.random.default_rng(0)
+    nrows, ncols = 50, 40
+    rows = rng.integers(0, nrows, 300).astype(np.uint64)
+    cols = rng.integers(0, ncols, 300).astype(np.uint64)
+    A = matrix.matrix_new(lib.GrB_FP64, nrows, ncols)
+    matrix.matrix_build(A, rows, cols, rng.random(300), lib.GrB_PLUS_FP64)
+    dense = np.zeros((nrows, ncols))
+    present = np.zeros((nrows, ncols), bool)
+    for i, j, x in zip(*matrix.matrix_extract_tuples(A)):
+        dense[i, j] = x
+        present[i, j] = True
+
+    seen = []
+    for i, cols_i, vals in iterator.iter_rows(A):
+        seen.append(i)
+        assert cols_i.tolist() == np.flatnonzero(present[i]).tolist()
+        assert vals.tolist() == dense[i, present[i]].tolist()
+    assert seen == np.flatnonzero(present.any(1)).tolist()
+    seen = []
+    for j, rows_j, vals in iterator.iter_cols(A):
+        seen.append(j)
+        assert rows_j.tolist() == np.flatnonzero(present[:, j]).tolist()
+        assert vals.tolist() == dense[present[:, j], j].tolist()
+    assert seen == np.flatnonzero(present.any(0)).tolist()
+    # A is unchanged unless copy=False
+    assert matrix.matrix_nvals(A) == present.sum()
+    rows_iter = iterator.iter_rows(A, copy=False)
+    # The export happens before the first row is requested
+    assert matrix.matrix_nvals(A) == 0
+    assert sum(vals.size for _, _, vals in rows_iter) == present.sum()
+
+    assert list(iterator.iter_rows(matrix.matrix_new(lib.GrB_INT8, 5, 5))) == []
+    B = matrix.matrix_new(lib.GrB_INT8, 10**9, 10**9)
+    matrix.matrix_build_iso(B, [10**8, 5, 10**8], [3, 4, 2], 7)
+    result = [(i, c.tolist(), v.tolist()) for i, c, v in iterator.iter_rows(B)]
+    assert result == [(5, [4], [7]), (10**8, [2, 3], [7, 7])]
+
+
+def test_matrix_iterate_parallel():
+    rng = np.random.default_rng(1)
+    rows = 2 * rng.integers(0, 100, 1000).astype(np.uint64)  # odd rows are empty
+    cols = rng.integers(0, 300, 1000).astype(np.uint64)
+    A = matrix.matrix_new(lib.GrB_INT64, 200, 300)
+    matrix.matrix_build(A, rows, cols, np.arange(1000), lib.GrB_PLUS_INT64)
+    expected = list(zip(*matrix.matrix_extract_tuples(A)))
+
+    def entries(it, start, stop):
+        result = []
+        info = iterator.matrix_iterator_seek(it, start)
+        while info == lib.GrB_SUCCESS and iterator.matrix_iterator_getp(it) < stop:
+            i, j = iterator.matrix_iterator_get_index(it)
+            result.append((i, j, iterator.iterator_get_int64(it)))
+            info = iterator.matrix_iterator_next(it)
+        return result
+
+    def row_entries(it, start, stop):
+        result = []
+        info = iterator.row_iterator_kseek(it, start)
+        for _ in range(start, stop):
+            i = iterator.row_iterator_get_row_index(it)
+            while info == lib.GrB_SUCCESS:  # GrB_NO_VALUE for an empty row
+                j = iterator.row_iterator_get_col_index(it)
+                result.append((i, j, iterator.iterator_get_int64(it)))
+                info = iterator.row_iterator_next_col(it)
+            info = iterator.row_iterator_next_row(it)
+        return result
+
+    for sparsity in [lib.GxB_SPARSE, lib.GxB_HYPERSPARSE, lib.GxB_BITMAP]:
+        matrix.matrix_set_sparsity_control(A, sparsity)
+        for nparts in [1, 3, 8]:
+            parts = iterator.matrix_iterator_partition(A, nparts)
+            assert [start for _, start, _ in parts[1:]] == [stop for _, _, stop in parts[:-1]]
+            result = iterator.matrix_iterate_parallel(A, entries, nparts, max_workers=4)
+            assert len(result) == nparts
+            assert [x for part in result for x in part] == expected
+            if sparsity != lib.GxB_BITMAP:  # bitmap positions include missing entries
+                assert max(map(len, result)) - min(map(len, result)) <= 1
+            result = iterator.matrix_iterate_parallel(A, row_entries, nparts, rows=True)
+            assert [x for part in result for x in part] == expected
+
+    B = matrix.matrix_new(lib.GrB_INT64, 10, 10)
+    assert iterator.matrix_iterate_parallel(B, entries, 4) == []
+    matrix.set_int64(B, 1, 2, 3)
+    assert len(iterator.matrix_iterator_partition(B, 4)) == 1
+    with pytest.raises(ValueError):
+        iterator.matrix_iterator_partition(B, 0)
+
+
+def test_iterator_read():
+    rng = np.random.default_rng(2)
+    A = matrix.matrix_new(lib.GrB_FP64, 100, 80)
+    matrix.matrix_build(
+        A,
+        rng.integers(0, 100, 500).astype(np.uint64),
+        rng.integers(0, 80, 500).astype(np.uint64),
+        rng.random(500),
+        lib.GrB_PLUS_FP64,
+    )
+    expected = matrix.matrix_extract_tuples(A)
+    for sparsity in [lib.GxB_SPARSE, lib.GxB_BITMAP]:
+        matrix.matrix_set_sparsity_control(A, sparsity)
+        result = [[], [], []]
+        for it, start, stop in iterator.matrix_iterator_partition(A, 3):
+            iterator.matrix_iterator_seek(it, start)
+            for part, x in zip(result, iterator.matrix_iterator_read(it, A, stop)):
+                part.extend(x.tolist())
+            assert iterator.matrix_iterator_getp(it) >= stop
+        assert result == [x.tolist() for x in expected]
+
+    it = iterator.iterator_new()
+    iterator.matrix_iterator_attach(it, A)
+    iterator.matrix_iterator_seek(it, 0)
+    values = np.zeros(10**5)
+    rows, cols, vals = iterator.matrix_iterator_read(it, A, 10**9, out=(None, None, values))
+    assert rows is None and cols is None and vals.base is values
+    assert vals.tolist() == expected[2].tolist()
+    with pytest.raises(ValueError, match="itemsize"):
+        iterator.matrix_iterator_read(it, A, dtype=np.int32)
+    with pytest.raises(ValueError, match="at least"):
+        iterator.matrix_iterator_seek(it, 0)
+        iterator.matrix_iterator_read(it, A, out=(None, None, np.empty(3)))
+
+    # Complex values, and values read as raw bytes of another dtype
+    B = matrix.matrix_new(lib.GxB_FC32, 4, 4)
+    matrix.matrix_build(B, [1, 3], [0, 2], np.array([1 + 2j, 3j], np.complex64))
+    iterator.matrix_iterator_attach(it, B)
+    iterator.matrix_iterator_seek(it, 0)
+    _, _, vals = iterator.matrix_iterator_read(it, B)
+    assert vals.dtype == np.complex64 and vals.tolist() == [1 + 2j, 3j]
+    iterator.matrix_iterator_seek(it, 0)
+    _, _, vals = iterator.matrix_iterator_read(it, B, dtype=np.dtype((np.float32, 2)))
+    assert vals.tolist() == [[1, 2], [0, 3]]
+
+    # User-defined types into structured arrays
+    edge = np.dtype([("src", np.int32), ("weight", np.float64)], align=True)
+    T = grb_type.grb_type_new(edge.itemsize)
+    C = matrix.matrix_new(T[0], 5, 5)
+    entries = np.array([(4, 0.5), (7, 1.5)], edge)
+    for k, (i, j) in enumerate([(0, 4), (3, 1)]):
+        check_status(
+            C, lib.GrB_Matrix_setElement_UDT(C[0], ffi.from_buffer(entries[k : k + 1]), i, j)
+        )
+    iterator.matrix_iterator_attach(it, C)
+    iterator.matrix_iterator_seek(it, 0)
+    with pytest.raises(TypeError, match="dtype"):
+        iterator.matrix_iterator_read(it, C)
+    rows, cols, vals = iterator.matrix_iterator_read(it, C, dtype=edge)
+    assert rows.tolist() == [0, 3] and cols.tolist() == [4, 1]
+    assert vals.tolist() == entries.tolist()
+    iterator.matrix_iterator_seek(it, 0)
+    one = np.zeros(1, edge)
+    iterator.iterator_get_udt(it, one)
+    assert one.tolist() == entries[:1].tolist()
+
+    v = vector.vector_new(lib.GrB_INT64, 1000)
+    vector.vector_build(v, [900, 3, 40], np.array([1, 2, 3]))
+    iterator.vector_iterator_attach(it, v)
+    iterator.vector_iterator_seek(it, 0)
+    indices, vals = iterator.vector_iterator_read(it, v, 2)
+    assert indices.tolist() == [3, 40] and vals.tolist() == [2, 3]
+    indices, vals = iterator.vector_iterator_read(it, v)
+    assert indices.tolist() == [900] and vals.tolist() == [1]
+    indices, vals = iterator.vector_iterator_read(it, v)
+    assert indices.size == vals.size == 0
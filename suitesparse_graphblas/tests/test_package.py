@@ -1,3 +1,9 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
 import suitesparse_graphblas
 from suitesparse_graphblas import ffi, lib  # noqa: F401
 
@@ -12,3 +18,57 @@ def test_version():
     version = suitesparse_graphblas.__version__
     version = [int(x) for x in version.split("+")[0].split(".")]
     assert version > [9, 4, 4, 0]
+
+
+def test_lazy_submodules():
+    # Submodules are imported on first use, not by `import suitesparse_graphblas`
+    code = """
+import sys
+import suitesparse_graphblas as gb
+assert "suitesparse_graphblas.api.matrix" not in sys.modules
+assert "suitesparse_graphblas.api.io.binary" not in sys.modules
+assert "cffi" not in sys.modules
+assert "matrix" in dir(gb) and "matrix_new" in dir(gb.matrix)
+from suitesparse_graphblas import global_option_get_int32, matrix
+from suitesparse_graphblas.api import io
+from suitesparse_graphblas.io import binary
+assert matrix is gb.api.matrix and io.binary is binary
+assert "cffi" not in sys.modules
+assert binary.stdlib.malloc
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("module", ["vector", "io.serialize", "io.binary", "iterator"])
+def test_import_submodule_first(module):
+    # Any submodule can be the first one imported
+    code = f"""
+import suitesparse_graphblas.api.{module}
+from suitesparse_graphblas import matrix, vector
+assert matrix.serialize and vector.serialize and vector.vector_new
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lib_types_up_to_date():
+    # _lib_types.py must be regenerated with the headers
+    from suitesparse_graphblas import _lib_types
+
+    pytest.importorskip("pycparser")
+    from suitesparse_graphblas.create_headers import create_lib_types_text
+
+    thisdir = os.path.dirname(suitesparse_graphblas.__file__)
+    headers = []
+    for name in ("suitesparse_graphblas_no_complex.h", "suitesparse_graphblas.h"):
+        path = os.path.join(thisdir, name)
+        if not os.path.exists(path):
+            pytest.skip(f"{name} is not installed")
+        with open(path) as f:
+            headers.append(f.read().splitlines())
+    with open(_lib_types.__file__) as f:
+        assert f.read().splitlines() == create_lib_types_text(*headers)
+    # Names with complex types are only in lib when built with complex support
+    names = _lib_types.TYPE_REPRESENTATIVES
+    if not suitesparse_graphblas.supports_complex():
+        names = [line.strip(' ",') for line in create_lib_types_text(headers[0])[4:-1]]
+    assert all(hasattr(lib, name) for name in names)
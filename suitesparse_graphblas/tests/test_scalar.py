@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
-from suitesparse_graphblas import ffi, lib, supports_complex  # noqa: F401
+from suitesparse_graphblas import ffi, lib, scalar, supports_complex  # noqa: F401
+from suitesparse_graphblas.api import grb_type
 
 
 @pytest.mark.skipif("not supports_complex()")
@@ -10,3 +12,15 @@ def test_complex():
     assert lib.GrB_Scalar_new(s, lib.GxB_FC64) == success
     assert lib.GxB_Scalar_setElement_FC64(s[0], 1j) == success
     assert lib.GrB_Scalar_free(s) == success
+
+
+def test_scalar_from_value_udt():
+    T = grb_type.grb_type_new(16)
+    value = np.array([(0.5, 2.0)], [("a", np.float64), ("b", np.float64)])
+    s = scalar.scalar_from_value(T[0], value)
+    out = np.zeros_like(value)
+    assert lib.GrB_Scalar_extractElement_UDT(ffi.from_buffer(out), s[0]) == lib.GrB_SUCCESS
+    assert out.tolist() == value.tolist()
+    for bad in (np.float64(1.0), np.zeros(3)):
+        with pytest.raises(ValueError, match="must have 16 bytes"):
+            scalar.scalar_from_value(T[0], bad)
@@ -29,6 +29,21 @@ ctypedef uint64_t (*GxB_init)(
     void (*user_free_function)(void *),
 )
 
+# Opaque GraphBLAS objects and the signatures of the functions behind the
+# compiled accessors (see `init_accessors`)
+ctypedef void *GrB_Matrix
+ctypedef void *GrB_Vector
+ctypedef uint64_t GrB_Index
+ctypedef int (*GrB_Matrix_size)(GrB_Index *, GrB_Matrix)
+ctypedef int (*GrB_Vector_size)(GrB_Index *, GrB_Vector)
+ctypedef int (*GrB_Matrix_extractElement_FP64)(double *, GrB_Matrix, GrB_Index, GrB_Index)
+ctypedef int (*GrB_Vector_extractElement_FP64)(double *, GrB_Vector, GrB_Index)
+ctypedef void *GxB_Iterator
+ctypedef GrB_Index (*GxB_Iterator_position)(GxB_Iterator) noexcept nogil
+ctypedef int (*GxB_Iterator_next)(GxB_Iterator) noexcept nogil
+ctypedef void (*GxB_Iterator_get_UDT)(GxB_Iterator, void *) noexcept nogil
+ctypedef void (*GxB_Matrix_Iterator_getIndex)(GxB_Iterator, GrB_Index *, GrB_Index *) noexcept nogil
+
 cpdef int call_gxb_init(object ffi, object lib, int mode)
 
 cpdef ndarray claim_buffer(object ffi, object cdata, size_t size, dtype_t dtype)
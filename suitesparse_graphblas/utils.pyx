@@ -7,9 +7,22 @@
 import numpy as np
 from cpython.ref cimport Py_INCREF
 from libc.stdint cimport uintptr_t
-from numpy cimport NPY_ARRAY_F_CONTIGUOUS, NPY_ARRAY_OWNDATA, NPY_ARRAY_WRITEABLE
+from numpy cimport (
+    NPY_ARRAY_C_CONTIGUOUS,
+    NPY_ARRAY_F_CONTIGUOUS,
+    NPY_ARRAY_OWNDATA,
+    NPY_ARRAY_WRITEABLE,
+)
 from numpy cimport dtype as dtype_t
-from numpy cimport import_array, ndarray, npy_intp
+from numpy cimport (
+    PyArray_DATA,
+    PyArray_DIMS,
+    PyArray_NDIM,
+    PyArray_UpdateFlags,
+    import_array,
+    ndarray,
+    npy_intp,
+)
 
 import_array()
 
@@ -30,6 +43,234 @@ cpdef int call_gxb_init(object ffi, object lib, int mode):
     return func(<GrB_Mode>mode, PyDataMem_NEW, PyDataMem_NEW_ZEROED, PyDataMem_RENEW, PyDataMem_FREE)
 
 
+cdef uintptr_t _address(object ffi, object lib, str name):
+    # Steps 1 to 3 of `call_gxb_init`
+    return int(ffi.cast("uintptr_t", ffi.addressof(lib, name)))
+
+
+# Compiled versions of the hottest accessors in `suitesparse_graphblas.api`.
+# A cffi call costs an `ffi.new` for the output, the call itself and
+# `check_status`; these call the C functions through addresses obtained from
+# cffi once, in `init_accessors`, and only call `check_status` on failure.
+cdef:
+    object _ffi = None
+    object _check_status
+    object _matrix_ptr
+    object _vector_ptr
+    GrB_Matrix_size _GrB_Matrix_nrows
+    GrB_Matrix_size _GrB_Matrix_ncols
+    GrB_Matrix_size _GrB_Matrix_nvals
+    GrB_Vector_size _GrB_Vector_size
+    GrB_Vector_size _GrB_Vector_nvals
+    GrB_Matrix_extractElement_FP64 _GrB_Matrix_extractElement_FP64
+    GrB_Vector_extractElement_FP64 _GrB_Vector_extractElement_FP64
+    object _iterator_ptr
+    GxB_Iterator_position _GxB_Matrix_Iterator_getp
+    GxB_Iterator_position _GxB_Matrix_Iterator_getpmax
+    GxB_Iterator_next _GxB_Matrix_Iterator_next
+    GxB_Matrix_Iterator_getIndex _GxB_Matrix_Iterator_getIndex
+    GxB_Iterator_position _GxB_Vector_Iterator_getp
+    GxB_Iterator_position _GxB_Vector_Iterator_getpmax
+    GxB_Iterator_next _GxB_Vector_Iterator_next
+    GxB_Iterator_position _GxB_Vector_Iterator_getIndex
+    GxB_Iterator_get_UDT _GxB_Iterator_get_UDT
+
+
+cpdef init_accessors(object ffi, object lib, object check_status):
+    """Get the addresses of the GraphBLAS functions used by the compiled accessors."""
+    global _ffi, _check_status, _matrix_ptr, _vector_ptr
+    global _GrB_Matrix_nrows, _GrB_Matrix_ncols, _GrB_Matrix_nvals
+    global _GrB_Vector_size, _GrB_Vector_nvals
+    global _GrB_Matrix_extractElement_FP64, _GrB_Vector_extractElement_FP64
+    global _iterator_ptr, _GxB_Iterator_get_UDT
+    global _GxB_Matrix_Iterator_getp, _GxB_Matrix_Iterator_getpmax
+    global _GxB_Matrix_Iterator_next, _GxB_Matrix_Iterator_getIndex
+    global _GxB_Vector_Iterator_getp, _GxB_Vector_Iterator_getpmax
+    global _GxB_Vector_Iterator_next, _GxB_Vector_Iterator_getIndex
+    _GrB_Matrix_nrows = <GrB_Matrix_size>_address(ffi, lib, "GrB_Matrix_nrows")
+    _GrB_Matrix_ncols = <GrB_Matrix_size>_address(ffi, lib, "GrB_Matrix_ncols")
+    _GrB_Matrix_nvals = <GrB_Matrix_size>_address(ffi, lib, "GrB_Matrix_nvals")
+    _GrB_Vector_size = <GrB_Vector_size>_address(ffi, lib, "GrB_Vector_size")
+    _GrB_Vector_nvals = <GrB_Vector_size>_address(ffi, lib, "GrB_Vector_nvals")
+    _GrB_Matrix_extractElement_FP64 = <GrB_Matrix_extractElement_FP64>_address(
+        ffi, lib, "GrB_Matrix_extractElement_FP64"
+    )
+    _GrB_Vector_extractElement_FP64 = <GrB_Vector_extractElement_FP64>_address(
+        ffi, lib, "GrB_Vector_extractElement_FP64"
+    )
+    _GxB_Matrix_Iterator_getp = <GxB_Iterator_position>_address(
+        ffi, lib, "GxB_Matrix_Iterator_getp"
+    )
+    _GxB_Matrix_Iterator_getpmax = <GxB_Iterator_position>_address(
+        ffi, lib, "GxB_Matrix_Iterator_getpmax"
+    )
+    _GxB_Matrix_Iterator_next = <GxB_Iterator_next>_address(ffi, lib, "GxB_Matrix_Iterator_next")
+    _GxB_Matrix_Iterator_getIndex = <GxB_Matrix_Iterator_getIndex>_address(
+        ffi, lib, "GxB_Matrix_Iterator_getIndex"
+    )
+    _GxB_Vector_Iterator_getp = <GxB_Iterator_position>_address(
+        ffi, lib, "GxB_Vector_Iterator_getp"
+    )
+    _GxB_Vector_Iterator_getpmax = <GxB_Iterator_position>_address(
+        ffi, lib, "GxB_Vector_Iterator_getpmax"
+    )
+    _GxB_Vector_Iterator_next = <GxB_Iterator_next>_address(ffi, lib, "GxB_Vector_Iterator_next")
+    _GxB_Vector_Iterator_getIndex = <GxB_Iterator_position>_address(
+        ffi, lib, "GxB_Vector_Iterator_getIndex"
+    )
+    _GxB_Iterator_get_UDT = <GxB_Iterator_get_UDT>_address(ffi, lib, "GxB_Iterator_get_UDT")
+    _check_status = check_status
+    _iterator_ptr = ffi.typeof("GxB_Iterator*")
+    _matrix_ptr = ffi.typeof("GrB_Matrix*")
+    _vector_ptr = ffi.typeof("GrB_Vector*")
+    _ffi = ffi
+
+
+cdef GrB_Matrix _matrix(object A) except? NULL:
+    # `A[0]` of a `GrB_Matrix*`, checking the type as cffi does
+    if _ffi is None:
+        raise RuntimeError("init_accessors has not been called")
+    if _ffi.typeof(A) is not _matrix_ptr:
+        raise TypeError(f"Expected GrB_Matrix*; got {A!r}")
+    return (<GrB_Matrix *><uintptr_t>int(_ffi.cast("uintptr_t", A)))[0]
+
+
+cdef GrB_Vector _vector(object v) except? NULL:
+    # `v[0]` of a `GrB_Vector*`, checking the type as cffi does
+    if _ffi is None:
+        raise RuntimeError("init_accessors has not been called")
+    if _ffi.typeof(v) is not _vector_ptr:
+        raise TypeError(f"Expected GrB_Vector*; got {v!r}")
+    return (<GrB_Vector *><uintptr_t>int(_ffi.cast("uintptr_t", v)))[0]
+
+
+def matrix_nrows(A):
+    cdef GrB_Index n = 0
+    cdef int info = _GrB_Matrix_nrows(&n, _matrix(A))
+    if info != 0:
+        _check_status(A, info)
+    return n
+
+
+def matrix_ncols(A):
+    cdef GrB_Index n = 0
+    cdef int info = _GrB_Matrix_ncols(&n, _matrix(A))
+    if info != 0:
+        _check_status(A, info)
+    return n
+
+
+def matrix_nvals(A):
+    cdef GrB_Index n = 0
+    cdef int info = _GrB_Matrix_nvals(&n, _matrix(A))
+    if info != 0:
+        _check_status(A, info)
+    return n
+
+
+def matrix_get_fp64(A, GrB_Index i, GrB_Index j):
+    cdef double value = 0
+    cdef int info = _GrB_Matrix_extractElement_FP64(&value, _matrix(A), i, j)
+    if info != 0:
+        _check_status(A, info)
+    return value
+
+
+def vector_size(v):
+    cdef GrB_Index n = 0
+    cdef int info = _GrB_Vector_size(&n, _vector(v))
+    if info != 0:
+        _check_status(v, info)
+    return n
+
+
+def vector_nvals(v):
+    cdef GrB_Index n = 0
+    cdef int info = _GrB_Vector_nvals(&n, _vector(v))
+    if info != 0:
+        _check_status(v, info)
+    return n
+
+
+def vector_get_fp64(v, GrB_Index i):
+    cdef double value = 0
+    cdef int info = _GrB_Vector_extractElement_FP64(&value, _vector(v), i)
+    if info != 0:
+        _check_status(v, info)
+    return value
+
+
+cdef GxB_Iterator _iterator(object it) except? NULL:
+    # `it[0]` of a `GxB_Iterator*`, checking the type as cffi does
+    if _ffi is None:
+        raise RuntimeError("init_accessors has not been called")
+    if _ffi.typeof(it) is not _iterator_ptr:
+        raise TypeError(f"Expected GxB_Iterator*; got {it!r}")
+    return (<GxB_Iterator *><uintptr_t>int(_ffi.cast("uintptr_t", it)))[0]
+
+
+cdef char *_data(ndarray array):
+    return NULL if array is None else <char *>PyArray_DATA(array)
+
+
+def matrix_iterator_read(
+    it, GrB_Index stop, ndarray rows, ndarray cols, ndarray values, size_t value_size
+):
+    """Copy the entries of a matrix entry iterator up to position `stop` into arrays.
+
+    Reads from the current position while it is less than `stop`, leaving
+    the iterator at the next entry.  The indices go into the uint64 arrays
+    `rows` and `cols` and the values of `value_size` bytes each into
+    `values`; any of them may be None.  The arrays must be contiguous with
+    room for `stop - getp` elements.  Returns the number of entries read.
+    """
+    cdef:
+        GxB_Iterator h = _iterator(it)
+        char *I = _data(rows)
+        char *J = _data(cols)
+        char *X = _data(values)
+        GrB_Index n = 0
+        GrB_Index i, j
+    with nogil:
+        stop = min(stop, _GxB_Matrix_Iterator_getpmax(h))
+        while _GxB_Matrix_Iterator_getp(h) < stop:
+            if I != NULL or J != NULL:
+                _GxB_Matrix_Iterator_getIndex(h, &i, &j)
+                if I != NULL:
+                    (<GrB_Index *>I)[n] = i
+                if J != NULL:
+                    (<GrB_Index *>J)[n] = j
+            if X != NULL:
+                _GxB_Iterator_get_UDT(h, X + n * value_size)
+            n += 1
+            if _GxB_Matrix_Iterator_next(h) != 0:
+                break
+    return n
+
+
+def vector_iterator_read(it, GrB_Index stop, ndarray indices, ndarray values, size_t value_size):
+    """Copy the entries of a vector iterator up to position `stop` into arrays.
+
+    See `matrix_iterator_read`.
+    """
+    cdef:
+        GxB_Iterator h = _iterator(it)
+        char *I = _data(indices)
+        char *X = _data(values)
+        GrB_Index n = 0
+    with nogil:
+        stop = min(stop, _GxB_Vector_Iterator_getpmax(h))
+        while _GxB_Vector_Iterator_getp(h) < stop:
+            if I != NULL:
+                (<GrB_Index *>I)[n] = _GxB_Vector_Iterator_getIndex(h)
+            if X != NULL:
+                _GxB_Iterator_get_UDT(h, X + n * value_size)
+            n += 1
+            if _GxB_Vector_Iterator_next(h) != 0:
+                break
+    return n
+
+
 cpdef ndarray claim_buffer(object ffi, object cdata, size_t size, dtype_t dtype):
     cdef:
         npy_intp dims = size
@@ -79,3 +320,14 @@ cpdef ndarray claim_buffer_2d(
 
 cpdef unclaim_buffer(ndarray array):
     PyArray_CLEARFLAGS(array, NPY_ARRAY_OWNDATA | NPY_ARRAY_WRITEABLE)
+
+
+cpdef detach_buffer(ndarray array):
+    # Like `unclaim_buffer`, but also make `array` empty (every dimension 0)
+    # so that it never reads or writes the memory it no longer owns.
+    cdef int k
+    cdef npy_intp *dims = PyArray_DIMS(array)
+    PyArray_CLEARFLAGS(array, NPY_ARRAY_OWNDATA | NPY_ARRAY_WRITEABLE)
+    for k in range(PyArray_NDIM(array)):
+        dims[k] = 0
+    PyArray_UpdateFlags(array, NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_F_CONTIGUOUS)